@@ -0,0 +1,269 @@
+"""
+Benchmark of the Generator pipeline.
+
+Synthetic layouts from 10 to 10,000 widgets are generated and each phase of the pipeline is timed separately
+with `tksugar.GeneratorStats`.
+The results are written to a JSON file, and can be compared with a stored baseline.
+
+```
+python benchmarks/bench_generator.py --output baseline.json
+python benchmarks/bench_generator.py --compare baseline.json
+```
+
+Creating widgets requires a display. On a headless Linux box, run the benchmark under Xvfb:
+
+```
+xvfb-run -a python benchmarks/bench_generator.py
+```
+
+or measure only the phases that do not create widgets with `--no-build`,
+or create the widgets of `tksugar.headless` with `--headless` to measure the cost of TkSugar apart from Tk.
+"""
+import argparse
+import datetime
+import json
+import platform
+import shutil
+import sys
+import tempfile
+import tkinter
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+import tksugar
+from tksugar import headless
+from tksugar.generator import Generator
+from tksugar.stats import GeneratorStats
+
+PHASES = ["load", "localize", "scan", "resolve", "instantiate", "postactions", "total"]
+SIZES = [10, 100, 1000, 10000]
+
+#region layout writers
+
+def write_flat(directory, size):
+  """
+  All widgets are children of one frame.
+  """
+  lines = [
+    "_Tk:",
+    "  title: flat",
+    "  _Frame:",
+    "    grid:",
+    "    ::children:",
+  ]
+  for i in range(size):
+    lines += [
+      "      - _Label:",
+      f"          text: Label {i}",
+      f"          grid: {{row: {i // 10}, column: {i % 10}}}",
+    ]
+  return write(directory, "flat.yml", lines), ""
+
+def write_deep(directory, size, depth=25):
+  """
+  The widgets are nested in chains of frames.
+  """
+  lines = [
+    "_Tk:",
+    "  title: deep",
+    "  ::children:",
+  ]
+  for unused in range(max(1, size // depth)):
+    indent = "    - "
+    for d in range(depth - 1):
+      lines += [
+        f"{indent}_Frame:",
+        f"{' ' * len(indent)}  pack:",
+      ]
+      indent = " " * len(indent) + "  "
+    lines += [
+      f"{indent}_Label:",
+      f"{' ' * len(indent)}  text: Leaf",
+      f"{' ' * len(indent)}  pack:",
+    ]
+  return write(directory, "deep.yml", lines), ""
+
+def write_params(directory, size, group=50):
+  """
+  The widgets inherit many parameters through `::params`.
+  """
+  lines = [
+    "_Tk:",
+    "  title: params",
+    "  ::children:",
+    "    - ::params:",
+    "        background: white",
+    "        relief: flat",
+    "        borderwidth: 1",
+    "        pack:",
+  ]
+  for g in range(max(1, size // group)):
+    lines += [
+      "    - _Frame:",
+      "        ::children:",
+      "          - ::params:",
+      "              foreground: black",
+      "              anchor: w",
+      "              padx: 2",
+      "              pady: 2",
+      "              width: 10",
+      "              justify: left",
+      "              wraplength: 100",
+    ]
+    for i in range(min(group, size) - 1):
+      lines += [
+        "          - _Label:",
+        f"              text: Label {g}-{i}",
+      ]
+  return write(directory, "params.yml", lines), ""
+
+def write_include(directory, size):
+  """
+  The parameters of all widgets are included from a fragment file.
+  """
+  write(directory, "fragment.yml", [
+    "text: Included",
+    "anchor: w",
+    "pack:",
+  ])
+  lines = [
+    "_Tk:",
+    "  title: include",
+    "  ::children:",
+  ]
+  for unused in range(size):
+    lines.append("    - _Label: !include fragment.yml")
+  return write(directory, "include.yml", lines), ""
+
+def write_localized(directory, size):
+  """
+  The texts of all widgets are localized.
+  """
+  lines = [
+    "_Tk:",
+    "  title: :::title",
+    "  ::children:",
+  ]
+  for i in range(size):
+    lines += [
+      "    - _Label:",
+      f"        text: :::labels.label{i}",
+      "        pack:",
+    ]
+  dictionary = [
+    "title: Localized",
+    "labels:",
+  ] + [f"  label{i}: Translated {i}" for i in range(size)]
+  return write(directory, "localized.yml", lines), write(directory, "localized_dict.yml", dictionary)
+
+def write(directory, name, lines):
+  path = Path(directory) / name
+  with open(path, "w", encoding="UTF-8") as f:
+    f.write("\n".join(lines) + "\n")
+  return str(path)
+
+LAYOUTS = {
+  "flat": write_flat,
+  "deep": write_deep,
+  "params": write_params,
+  "include": write_include,
+  "localized": write_localized,
+}
+
+#endregion
+
+def measure(file, localization_file, build, modules):
+  """
+  Run the pipeline once and return the time of each phase.
+  """
+  gen = Generator(file, modules=list(modules), localization_file=localization_file)
+  stats = GeneratorStats(sources=False)
+  if build:
+    window = gen.generate(stats=stats)
+  else:
+    gen._prepare(stats=stats)
+    stats.phases["total"] = sum(stats.phases.values())
+  times = {p: stats.phases.get(p, 0.0) for p in PHASES}
+  # The time of the post actions is included in the time of the instantiation.
+  times["instantiate"] -= times["postactions"]
+  if build:
+    window.destroy()
+    tkinter._default_root = None
+    headless._default_root = None
+  return times
+
+def run(layouts, sizes, repeat, build, modules=["tksugar.widgets", "tkinter"]):
+  """
+  Run the benchmark and return the results.
+  """
+  results = []
+  directory = tempfile.mkdtemp()
+  try:
+    for layout in layouts:
+      for size in sizes:
+        file, localization_file = LAYOUTS[layout](directory, size)
+        best = None
+        for unused in range(repeat):
+          times = measure(file, localization_file, build, modules)
+          best = times if best is None else {p: min(best[p], times[p]) for p in PHASES}
+        results.append({"layout": layout, "size": size, "phases": best})
+        print(f"{layout:>10} {size:>6}  " + "  ".join(f"{p} {best[p] * 1000:9.2f}ms" for p in PHASES), flush=True)
+  finally:
+    shutil.rmtree(directory)
+  return {
+    "meta": {
+      "tksugar": tksugar.__version__,
+      "python": platform.python_version(),
+      "platform": platform.platform(),
+      "date": datetime.datetime.now().isoformat(timespec="seconds"),
+      "repeat": repeat,
+      "build": build,
+      "modules": modules,
+    },
+    "results": results,
+  }
+
+def compare(current, baseline, threshold):
+  """
+  Print the ratio of the current results to the baseline.
+
+  Returns
+  ----
+  regressed: bool
+    True if the total time of any layout exceeds the baseline by the threshold.
+  """
+  base = {(r["layout"], r["size"]): r["phases"] for r in baseline["results"]}
+  regressed = False
+  print(f"{'layout':>10} {'size':>6}  " + "  ".join(f"{p:>11}" for p in PHASES))
+  for r in current["results"]:
+    b = base.get((r["layout"], r["size"]))
+    if b is None:
+      continue
+    ratios = [r["phases"][p] / b[p] if b.get(p) else float("nan") for p in PHASES]
+    print(f"{r['layout']:>10} {r['size']:>6}  " + "  ".join(f"{x:>10.2f}x" for x in ratios))
+    if ratios[-1] > threshold:
+      regressed = True
+  return regressed
+
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser(description="Benchmark of the Generator pipeline.")
+  parser.add_argument("--layouts", nargs="+", choices=list(LAYOUTS), default=list(LAYOUTS), help="layouts to measure")
+  parser.add_argument("--sizes", nargs="+", type=int, default=SIZES, help="numbers of widgets")
+  parser.add_argument("--repeat", type=int, default=3, help="number of runs; the fastest run is reported")
+  parser.add_argument("--output", default="bench_output.json", help="file to write the results to")
+  parser.add_argument("--compare", metavar="BASELINE", help="baseline results to compare with")
+  parser.add_argument("--threshold", type=float, default=1.2, help="total time ratio that is treated as a regression")
+  parser.add_argument("--no-build", dest="build", action="store_false", help="do not create widgets (no display required)")
+  parser.add_argument("--headless", action="store_true", help="create the widgets of tksugar.headless (no display required)")
+  args = parser.parse_args()
+  try:
+    current = run(args.layouts, args.sizes, args.repeat, args.build, headless.MODULES if args.headless else ["tksugar.widgets", "tkinter"])
+  except tkinter.TclError as e:
+    sys.exit(f"{e}\nRun the benchmark under Xvfb (xvfb-run -a python {sys.argv[0]}) or with --no-build.")
+  with open(args.output, "w", encoding="UTF-8") as f:
+    json.dump(current, f, indent=2)
+  if args.compare:
+    with open(args.compare, "r", encoding="UTF-8") as f:
+      baseline = json.load(f)
+    if compare(current, baseline, args.threshold):
+      sys.exit(1)
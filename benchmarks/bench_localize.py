@@ -0,0 +1,111 @@
+"""
+Benchmark of the localization of the layout.
+
+The layout is scanned into a tree after translating it with a separate walk that applies the regular expression
+to every string (legacy), after translating it with `Localizer#localize()` (separate)
+and with the translation fused into the scan (`Generator._scantree()` with a localizer, fused),
+without a localization file and with a localization file in which a part of the strings are translated.
+No display is required.
+
+```
+python benchmarks/bench_localize.py --sizes 1000 10000 --ratio 0.1
+```
+"""
+import argparse
+import re
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from tksugar.generator import Generator
+from tksugar.localizer import Localizer
+
+SIZES = [100, 1000, 10000]
+
+def write_layout(directory, size, ratio):
+  """
+  Write a flat layout in which `ratio` of the labels are localized, and its localization file.
+  """
+  step = max(1, round(1 / ratio)) if ratio > 0 else size + 1
+  lines = [
+    "_Tk:",
+    "  title: localize",
+    "  ::children:",
+  ]
+  dictionary = ["labels:"]
+  for i in range(size):
+    text = f":::labels.label{i}" if i % step == 0 else f"Label {i}"
+    lines += [
+      "    - _Label:",
+      f"        text: {text}",
+      "        font: [Helvetica, 10]",
+      f"        grid: {{row: {i}, column: 0, sticky: w}}",
+    ]
+    if i % step == 0:
+      dictionary.append(f"  label{i}: Translated {i}")
+  layout = Path(directory) / "layout.yml"
+  layout.write_text("\n".join(lines) + "\n", encoding="UTF-8")
+  script = Path(directory) / "script.yml"
+  script.write_text("\n".join(dictionary) + "\n", encoding="UTF-8")
+  return str(layout), str(script)
+
+def legacy(gen, localization_file):
+  """
+  Translate the layout with a separate walk that applies the regular expression to every string, then scan it.
+  """
+  def translate_core(data):
+    for k in data.keys() if type(data) is dict else range(len(data)):
+      if type(data[k]) is dict or type(data[k]) is list:
+        translate_core(data[k])
+      elif type(data[k]) is str:
+        data[k] = rexp.sub(lambda m: l._translate(m.group(0)[3:]), data[k])
+  struct = gen.loader_class(gen.string).get_single_data()
+  start = time.perf_counter()
+  rexp = re.compile(r":::\S+")
+  l = Localizer(localization_file)
+  translate_core(struct)
+  gen._scantree(struct)
+  return time.perf_counter() - start
+
+def separate(gen, localization_file):
+  """
+  Translate the layout with a separate walk, then scan it.
+  """
+  struct = gen.loader_class(gen.string).get_single_data()
+  start = time.perf_counter()
+  Localizer(localization_file).localize(struct)
+  gen._scantree(struct)
+  return time.perf_counter() - start
+
+def fused(gen, localization_file):
+  """
+  Translate the layout while scanning it.
+  """
+  struct = gen.loader_class(gen.string).get_single_data()
+  start = time.perf_counter()
+  gen._scantree(struct, localizer=Localizer(localization_file))
+  return time.perf_counter() - start
+
+def run(sizes, ratio, repeat):
+  directory = tempfile.mkdtemp()
+  try:
+    print(f"{'size':>6} {'dictionary':>10}  {'legacy':>11}  {'separate':>11}  {'fused':>11}  fused/legacy")
+    for size in sizes:
+      layout, script = write_layout(directory, size, ratio)
+      gen = Generator(layout)
+      for localization_file in ["", script]:
+        times = [min(f(gen, localization_file) for unused in range(repeat)) for f in [legacy, separate, fused]]
+        print(f"{size:>6} {'yes' if localization_file else 'no':>10}  " + "  ".join(f"{t * 1000:9.2f}ms" for t in times) + f"  {times[2] / times[0]:11.2f}x", flush=True)
+  finally:
+    shutil.rmtree(directory)
+
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser(description="Benchmark of the localization of the layout.")
+  parser.add_argument("--sizes", nargs="+", type=int, default=SIZES, help="numbers of widgets")
+  parser.add_argument("--ratio", type=float, default=0.1, help="ratio of the localized labels")
+  parser.add_argument("--repeat", type=int, default=5, help="number of runs; the fastest run is reported")
+  args = parser.parse_args()
+  run(args.sizes, args.ratio, args.repeat)
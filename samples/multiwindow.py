@@ -2,13 +2,13 @@ import sys
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
-from tksugar import Generator
+from tksugar import Generator, LayoutTemplate
 
 count = 1
 
 def button(button, tag):
   global count
-  child = Generator(r"samples\yml\multiwindow_child.yml").get_manager()
+  child = template.instantiate(master=owner.window)
   ordinal = lambda n: "%d%s" % (n,"tsnrhtdd"[(n // 10 % 10 != 1) * (n % 10 < 4) * n % 10::4]) # https://stackoverflow.com/questions/9647202/ordinal-numbers-replacement
   child.widgets["label"].widget["text"] = f"This is {ordinal(count)} Child Window"
   if owner.vars["modal"].get():
@@ -16,6 +16,7 @@ def button(button, tag):
   count += 1
 
 if __name__ == "__main__":
+  template = LayoutTemplate(r"samples\yml\multiwindow_child.yml")
   gen = Generator(r"samples\yml\multiwindow_owner.yml")
   owner = gen.get_manager(commandhandler=button)
-  owner.mainloop()
\ No newline at end of file
+  owner.mainloop()
@@ -0,0 +1,115 @@
+import json
+import os
+import tempfile
+import tkinter
+import tkinter.ttk
+import unittest
+
+from tksugar import argtable
+from tksugar.generator import Generator
+
+class Test_ArgTable(unittest.TestCase):
+  """
+  Tests the `tksugar.argtable` module.
+  """
+
+  def setUp(self):
+    fd, self.path = tempfile.mkstemp(suffix=".json")
+    os.close(fd)
+
+  def tearDown(self):
+    os.remove(self.path)
+
+  #region Testing for normal operation
+
+  def test_memoize(self):
+    """
+    Confirm that the same argument list is returned
+    when `Generator#_get_argnames()` is called repeatedly under the following conditions.
+    * The same method is specified.
+    """
+    self.assertIs(Generator._get_argnames(tkinter.Label.__init__), Generator._get_argnames(tkinter.Label.__init__))
+
+  def test_build(self):
+    """
+    Confirm that the argument table contains the stock widget classes
+    and matches the argument lists collected from the document comments
+    when `argtable.build()` is called.
+    """
+    table = argtable.build()
+    self.assertEqual(table[argtable.make_key(tkinter.Button.__init__)], argtable.parse_argnames(tkinter.Button.__init__))
+    self.assertEqual(table[argtable.make_key(tkinter.ttk.Notebook.__init__)], argtable.parse_argnames(tkinter.ttk.Notebook.__init__))
+
+  def test_save_load(self):
+    """
+    Confirm that the saved argument table can be read
+    when `argtable.load()` is called under the following conditions.
+    * The table was saved by `argtable.save()`.
+    """
+    argtable.save(self.path)
+    table = argtable.load(self.path)
+    self.assertIn("text", table[argtable.make_key(tkinter.Label.__init__)])
+
+  def test_save_merge(self):
+    """
+    Confirm that the entries already saved in the file are kept
+    when `argtable.save()` is called under the following conditions.
+    * The file contains entries of another Python version.
+    """
+    with open(self.path, "w") as f:
+      json.dump({"table": {"tkinter.Label.__init__:0000000000000000": ["self"]}}, f)
+    argtable.save(self.path)
+    table = argtable.load(self.path)
+    self.assertEqual(table["tkinter.Label.__init__:0000000000000000"], ["self"])
+    self.assertIn(argtable.make_key(tkinter.Label.__init__), table)
+
+  def test_prebuilt(self):
+    """
+    Confirm that the argument table shipped with the package contains the running Python version's entries
+    when `argtable.load()` is called under the following conditions.
+    * The default file is specified.
+    """
+    table = argtable.load()
+    for key, args in argtable.build().items():
+      with self.subTest(key=key):
+        self.assertEqual(table.get(key), args)
+
+  #endregion
+
+  #region Semi-normal behavior testing
+
+  def test_load_other_version(self):
+    """
+    Confirm that the argument list is collected from the document comment
+    when `argtable.get_argnames()` is called under the following conditions.
+    * The table only contains an entry created from another document comment.
+    """
+    def method(self, master=None, cnf={}, **kw):
+      """
+      STANDARD OPTIONS
+
+        text
+
+      """
+    with open(self.path, "w") as f:
+      json.dump({"table": {f"{method.__module__}.{method.__qualname__}:0000000000000000": []}}, f)
+    argtable._prebuilt = argtable.load(self.path)
+    try:
+      self.assertIsNone(argtable._prebuilt.get(argtable.make_key(method)))
+      self.assertEqual(argtable.get_argnames(method), ["self", "master", "cnf", "text"])
+    finally:
+      argtable._prebuilt = None
+      argtable._table.pop(method, None)
+
+  def test_load_nofile(self):
+    """
+    Confirm that an empty table is returned
+    when `argtable.load()` is called under the following conditions.
+    * The file does not exist.
+    """
+    self.assertEqual(argtable.load(self.path + ".unknown"), {})
+
+  #endregion
+
+if __name__ == "__main__":
+  unittest.main()
@@ -0,0 +1,66 @@
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from tksugar import headless
+from tksugar.generator import Generator
+
+class Test_Async(unittest.TestCase):
+  """
+  Tests `Generator#prepare_async()` and `Generator#generate_async()`.
+  The headless backend is used, so these tests do not require a display.
+  """
+
+  def tearDown(self):
+    while headless._default_root is not None:
+      headless._default_root.destroy()
+
+  def test_prepare_async(self):
+    """
+    Confirm that the layout is prepared on a thread of the executor
+    when `Generator#prepare_async()` is called under the following conditions.
+    * An executor is passed.
+    """
+    threads = []
+    gen = Generator("tests/definition/generator_test/variable.yml", modules=headless.MODULES)
+    prepare = gen._prepare
+    gen._prepare = lambda data: threads.append(threading.current_thread()) or prepare(data)
+    with ThreadPoolExecutor(1) as executor:
+      tree, vars = gen.prepare_async(executor=executor).result()
+    self.assertEqual(tree["classname"], "Tk")
+    self.assertIn("test2", vars)
+    self.assertIsNot(threads[0], threading.main_thread())
+
+  def test_generate_async(self):
+    """
+    Confirm that the main loop keeps running while the layout is prepared,
+    and that the widgets are created on the Tk thread when `Generator#generate_async()` is called
+    under the following conditions.
+    * A splash window is running the main loop.
+    * The root of the layout is a Toplevel of the splash window.
+    """
+    splash = headless.Tk()
+    gen = Generator("tests/definition/generator_test/toplevel.yml", modules=headless.MODULES)
+    prepare = gen._prepare
+    def _slow(data):
+      time.sleep(0.05)
+      return prepare(data)
+    gen._prepare = _slow
+    ticks = []
+    def _tick():
+      ticks.append(None)
+      splash.after(1, _tick)
+    splash.after(1, _tick)
+    future = gen.generate_async(splash, master=splash, interval=1)
+    built = []
+    future.add_done_callback(lambda f: built.append(threading.current_thread()) or splash.quit())
+    splash.mainloop()
+    window = future.result()
+    self.assertIs(window.master, splash)
+    self.assertEqual(built, [threading.main_thread()])
+    self.assertGreater(len(ticks), 1)
+    self.assertIsNotNone(gen.findbyid("button"))
+
+if __name__ == "__main__":
+  unittest.main()
@@ -0,0 +1,58 @@
+import tkinter
+import unittest
+
+from tksugar import headless
+from tksugar.generator import Generator
+from tksugar.tkmanager import TkManager
+
+class Test_BulkVars(unittest.TestCase):
+  """
+  Tests `TkManager#get_vars()` and `TkManager#set_vars()`.
+  These tests do not require a display.
+  """
+
+  def tearDown(self):
+    if headless._default_root is not None:
+      headless._default_root.destroy()
+
+  def test_headless(self):
+    """
+    Confirm that the values are read and written, and that the handlers are called once for each variable
+    after all values have been written under the following conditions.
+    * The variables are headless variables.
+    * A handler writes the variable that has already been written.
+    """
+    man = Generator("tests/definition/generator_test/variable.yml", modules=headless.MODULES).get_manager()
+    calls = []
+    batches = []
+    man.trace_handler = lambda obj, name: calls.append((name, man.vars["test1"].get(), man.vars["test2"].get()))
+    man.batch_handler = batches.append
+    man.set_vars({"test1": "a", "test2": 3, "test4": True})
+    self.assertEqual(calls, [("test1", "a", 3), ("test2", "a", 3), ("test4", "a", 3)])
+    self.assertEqual(batches, [{"test1": "a", "test2": 3, "test4": True}])
+    self.assertEqual(man.get_vars(["test2", "test1"]), {"test2": 3, "test1": "a"})
+    self.assertEqual(set(man.get_vars()), {"test1", "test2", "test3", "test4"})
+
+  def test_tcl(self):
+    """
+    Confirm that the values are converted as the `get()` method of each variable class does under the following conditions.
+    * The variables are tkinter variables of a Tcl interpreter without Tk.
+    * The values are written as strings.
+    """
+    tcl = tkinter.Tcl()
+    vars = {
+      "name": tkinter.StringVar(tcl, name="name"),
+      "count": tkinter.IntVar(tcl, name="count"),
+      "ratio": tkinter.DoubleVar(tcl, name="ratio"),
+      "flag": tkinter.BooleanVar(tcl, name="flag"),
+    }
+    man = TkManager(None, [], vars)
+    calls = []
+    man.trace_handler = lambda obj, name: calls.append(name)
+    man.set_vars({"name": "a b", "count": "4", "ratio": "0.5", "flag": "yes"})
+    self.assertEqual(calls, ["name", "count", "ratio", "flag"])
+    self.assertEqual(man.get_vars(), {"name": "a b", "count": 4, "ratio": 0.5, "flag": True})
+    self.assertEqual(vars["count"].get(), 4)
+
+if __name__ == "__main__":
+  unittest.main()
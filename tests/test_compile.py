@@ -0,0 +1,133 @@
+import unittest
+
+from tksugar import headless
+from tksugar.compile import compile_layout
+
+class Test_Compile(unittest.TestCase):
+  """
+  Tests the `tksugar.compile` module.
+  """
+
+  #region Testing for normal operation
+
+  def test_compile(self):
+    """
+    Confirm that the source code of a Python module is generated
+    when `compile_layout()` is called under the following conditions.
+    * There is a widget in the window.
+    """
+    code = compile_layout("tests/definition/generator_test/button.yml")
+    compile(code, "button.py", "exec")
+    self.assertIn("def build(command=None):", code)
+    self.assertIn("tkinter.Button(master=w1, anchor='s', text='OK')", code)
+    self.assertNotIn("yaml", code)
+
+  def test_compile_include(self):
+    """
+    Confirm that the included file is compiled into the module
+    when `compile_layout()` is called under the following conditions.
+    * Include another YAML file within a YAML file.
+    """
+    code = compile_layout("tests/definition/generator_test/multiple_files.yml")
+    self.assertIn("t2.id = 'testbutton'", code)
+
+  def test_compile_localize(self):
+    """
+    Confirm that the layout is localized when it is compiled
+    when `compile_layout()` is called under the following conditions.
+    * Specify existing translation dictionary files.
+    """
+    code = compile_layout("tests/definition/generator_test/localize_target.yml",
+      localization_file="tests/definition/generator_test/localize_script.yml")
+    self.assertIn("text='translated'", code)
+
+  def test_compile_variable(self):
+    """
+    Confirm that the variables are created after the root widget and referenced by the widgets
+    when `compile_layout()` is called under the following conditions.
+    * Widget variables are set in the widget.
+    """
+    code = compile_layout("tests/definition/generator_test/variable.yml")
+    self.assertIn("vars['test1'] = tkinter.StringVar(master=w0, name='test1')", code)
+    self.assertIn("textvariable=vars['test1']", code)
+    self.assertLess(code.index("w0 = tkinter.Tk()"), code.index("vars['test1'] ="))
+
+  def test_compile_generatorsupport(self):
+    """
+    Confirm that the child objects are added via `GeneratorSupport#append_child()`
+    when `compile_layout()` is called under the following conditions.
+    * The owner object implements `GeneratorSupport#append_child()`.
+    """
+    code = compile_layout("tests/definition/generator_test/support_haschild.yml", modules=["tests.test_generatorsupport"])
+    self.assertIn("w0.append_child(w1, **{'a': 1, 'b': 'a'})", code)
+
+  def test_build(self):
+    """
+    Confirm that the generated module builds a window with the variable classes of the modules,
+    and that the commands are routed by the manager
+    when the module is executed and `build()` is called under the following conditions.
+    * The headless modules are used.
+    * A function is registered for an ID, and a command handler is passed to `build()`.
+    """
+    namespace = {}
+    exec(compile(compile_layout("tests/definition/generator_test/routing.yml", modules=headless.MODULES), "routing.py", "exec"), namespace)
+    calls = []
+    man = namespace["build"](command=lambda widget, tag: calls.append(("*", tag.id)))
+    try:
+      man.handler("save", lambda widget, tag: calls.append(("save", tag.id)))
+      man.widgets["save"].performclick()
+      man.widgets["other"].performclick()
+      self.assertEqual(calls, [("save", "save"), ("*", "other")])
+    finally:
+      man.window.destroy()
+    namespace = {}
+    exec(compile(compile_layout("tests/definition/generator_test/variable.yml", modules=headless.MODULES), "variable.py", "exec"), namespace)
+    man = namespace["build"]()
+    try:
+      self.assertIs(type(man.vars["test2"]), headless.IntVar)
+      man.vars["test2"].set(3)
+      self.assertEqual(man.widgets["test2"].widget["textvariable"].get(), 3)
+    finally:
+      man.window.destroy()
+
+  def test_build_language(self):
+    """
+    Confirm that the window built by the generated module is translated again, including the widgets created later,
+    and that the widgets are selected by their parents
+    when `TkManager#set_language()` and `TkManager#select()` are called under the following conditions.
+    * The layout is compiled with a localization file and the headless modules.
+    * The language is changed before a lazy Notebook tab is selected.
+    """
+    namespace = {}
+    exec(compile(compile_layout("tests/definition/generator_test/language.yml", modules=headless.MODULES,
+      localization_file="tests/definition/generator_test/language_en.yml"), "language.py", "exec"), namespace)
+    man = namespace["build"]()
+    try:
+      self.assertEqual([t.widget for t in man.select("Notebook Label")], [man.widgets["label"].widget])
+      man.set_language("tests/definition/generator_test/language_ja.yml", encoding="UTF-8")
+      self.assertEqual(man.widgets["label"].widget["text"], "こんにちは")
+      self.assertEqual(man.window.calls[-1], ("title", ("ウィンドウ",), {}))
+      notebook = man.findbyclass("Notebook")[0].widget
+      self.assertEqual([notebook.tab(i, "text") for i in range(2)], ["1番目", "2番目"])
+      notebook.select(1)
+      man.window.update()
+      self.assertEqual(man.widgets["button0"].widget["text"], "こんにちは!")
+    finally:
+      man.window.destroy()
+
+  #endregion
+
+  #region Abnormal behavior test
+
+  def test_compile_unknown_keyword(self):
+    """
+    Confirm that NameError occurs when calling `compile_layout()` under the following conditions.
+    * Keyword is a non-existent name.
+    """
+    with self.assertRaises(NameError):
+      compile_layout("tests/definition/generator_test/command_unknown.yml")
+
+  #endregion
+
+if __name__ == "__main__":
+  unittest.main()
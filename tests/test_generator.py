@@ -163,6 +163,23 @@ class Test_Generator(unittest.TestCase):
     gen.generate()
     self.assertEquals(gen.findbyid("test").widget.cget("text"), "ボタン")
 
+  def test_notebook_lazy(self):
+    """
+    Confirm that the child elements of the lazy tab are created when the tab is materialized
+    when the `Generator#get_manager()` method is called under the following conditions.
+    * The Notebook is in lazy mode.
+    * The first tab disables the lazy mode with the `/lazy` parameter.
+    """
+    gen = Generator("tests/definition/generator_test/notebook_lazy.yml")
+    man = gen.get_manager()
+    notebook = man.widgets["notebook"].widget
+    self.assertIn("button1", man.widgets)
+    self.assertNotIn("button2", man.widgets)
+    self.assertEqual(len(notebook.pending), 1)
+    notebook.materialize()
+    self.assertEqual(man.widgets["button2"].widget.cget("text"), "Tab 2")
+    self.assertEqual(notebook.pending, [])
+
   #endregion
 
   #region Test of semi-normal operation
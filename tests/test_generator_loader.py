@@ -0,0 +1,117 @@
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from tksugar.generator import Generator, GeneratorLoader, CGeneratorLoader, GeneratorIncludeConstructor, TemporaryVariable
+
+def load(loader_class, path):
+  """
+  Read the file with the specified loader and return the result or the exception.
+  """
+  with open(path, "rb") as f:
+    data = f.read()
+  try:
+    string = data.decode("UTF-8")
+  except UnicodeDecodeError:
+    string = data.decode("Shift_JIS")
+  loader = loader_class(string, base_dir=str(path.parent))
+  try:
+    struct = loader.get_single_data()
+  except Exception as e:
+    return "error", type(e), str(e)
+  finally:
+    loader.dispose()
+  return "data", normalize(struct), loader.vars, loader.includes
+
+def normalize(struct):
+  """
+  Replace the TemporaryVariable objects in the data with comparable values.
+  """
+  if type(struct) is dict:
+    return {k: normalize(v) for k, v in struct.items()}
+  elif type(struct) is list:
+    return [normalize(v) for v in struct]
+  elif type(struct) is TemporaryVariable:
+    return ("var", struct.name)
+  return struct
+
+class Test_GeneratorLoader(unittest.TestCase):
+  """
+  Tests the YAML Loader classes used in Generator.
+  """
+
+  def test_default_loader(self):
+    """
+    Confirm that the Generator uses the libyaml implementation if it is available.
+    """
+    self.assertIs(Generator.loader_class, CGeneratorLoader or GeneratorLoader)
+
+  @unittest.skipIf(CGeneratorLoader is None, "libyaml is not available.")
+  def test_parity(self):
+    """
+    Confirm that `GeneratorLoader` and `CGeneratorLoader` return the same result
+    for all files in the tests/definition directory.
+    """
+    files = sorted(Path("tests/definition").rglob("*.yml"))
+    self.assertNotEqual(files, [])
+    for path in files:
+      with self.subTest(path=str(path)):
+        self.assertEqual(load(GeneratorLoader, path), load(CGeneratorLoader, path))
+
+  @unittest.skipIf(CGeneratorLoader is None, "libyaml is not available.")
+  def test_parity_error_message(self):
+    """
+    Confirm that `GeneratorLoader` and `CGeneratorLoader` raise the same error
+    when a variable declaration is invalid.
+    """
+    result = load(GeneratorLoader, Path("tests/definition/generator_test/variable_error2.yml"))
+    self.assertEqual(result[0], "error")
+    self.assertEqual(result, load(CGeneratorLoader, Path("tests/definition/generator_test/variable_error2.yml")))
+
+  @unittest.skipIf(CGeneratorLoader is None, "libyaml is not available.")
+  def test_parity_syntax_error(self):
+    """
+    Confirm that `GeneratorLoader` and `CGeneratorLoader` raise the same error
+    when the document has a syntax error under the following conditions.
+    * The parser detects the error.
+    * The scanner detects the error.
+    """
+    for name in ["syntax_error.yml", "syntax_error2.yml"]:
+      with self.subTest(name=name):
+        path = Path("tests/definition/generator_test") / name
+        result = load(GeneratorLoader, path)
+        self.assertEqual(result[0], "error")
+        self.assertIn("^", result[2])
+        self.assertEqual(result, load(CGeneratorLoader, path))
+
+  def test_include_cache(self):
+    """
+    Confirm that the included file is parsed once, that each include gets its own copy of the data,
+    and that the file is parsed again once it is modified under the following conditions.
+    * The same file is included twice in a layout, and the layout is read twice.
+    """
+    with tempfile.TemporaryDirectory() as d:
+      path = Path(d) / "layout.yml"
+      shutil.copy("tests/definition/generator_test/multiple_files_sub.yml", Path(d) / "sub.yml")
+      path.write_text("_Tk:\n  ::children:\n    - _Frame: !include sub.yml\n    - _Frame: !include sub.yml\n")
+      first = load(Generator.loader_class, path)
+      key = (os.path.abspath(Path(d) / "sub.yml"), "utf-8", d, Generator.loader_class)
+      self.assertIn(key, GeneratorIncludeConstructor._fragments)
+      GeneratorIncludeConstructor._fragments[key]["data"]["::id"] = "cached"
+      second = load(Generator.loader_class, path)
+      children = second[1]["_Tk"]["::children"]
+      self.assertEqual(children[0], children[1])
+      self.assertEqual(children[0]["_Frame"]["::id"], "cached")
+      self.assertEqual(second[3], first[3])
+      children[0]["_Frame"]["::id"] = "changed"
+      self.assertEqual(load(Generator.loader_class, path)[1]["_Tk"]["::children"][0]["_Frame"]["::id"], "cached")
+      with open(Path(d) / "sub.yml", "a") as f:
+        f.write("\n")
+      os.utime(Path(d) / "sub.yml", ns=(0, 0))
+      third = load(Generator.loader_class, path)
+      self.assertEqual(third, first)
+
+if __name__ == "__main__":
+  unittest.main()
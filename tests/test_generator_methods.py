@@ -2,10 +2,11 @@ from msilib.schema import Class
 import unittest
 import types
 import tkinter
+import tkinter.ttk
 
 import yaml
 
-from tksugar.generator import Generator
+from tksugar.generator import Generator, GeneratorLoader
 
 class ClassForTest(object):
   def __init__(self, a, b, c, d=1, e=2, f=3):
@@ -204,6 +205,30 @@ class Test_Generator_Methods(unittest.TestCase):
     with self.assertRaises(TypeError):
       gen._load_class(mods, "tkinter.Notebook")
 
+  def test_load_class_priority(self):
+    """
+    Confirm that the class of the module that comes first is returned
+    when `Generator#_load_class()` is called under the following conditions.
+    * No module name specified.
+    * The class exists in multiple modules of the loaded module list.
+    """
+    mods = Generator(modules=["tkinter.ttk", "tkinter"])._load_modules()
+    self.assertIs(Generator._load_class(mods, "Button"), tkinter.ttk.Button)
+    mods = Generator(modules=["tkinter", "tkinter.ttk"])._load_modules()
+    self.assertIs(Generator._load_class(mods, "Button"), tkinter.Button)
+
+  def test_load_class_shared_index(self):
+    """
+    Confirm that the class index is shared
+    when `Generator#_load_class()` is called under the following conditions.
+    * Multiple Generator objects load the same modules.
+    """
+    mods1 = Generator(modules=["tkinter", "tkinter.ttk"])._load_modules()
+    mods2 = Generator(modules=["tkinter", "tkinter.ttk"])._load_modules()
+    Generator._load_class(mods1, "Notebook")
+    self.assertIs(Generator._get_class_index(mods1), Generator._get_class_index(mods2))
+    self.assertIs(Generator._load_class(mods2, "tkinter.ttk.Notebook"), tkinter.ttk.Notebook)
+
   #endregion
 
   #region test of _scantree()
@@ -326,6 +351,78 @@ class Test_Generator_Methods(unittest.TestCase):
       self.assertEqual(tree["children"][0]["children"][0]["params"]["::id"], "testbutton")
       self.assertEqual(tree["children"][0]["children"][0]["params"]["::tag"], "thisisatest")
 
+  def test_scantree_foreach(self):
+    """
+    When calling the `Generator#_scantree()` method under the following conditions,
+    make sure that the template is repeated for each item and the placeholders are replaced.
+    * The `::foreach` element exists.
+    * The items are written in the file.
+    """
+    gen = Generator(modules=["tkinter"])
+    with open("tests/definition/generator_test/foreach.yml", "r") as f:
+      struct = yaml.safe_load(f)
+      tree = gen._scantree(struct)
+      buttons = tree["children"][0]["children"]
+      self.assertEqual(len(buttons), 3)
+      self.assertEqual(buttons[0]["classname"], "Button")
+      self.assertEqual(buttons[0]["params"]["text"], "7")
+      self.assertEqual(buttons[1]["params"]["grid"], {"row": 0, "column": 1})
+      self.assertEqual(buttons[1]["params"]["::id"], "button1")
+      self.assertEqual(buttons[1]["params"]["width"], 5)
+      self.assertEqual(buttons[2]["params"]["text"], "{unknown}")
+
+  def test_scantree_foreach_data(self):
+    """
+    When calling the `Generator#_scantree()` method under the following conditions,
+    make sure that the template is repeated for each item of the passed data.
+    * The `::foreach` element exists in the `::children` element.
+    * The items are the name of the passed data.
+    * The template is a list.
+    """
+    gen = Generator(modules=["tkinter"])
+    with open("tests/definition/generator_test/foreach_data.yml", "r") as f:
+      struct = yaml.safe_load(f)
+      tree = gen._scantree(struct, {"rows": ["a", "b"]})
+      self.assertEqual([c["classname"] for c in tree["children"]], ["Label", "Label", "Entry", "Label", "Entry"])
+      self.assertEqual(tree["children"][3]["params"]["text"], "Row b")
+      self.assertEqual(tree["children"][4]["params"]["::id"], "entry1")
+
+  def test_scantree_foreach_include(self):
+    """
+    When calling the `Generator#_prepare()` method under the following conditions,
+    make sure that the template is repeated for each item of the included file.
+    * The items are included from another YAML file.
+    """
+    tree, unused = Generator("tests/definition/generator_test/foreach_include.yml")._prepare()
+    self.assertEqual([c["params"]["text"] for c in tree["children"]], ["A", "B"])
+
+  def test_scantree_foreach_nodata(self):
+    """
+    When calling the `Generator#_scantree()` method under the following conditions,
+    Confirm that ValueError occurs.
+    * The items are the name of the data that is not passed.
+    """
+    gen = Generator(modules=["tkinter"])
+    with open("tests/definition/generator_test/foreach_error.yml", "r") as f:
+      struct = yaml.safe_load(f)
+      with self.assertRaises(ValueError):
+        gen._scantree(struct)
+
+  def test_prepare_syntax_error(self):
+    """
+    When calling the `Generator#_prepare()` method under the following conditions,
+    Confirm that the same error occurs with the default loader and the pure Python loader.
+    * The file has a syntax error.
+    """
+    errors = []
+    for loader_class in [Generator.loader_class, GeneratorLoader]:
+      gen = Generator("tests/definition/generator_test/syntax_error.yml")
+      gen.loader_class = loader_class
+      with self.assertRaises(yaml.YAMLError) as cm:
+        gen._prepare()
+      errors.append((type(cm.exception), str(cm.exception)))
+    self.assertEqual(errors[0], errors[1])
+
   #endregion
 
   #region test of _get_argnames()
@@ -19,6 +19,20 @@ class TestOwner(GeneratorSupport):
       "param": params
     })
 
+class TestLazyOwner(TestOwner):
+  def __init__(self):
+    super().__init__()
+    self.builders = []
+
+  def defer_children(self, child, builder):
+    self.builders.append(builder)
+    return True
+
+class TestContainer(object):
+  def __init__(self, master=None, a=None):
+    self.master = master
+    self.a = a
+
 class Test_GeneratorSupport(unittest.TestCase):
   """
   Tests the `GeneratorSupport` Class
@@ -41,5 +55,23 @@ class Test_GeneratorSupport(unittest.TestCase):
     self.assertEqual(obj.children[0]["param"]["a"], 1)
     self.assertEqual(obj.children[0]["param"]["b"], "a")
 
+  def test_defer_children(self):
+    """
+    When the `Generator#get_manager()` method is called with the following conditions
+    Make sure that the child elements are created when the builder passed to `GeneratorSupport#defer_children()` is called,
+    and their IDs are registered with the TkManager at that time.
+    * The owner object implements `GeneratorSupport#defer_children()` and returns True.
+    """
+    gen = Generator(file="tests/definition/generator_test/support_lazy.yml", modules=["tests.test_generatorsupport"])
+    man = gen.get_manager()
+    owner = man.window
+    self.assertEqual(len(owner.builders), 1)
+    self.assertNotIn("inner", man.widgets)
+    self.assertEqual(owner.children[0]["obj"].a, "outer")
+    owner.builders[0]()
+    self.assertEqual(man.widgets["inner"].widget.a, "inner")
+    self.assertIs(man.widgets["inner"].widget.master, owner.children[0]["obj"])
+    self.assertIs(gen.findbyid("inner"), man.widgets["inner"])
+
 if __name__ == "__main__":
   unittest.main()
\ No newline at end of file
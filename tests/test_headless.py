@@ -0,0 +1,138 @@
+import unittest
+
+from tksugar import headless
+from tksugar.generator import Generator
+
+class Test_Headless(unittest.TestCase):
+  """
+  Tests the `tksugar.headless` backend.
+  These tests do not require a display.
+  """
+
+  def tearDown(self):
+    if headless._default_root is not None:
+      headless._default_root.destroy()
+
+  def test_generate(self):
+    """
+    Confirm that the headless widgets record the options and method calls
+    when the `Generator#get_manager()` method is called under the following conditions.
+    * `tksugar.headless.MODULES` is specified as the modules.
+    """
+    gen = Generator("tests/definition/generator_test/has_command.yml", modules=headless.MODULES)
+    called = []
+    man = gen.get_manager(lambda o, n: called.append(n.id))
+    self.assertIs(type(man.window), headless.Tk)
+    self.assertIn(("title", ("TEST Window",), {}), man.window.calls)
+    button = man.widgets["test"].widget
+    self.assertIs(type(button), headless.Button)
+    self.assertEqual(button.cget("text"), "OK")
+    self.assertEqual(button["anchor"], "s")
+    self.assertEqual(button.master.manager, "grid")
+    self.assertEqual(str(button), ".!frame.!button")
+    button["command"]()
+    self.assertEqual(called, ["test"])
+
+  def test_variables(self):
+    """
+    Confirm that the variables are created from the headless variable classes, converted to their types,
+    and call the trace handler of the TkManager when they are written under the following conditions.
+    * `tksugar.headless.MODULES` is specified as the modules.
+    * The layout declares variables.
+    """
+    man = Generator("tests/definition/generator_test/variable.yml", modules=headless.MODULES).get_manager()
+    traced = []
+    man.trace_handler = lambda o, n: traced.append((n, o.get()))
+    self.assertIs(type(man.vars["test2"]), headless.IntVar)
+    self.assertIs(man.widgets["test2"].widget["textvariable"], man.vars["test2"])
+    man.vars["test2"].set("5")
+    man.vars["test4"].set("yes")
+    self.assertEqual(traced, [("test2", 5), ("test4", True)])
+    self.assertEqual(man.vars["test3"].get(), 0.0)
+
+  def test_menu_items(self):
+    """
+    Confirm that `Menu#items()` adds the menu entries to the headless menu,
+    and that invoking an entry calls the command handler with the item name under the following conditions.
+    * `tksugar.headless.MODULES` is specified as the modules.
+    * The menu has cascades with items.
+    """
+    called = []
+    man = Generator("tests/definition/command_test/call_menu.yml", modules=headless.MODULES).get_manager(lambda o, n: called.append(n.tag["item"]))
+    menu = man.widgets["Menu"].widget
+    self.assertEqual(man.window.cget("menu"), menu)
+    self.assertEqual([e["type"] for e in menu.entries], ["tearoff", "cascade", "cascade", "cascade"])
+    sub = menu.entries[menu.index("2")]["menu"]
+    self.assertEqual(sub.entrycget(0, "accelerator"), "Ctrl+Z")
+    sub.invoke(0)
+    check = menu.entries[menu.index("3")]["menu"]
+    check.invoke("3")
+    self.assertEqual(called, ["2", "3"])
+    self.assertEqual(man.vars["check1"].get(), False)
+
+  def test_notebook_lazy(self):
+    """
+    Confirm that the tabs are added to the headless notebook, and that the child elements of a lazy tab
+    are created when the tab is selected and the idle callbacks are executed under the following conditions.
+    * `tksugar.headless.MODULES` is specified as the modules.
+    * The Notebook is in lazy mode.
+    """
+    man = Generator("tests/definition/generator_test/notebook_lazy.yml", modules=headless.MODULES).get_manager()
+    notebook = man.widgets["notebook"].widget
+    self.assertEqual(len(notebook.tabs()), 2)
+    self.assertEqual(notebook.tab(0, "text"), "Tab 1")
+    self.assertNotIn("button2", man.widgets)
+    notebook.select(1)
+    self.assertNotIn("button2", man.widgets)
+    man.window.update()
+    self.assertEqual(man.widgets["button2"].widget.cget("text"), "Tab 2")
+    self.assertEqual(notebook.pending, [])
+
+  def test_notebook_lazy_reuse(self):
+    """
+    Confirm that the child elements of a lazy tab are registered with the manager of their own window
+    under the following conditions.
+    * One Generator creates two windows, and the lazy tab of the first window is selected after the second window is created.
+    """
+    gen = Generator("tests/definition/generator_test/notebook_lazy.yml", modules=headless.MODULES)
+    man1 = gen.get_manager()
+    man2 = gen.get_manager()
+    man1.widgets["notebook"].widget.select(1)
+    man1.window.update()
+    self.assertEqual(man1.widgets["button2"].widget.cget("text"), "Tab 2")
+    self.assertNotIn("button2", man2.widgets)
+    self.assertIn(man1.widgets["button2"].widget, man1.index)
+
+  def test_unknown_option(self):
+    """
+    Confirm that TclError is raised under the following conditions.
+    * An option that the tkinter class does not have is set to a headless widget.
+    """
+    label = headless.Label(text="a")
+    with self.assertRaises(headless.TclError):
+      label["command"] = print
+    with self.assertRaises(headless.TclError):
+      headless.Label(command=print)
+
+  def test_event_loop(self):
+    """
+    Confirm that the queued callbacks and the <Destroy> event handlers are called under the following conditions.
+    * Callbacks are queued with `after()` and `after_idle()`.
+    * A <Destroy> event handler is bound with `bind_all()`.
+    """
+    root = headless.Tk()
+    frame = headless.Frame(root)
+    result = []
+    root.after(0, result.append, "after")
+    root.after_idle(result.append, "idle")
+    canceled = root.after_idle(result.append, "canceled")
+    root.after_cancel(canceled)
+    root.mainloop()
+    self.assertEqual(result, ["after", "idle"])
+    root.bind_all("<Destroy>", lambda e: result.append(str(e.widget)), add="+")
+    root.destroy()
+    self.assertEqual(result[2:], [str(frame), "."])
+    self.assertEqual(frame.winfo_exists(), 0)
+
+if __name__ == "__main__":
+  unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+
+from tksugar import headless
+from tksugar.generator import Generator
+
+class Test_Incremental(unittest.TestCase):
+  """
+  Tests `Generator#get_manager_incremental()`.
+  The headless backend is used, so these tests do not require a display.
+  """
+
+  def tearDown(self):
+    if headless._default_root is not None:
+      headless._default_root.destroy()
+
+  def test_incremental(self):
+    """
+    Confirm that the manager is returned before the child widgets are created,
+    that the widgets are created in slices of the main loop with the progress reported,
+    and that the ready future is completed with the manager
+    when `Generator#get_manager_incremental()` is called under the following conditions.
+    * The budget of each slice is 0 milliseconds, so one widget is created in each slice.
+    """
+    gen = Generator("tests/definition/generator_test/incremental.yml", modules=headless.MODULES)
+    reports = []
+    def _progress(done, total):
+      reports.append((done, total, man.findbyid("frame") is not None, man.findbyid("button4") is not None))
+    man = gen.get_manager_incremental(data={"rows": list("abcde")}, budget=0, progress=_progress)
+    self.assertFalse(man.ready.done())
+    self.assertIsNone(man.findbyid("frame"))
+    man.window.mainloop()
+    self.assertIs(man.ready.result(), man)
+    self.assertEqual([r[0] for r in reports], [1, 2, 3, 4, 5, 6])
+    self.assertEqual({r[1] for r in reports}, {6})
+    self.assertEqual(reports[0][2:], (True, False))
+    self.assertEqual(man.widgets["button4"].widget["text"], "Row e")
+    self.assertIs(man.widgets["button0"].widget.master, man.widgets["frame"].widget)
+
+  def test_cancel(self):
+    """
+    Confirm that the remaining widgets are not created under the following conditions.
+    * The ready future is cancelled after the first slice.
+    """
+    gen = Generator("tests/definition/generator_test/incremental.yml", modules=headless.MODULES)
+    man = gen.get_manager_incremental(data={"rows": list("abcde")}, budget=0,
+      progress=lambda done, total: man.ready.cancel())
+    man.window.mainloop()
+    self.assertTrue(man.ready.cancelled())
+    self.assertIsNotNone(man.findbyid("frame"))
+    self.assertIsNone(man.findbyid("button0"))
+
+if __name__ == "__main__":
+  unittest.main()
@@ -0,0 +1,85 @@
+import subprocess
+import sys
+import unittest
+
+from tksugar import headless
+from tksugar.generator import Generator
+
+class Test_Language(unittest.TestCase):
+  """
+  Tests `TkManager#set_language()`.
+  The headless backend is used, so these tests do not require a display.
+  """
+
+  def tearDown(self):
+    if headless._default_root is not None:
+      headless._default_root.destroy()
+
+  def test_set_language(self):
+    """
+    Confirm that the options, the title, the menu labels and the tab texts written with the markers are translated again,
+    and that the variables and the other options are kept
+    when `TkManager#set_language()` is called under the following conditions.
+    * The window is generated with a localization file.
+    * The variable has been changed.
+    """
+    gen = Generator("tests/definition/generator_test/language.yml", modules=headless.MODULES,
+      localization_file="tests/definition/generator_test/language_en.yml")
+    man = gen.get_manager()
+    label = man.widgets["label"].widget
+    self.assertEqual(label["text"], "Hello")
+    man.vars["size"].set(0)
+    man.set_language("tests/definition/generator_test/language_ja.yml", encoding="UTF-8")
+    self.assertEqual(label["text"], "こんにちは")
+    self.assertEqual(label.calls.count(("configure", (), {"text": "こんにちは"})), 1)
+    self.assertEqual(man.window.calls[-1], ("title", ("ウィンドウ",), {}))
+    menu = man.widgets["menu"].widget
+    self.assertEqual(menu.entrycget(1, "label"), "ファイル")
+    sub = menu.entrycget(1, "menu")
+    self.assertEqual([sub.entrycget(i, "label") for i in [0, 2, 3]], ["開く", "小", "大"])
+    self.assertEqual(sub.entrycget(2, "variable"), man.vars["size"])
+    self.assertEqual(man.vars["size"].get(), 0)
+    notebook = man.findbyclass("Notebook")[0].widget
+    self.assertEqual([notebook.tab(i, "text") for i in range(2)], ["1番目", "2番目"])
+
+  def test_lazy_tab(self):
+    """
+    Confirm that the widgets created later are translated into the language set by `TkManager#set_language()`
+    under the following conditions.
+    * The language is changed before a lazy Notebook tab is selected.
+    * The text of the widget in the tab is expanded from the items of a `::foreach` node.
+    """
+    gen = Generator("tests/definition/generator_test/language.yml", modules=headless.MODULES,
+      localization_file="tests/definition/generator_test/language_en.yml")
+    man = gen.get_manager()
+    man.set_language("tests/definition/generator_test/language_ja.yml")
+    notebook = man.findbyclass("Notebook")[0].widget
+    notebook.select(1)
+    man.window.update()
+    self.assertEqual(man.widgets["button0"].widget["text"], "こんにちは!")
+
+  def test_changed_menu(self):
+    """
+    Confirm that the labels are translated into the matching entries
+    when `TkManager#set_language()` is called under the following conditions.
+    * An item is inserted after a named item by `Menu#insert_after()`, and the named item is removed.
+    """
+    gen = Generator("tests/definition/generator_test/language.yml", modules=headless.MODULES,
+      localization_file="tests/definition/generator_test/language_en.yml")
+    man = gen.get_manager()
+    sub = man.widgets["menu"].widget.entrycget(1, "menu")
+    sub.insert_after("open", [{"label": "Save", "name": "save"}])
+    sub.remove("open")
+    man.set_language("tests/definition/generator_test/language_ja.yml")
+    self.assertEqual([e.get("label") for e in sub.entries], ["Save", None, "小", "大"])
+
+  def test_import(self):
+    """
+    Confirm that PyYAML is not imported with `TkManager` under the following conditions.
+    * `tksugar.tkmanager` is imported in a new process.
+    """
+    code = "import sys, tksugar.tkmanager; sys.exit('yaml' in sys.modules)"
+    self.assertEqual(subprocess.run([sys.executable, "-c", code]).returncode, 0)
+
+if __name__ == "__main__":
+  unittest.main()
@@ -0,0 +1,105 @@
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from tksugar.generator import Generator
+from tksugar.layoutcache import LayoutCache
+
+class Test_LayoutCache(unittest.TestCase):
+  """
+  Tests the `LayoutCache` Class
+  """
+
+  def setUp(self):
+    self.dir = Path(tempfile.mkdtemp())
+    self.cachedir = self.dir / "cache"
+    for f in ["multiple_files.yml", "multiple_files_sub.yml"]:
+      shutil.copy(Path("tests/definition/generator_test") / f, self.dir / f)
+
+  def tearDown(self):
+    shutil.rmtree(self.dir)
+
+  #region Testing for normal operation
+
+  def test_store(self):
+    """
+    Confirm that the scanned layout is stored in the cache directory
+    when `Generator#_prepare()` is executed under the following conditions.
+    * The cache directory is specified.
+    """
+    Generator(str(self.dir / "multiple_files.yml"), cache_dir=str(self.cachedir))._prepare()
+    self.assertEqual(len(list(self.cachedir.glob("*.pickle"))), 1)
+
+  def test_hit(self):
+    """
+    Confirm that the cached layout is used without reading YAML
+    when `Generator#_prepare()` is executed under the following conditions.
+    * The layout has already been cached.
+    * The layout file and the included file have not been changed.
+    """
+    Generator(str(self.dir / "multiple_files.yml"), cache_dir=str(self.cachedir))._prepare()
+    gen = Generator(str(self.dir / "multiple_files.yml"), cache_dir=str(self.cachedir))
+    gen.base_dir = str(self.dir / "unknown")
+    tree, vars = gen._prepare()
+    self.assertEqual(tree["children"][0]["children"][0]["params"]["::id"], "testbutton")
+
+  def test_include_changed(self):
+    """
+    Confirm that the cached layout is discarded
+    when `Generator#_prepare()` is executed under the following conditions.
+    * The layout has already been cached.
+    * The included file has been changed.
+    """
+    Generator(str(self.dir / "multiple_files.yml"), cache_dir=str(self.cachedir))._prepare()
+    with open(self.dir / "multiple_files_sub.yml", "w") as f:
+      f.write("text: Changed")
+    tree, vars = Generator(str(self.dir / "multiple_files.yml"), cache_dir=str(self.cachedir))._prepare()
+    self.assertEqual(tree["children"][0]["children"][0]["params"], {"text": "Changed"})
+
+  def test_localization_changed(self):
+    """
+    Confirm that the cached layout is discarded
+    when `Generator#_prepare()` is executed under the following conditions.
+    * The layout has already been cached.
+    * The localization file has been changed.
+    """
+    shutil.copy("tests/definition/generator_test/localize_target.yml", self.dir / "target.yml")
+    with open(self.dir / "script.yml", "w") as f:
+      f.write("OK: before")
+    Generator(str(self.dir / "target.yml"), localization_file=str(self.dir / "script.yml"), cache_dir=str(self.cachedir))._prepare()
+    with open(self.dir / "script.yml", "w") as f:
+      f.write("OK: after")
+    tree, vars = Generator(str(self.dir / "target.yml"), localization_file=str(self.dir / "script.yml"), cache_dir=str(self.cachedir))._prepare()
+    self.assertEqual(tree["children"][0]["children"][0]["params"]["text"], "after")
+
+  def test_vars(self):
+    """
+    Confirm that the variable declarations are restored from the cache
+    when `Generator#_prepare()` is executed under the following conditions.
+    * The layout has already been cached.
+    * The layout declares variables.
+    """
+    Generator("tests/definition/generator_test/variable.yml", cache_dir=str(self.cachedir))._prepare()
+    tree, vars = Generator("tests/definition/generator_test/variable.yml", cache_dir=str(self.cachedir))._prepare()
+    self.assertEqual(sorted(vars.keys()), ["test1", "test2", "test3", "test4"])
+
+  #endregion
+
+  #region Semi-normal behavior testing
+
+  def test_broken_entry(self):
+    """
+    Confirm that None is returned
+    when `LayoutCache#load()` is executed under the following conditions.
+    * The cache file is broken.
+    """
+    self.cachedir.mkdir()
+    with open(self.cachedir / "broken.pickle", "wb") as f:
+      f.write(b"broken")
+    self.assertIsNone(LayoutCache(str(self.cachedir)).load("broken"))
+
+  #endregion
+
+if __name__ == "__main__":
+  unittest.main()
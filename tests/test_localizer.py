@@ -1,7 +1,11 @@
+import os
+import shutil
+import tempfile
 import unittest
 
 import yaml
 
+from tksugar.generator import Generator
 from tksugar.localizer import Localizer
 
 class Test_Localizer(unittest.TestCase):
@@ -143,6 +147,67 @@ class Test_Localizer(unittest.TestCase):
     self.assertEqual(data["listitems"], ["test.testb", "test.testc", "test.unknown"])
     self.assertEqual(data["longtext"], "test\ntest.test.testd\ntesta")
 
+  def test_scantree(self):
+    """
+    Confirm that the parameters, the inherited parameters and the items of the `::foreach` node are translated
+    and that the given data is not modified when `Generator#_scantree()` is called under the following conditions.
+    * A Localizer is passed.
+    """
+    l = Localizer("tests/definition/localizer_test/safecase.yml")
+    struct = {"_Frame": {
+      "::params": {"text": ":::testa"},
+      "::children": [
+        {"_Label": {"grid": {"sticky": ":::test.testb"}, "width": 3}},
+        {"::foreach": {"items": [{"t": ":::test.testc"}], "template": {"_Button": {"text": "{t}"}}}},
+      ]
+    }}
+    tree = Generator._scantree(struct, localizer=l)
+    self.assertEqual(tree["children"][0]["params"], {"text": "a", "grid": {"sticky": "b"}, "width": 3})
+    self.assertEqual(tree["children"][1]["params"], {"text": "c"})
+    self.assertEqual(struct["_Frame"]["::params"]["text"], ":::testa")
+
+  #endregion
+
+  #region Cache Testing
+
+  def test_table_cache(self):
+    """
+    Confirm that the expanded dictionary is shared by the Localizers until the file is modified under the following conditions.
+    * Two Localizers read the same YML file.
+    * The YML file is modified after that.
+    """
+    with tempfile.TemporaryDirectory() as d:
+      file = os.path.join(d, "dict.yml")
+      shutil.copy("tests/definition/localizer_test/safecase.yml", file)
+      a = Localizer(file)
+      b = Localizer(file)
+      self.assertIs(a._translatedict, b._translatedict)
+      with open(file, "a") as f:
+        f.write("teste: E\n")
+      c = Localizer(file)
+      self.assertIsNot(a._translatedict, c._translatedict)
+      self.assertEqual(c._translatedict["teste"], "E")
+      self.assertEqual(len(a._translatedict), 4)
+
+  def test_compile(self):
+    """
+    Confirm that the compiled dictionary has the same contents as the YML file,
+    and that it is ignored once the YML file is modified under the following conditions.
+    * The YML file is compiled with `Localizer.compile()`.
+    """
+    with tempfile.TemporaryDirectory() as d:
+      file = os.path.join(d, "dict.yml")
+      shutil.copy("tests/definition/localizer_test/safecase.yml", file)
+      expected = Localizer(file)._translatedict
+      output = Localizer.compile(file)
+      self.assertEqual(output, file + ".marshal")
+      Localizer.clear_cache()
+      self.assertEqual(Localizer(file)._translatedict, expected)
+      self.assertEqual(Localizer(output)._translatedict, expected)
+      with open(file, "a") as f:
+        f.write("teste: E\n")
+      self.assertEqual(Localizer(file)._translatedict["teste"], "E")
+
   #endregion
 
   #region Anomaly Testing
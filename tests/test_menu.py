@@ -0,0 +1,121 @@
+import unittest
+
+from tksugar import headless
+from tksugar.generator import Generator
+
+class Test_Menu(unittest.TestCase):
+  """
+  Tests the menu items of `tksugar.widgets.Menu` after the window is generated.
+  The headless backend is used, so these tests do not require a display.
+  """
+
+  def tearDown(self):
+    if headless._default_root is not None:
+      headless._default_root.destroy()
+
+  def test_lazy(self):
+    """
+    Confirm that the items of the lazy cascade are added when it is posted first,
+    and that the commands are routed by the item names under the following conditions.
+    * The cascade has the `lazy` element.
+    * The cascade is posted twice.
+    """
+    man = Generator("tests/definition/menu_test/lazy.yml", modules=headless.MODULES).get_manager()
+    calls = []
+    man.handler("second.txt", lambda widget, tag: calls.append(tag.tag["item"]))
+    recent = man.widgets["file"].widget.entrycget(1, "menu")
+    self.assertEqual(recent.entries, [])
+    recent.post(0, 0)
+    recent.post(0, 0)
+    self.assertEqual([e["label"] for e in recent.entries], ["first.txt", "second.txt"])
+    recent.invoke(1)
+    self.assertEqual(calls, ["second.txt"])
+
+  def test_lazy_postcommand(self):
+    """
+    Confirm that the `postcommand` set before is called after the items are added each time the menu is posted
+    under the following conditions.
+    * The `postcommand` is passed to the constructor, or it is set by `configure()`.
+    * The items are added by `MenuSupport#lazy()`.
+    """
+    root = headless.Tk()
+    calls = []
+    first = headless.widgets.Menu(root, tearoff=0, postcommand=lambda: calls.append(("first", len(first.entries))))
+    second = headless.widgets.Menu(root, tearoff=0)
+    second.configure(postcommand=lambda: calls.append(("second", len(second.entries))))
+    for menu in [first, second]:
+      menu.lazy(["a.txt", "b.txt"])
+      menu.post(0, 0)
+      menu.post(0, 0)
+    self.assertEqual(calls, [("first", 2), ("first", 2), ("second", 2), ("second", 2)])
+
+  def test_provider(self):
+    """
+    Confirm that the items are added again from the function each time the cascade is posted under the following conditions.
+    * The items of the cascade are a generator function.
+    * The cache is disabled.
+    """
+    man = Generator("tests/definition/menu_test/lazy.yml", modules=headless.MODULES).get_manager()
+    files = ["a.txt"]
+    def _plugins():
+      for f in files:
+        yield {"label": f, "name": "plugin"}
+      yield {"label": "More", "type": "cascade", "items": ["x"]}
+    file = man.widgets["file"].widget
+    file.items([{"label": "Plugins", "type": "cascade", "items": _plugins, "cache": False}])
+    plugins = file.entrycget(2, "menu")
+    plugins.post(0, 0)
+    more = plugins.entrycget(1, "menu")
+    files.append("b.txt")
+    plugins.post(0, 0)
+    self.assertEqual([e["label"] for e in plugins.entries], ["a.txt", "b.txt", "More"])
+    self.assertEqual(more.winfo_exists(), 0)
+    self.assertEqual(len(plugins._itementries), 3)
+
+  def test_insert_remove(self):
+    """
+    Confirm that the items are inserted and removed by their names,
+    and that the commands and the variables of the other items are kept under the following conditions.
+    * The items are inserted after an item with the name element.
+    * A command item and a radio group are removed.
+    """
+    man = Generator("tests/definition/menu_test/items.yml", modules=headless.MODULES).get_manager()
+    calls = []
+    man.handlers["*"] = lambda widget, tag: calls.append(tag.tag["item"])
+    edit = man.widgets["edit"].widget
+    edit.insert_after("saveas", ["Print", {"label": "Export", "name": "export"}])
+    edit.remove("Undo")
+    self.assertEqual([e.get("label") for e in edit.entries], ["Save As", "Print", "Export", "Small", "Large", "More", None, "Close"])
+    edit.invoke(4)
+    self.assertEqual(man.vars["size"].get(), 1)
+    edit.remove("size")
+    edit.insert_after("Close", ["Exit"])
+    self.assertEqual([e.get("label") for e in edit.entries], ["Save As", "Print", "Export", "More", None, "Close", "Exit"])
+    for i in [0, 2, 5, 6]:
+      edit.invoke(i)
+    self.assertEqual(calls, ["size", "saveas", "export", "Close", "Exit"])
+    self.assertIs(edit.entrycget(3, "menu"), edit._finditem("More")[2])
+    with self.assertRaises(KeyError):
+      edit.remove("Undo")
+
+  def test_update_items(self):
+    """
+    Confirm that only the entries of the named items are changed under the following conditions.
+    * The label of a command item, the labels of a radio group and the items of a cascade are changed.
+    """
+    man = Generator("tests/definition/menu_test/items.yml", modules=headless.MODULES).get_manager()
+    calls = []
+    man.handlers["*"] = lambda widget, tag: calls.append(tag.tag["item"])
+    edit = man.widgets["edit"].widget
+    edit.calls.clear()
+    edit.update_items({"Close": {"label": "Quit"}, "size": {"items": ["S", "L"]}, "More": {"items": ["Search", "Replace"]}})
+    self.assertEqual([c[1][0] for c in edit.calls if c[0] == "entryconfigure"], [6, 2, 3])
+    self.assertEqual(edit.entrycget(3, "variable"), man.vars["size"])
+    more = edit.entrycget(4, "menu")
+    self.assertEqual([e["label"] for e in more.entries], ["Search", "Replace"])
+    edit.invoke(6)
+    more.invoke(1)
+    self.assertEqual(calls, ["Close", "Replace"])
+
+if __name__ == "__main__":
+  unittest.main()
@@ -0,0 +1,97 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from tksugar import headless
+from tksugar.generator import Generator
+from tksugar.precompile import precompile_directory
+
+class Test_Precompile(unittest.TestCase):
+  """
+  Tests the `tksugar.precompile` module.
+  The headless backend is used, so these tests do not require a display.
+  """
+
+  def setUp(self):
+    self.dir = tempfile.mkdtemp()
+    shutil.copytree("tests/definition/precompile_test", os.path.join(self.dir, "layouts"))
+
+  def tearDown(self):
+    if headless._default_root is not None:
+      headless._default_root.destroy()
+    shutil.rmtree(self.dir)
+
+  def test_precompile_directory(self):
+    """
+    Confirm that the layouts are precompiled, the included file is not reported as an error,
+    and the unknown class is reported when `precompile_directory()` is called under the following conditions.
+    * The directory has a layout that includes another file and a layout with an unknown class.
+    * Two processes are used.
+    """
+    results = precompile_directory(os.path.join(self.dir, "layouts"), os.path.join(self.dir, "out"), headless.MODULES, jobs=2)
+    results = {os.path.basename(r["file"]): r for r in results}
+    self.assertIsNone(results["layout.yml"]["error"])
+    self.assertTrue(os.path.exists(os.path.join(self.dir, "out", "layout.tkc")))
+    self.assertTrue(results["fragment.yml"]["included"])
+    self.assertIn('Class not found. "UnknownWidget"', results["unknown.yml"]["error"])
+    self.assertFalse(results["unknown.yml"]["included"])
+
+  def test_generate(self):
+    """
+    Confirm that the Generator creates the window from the precompiled file without resolving the classes,
+    and that it reads the layout file once the layout file is changed under the following conditions.
+    * The precompiled file is passed to the Generator.
+    """
+    precompile_directory(os.path.join(self.dir, "layouts"), modules=headless.MODULES, jobs=1)
+    file = os.path.join(self.dir, "layouts", "layout.tkc")
+    gen = Generator(file, modules=headless.MODULES)
+    gen._load_class = None
+    man = gen.get_manager()
+    self.assertEqual(man.widgets["button"].widget["text"], "Included")
+    self.assertEqual(len(gen.includes), 1)
+    man.window.destroy()
+    with open(os.path.join(self.dir, "layouts", "fragment.yml"), "w") as f:
+      f.write("text: Changed\n::id: button\npack:\n")
+    gen = Generator(file, modules=headless.MODULES)
+    self.assertEqual(gen.file, os.path.join(os.path.realpath(self.dir), "layouts", "layout.yml"))
+    self.assertEqual(gen.get_manager().widgets["button"].widget["text"], "Changed")
+
+  def test_modules(self):
+    """
+    Confirm that the Generator reads the layout file instead of the precompiled file under the following conditions.
+    * The Generator is created with other modules than the ones used to compile the file.
+    * A module is added to the Generator after the precompiled file is read.
+    """
+    precompile_directory(os.path.join(self.dir, "layouts"), modules=headless.MODULES, jobs=1)
+    file = os.path.join(self.dir, "layouts", "layout.tkc")
+    source = os.path.join(os.path.realpath(self.dir), "layouts", "layout.yml")
+    gen = Generator(file, modules=["tksugar.headless"])
+    self.assertIsNone(gen._precompiled)
+    self.assertEqual(gen.file, source)
+    gen = Generator(file, modules=list(headless.MODULES))
+    self.assertIsNotNone(gen._precompiled)
+    gen._modules.append("tests.test_generatorsupport")
+    gen._prepare()
+    self.assertIsNone(gen._precompiled)
+    self.assertEqual(gen.file, source)
+
+  def test_localization(self):
+    """
+    Confirm that the Generator uses the precompiled file only if it was compiled with the same localization file,
+    and the localization file has not been changed under the following conditions.
+    * The file is precompiled with a localization file.
+    """
+    dictionary = os.path.join(self.dir, "ja.yml")
+    with open(dictionary, "w", encoding="UTF-8") as f:
+      f.write("label: Label\n")
+    precompile_directory(os.path.join(self.dir, "layouts"), modules=headless.MODULES, localization_file=dictionary, jobs=1)
+    file = os.path.join(self.dir, "layouts", "layout.tkc")
+    self.assertIsNotNone(Generator(file, modules=headless.MODULES, localization_file=dictionary)._precompiled)
+    self.assertIsNone(Generator(file, modules=headless.MODULES)._precompiled)
+    with open(dictionary, "w", encoding="UTF-8") as f:
+      f.write("label: Changed\n")
+    self.assertIsNone(Generator(file, modules=headless.MODULES, localization_file=dictionary)._precompiled)
+
+if __name__ == "__main__":
+  unittest.main()
@@ -0,0 +1,125 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from tksugar import headless
+from tksugar.generator import Generator
+from tksugar.precompile import precompile_file
+
+class Test_Reloader(unittest.TestCase):
+  """
+  Tests `TkManager#reload()` and `TkManager#watch()`.
+  The headless backend is used, so these tests do not require a display.
+  """
+
+  def setUp(self):
+    self.dir = tempfile.mkdtemp()
+    self.file = os.path.join(self.dir, "layout.yml")
+    shutil.copy("tests/definition/reloader_test/before.yml", self.file)
+
+  def tearDown(self):
+    if headless._default_root is not None:
+      headless._default_root.destroy()
+    shutil.rmtree(self.dir)
+
+  def test_reload(self):
+    """
+    Confirm that only the changed widgets are configured, created or destroyed,
+    and that the other widgets and the values of the variables are kept
+    when `TkManager#reload()` is called under the following conditions.
+    * An option, the title and the text of a widget without ID are changed.
+    * A widget with ID and a widget without ID are removed, and widgets with a new variable are added.
+    """
+    man = Generator(self.file, modules=headless.MODULES).get_manager()
+    save = man.widgets["save"].widget
+    entry = man.widgets["entry"].widget
+    first, second = man.findbyclass("Label")
+    man.vars["name"].set("typed")
+    shutil.copy("tests/definition/reloader_test/after.yml", self.file)
+    changes = man.reload()
+    self.assertEqual(changes, {"configured": 3, "created": 2, "destroyed": 2})
+    self.assertEqual(man.window.calls[-1], ("title", ("After",), {}))
+    self.assertIs(man.widgets["save"].widget, save)
+    self.assertNotIn("open", man.widgets)
+    self.assertEqual(man.widgets["close"].widget["text"], "Close")
+    self.assertIs(man.widgets["entry"].widget, entry)
+    self.assertEqual(entry["width"], 40)
+    self.assertEqual(man.vars["name"].get(), "typed")
+    self.assertEqual(first.widget["text"], "First!")
+    self.assertEqual(second.widget.winfo_exists(), 0)
+    check = man.findbyclass("Checkbutton")[0].widget
+    self.assertIs(check["variable"], man.vars["checked"])
+    self.assertEqual([t.widget for t in man.select("Frame > Button")], [save, man.widgets["close"].widget])
+
+  def test_reload_precompiled(self):
+    """
+    Confirm that the layout file of the precompiled file is read and watched
+    when `TkManager#reload()` and `TkManager#watch()` are called under the following conditions.
+    * The window is generated from a precompiled file, and the layout file is changed.
+    * The layout file of the precompiled file does not exist.
+    """
+    output, unused = precompile_file(self.file, modules=headless.MODULES)
+    man = Generator(output, modules=headless.MODULES).get_manager()
+    save = man.widgets["save"].widget
+    shutil.copy("tests/definition/reloader_test/after.yml", self.file)
+    self.assertEqual(man.reload(), {"configured": 3, "created": 2, "destroyed": 2})
+    self.assertIs(man.widgets["save"].widget, save)
+    self.assertEqual(man.widgets["close"].widget["text"], "Close")
+    self.assertIn(os.path.abspath(self.file), man.watch().files)
+    man.unwatch()
+    man.window.destroy()
+    precompile_file(self.file, modules=headless.MODULES)
+    man = Generator(output, modules=headless.MODULES).get_manager()
+    os.remove(self.file)
+    with self.assertRaises(ValueError):
+      man.watch()
+
+  def test_reload_inserted(self):
+    """
+    Confirm that the changes are applied to the matching widgets when `TkManager#reload()` is called
+    under the following conditions.
+    * A widget is inserted between the children by the first reload.
+    * The text of the widget after the inserted widget is changed by the next reloads.
+    """
+    def _write(labels):
+      with open(self.file, "w") as f:
+        f.write("_Tk:\n  ::children:\n" + "".join(f"    - _Label:\n        text: {t}\n        ::id: {i}\n        pack:\n" for i, t in labels))
+    _write([("a", "A"), ("b", "B")])
+    man = Generator(self.file, modules=headless.MODULES).get_manager()
+    b = man.widgets["b"].widget
+    versions = [
+      [("a", "A"), ("n", "N"), ("b", "B")],
+      [("a", "A"), ("n", "N"), ("b", "B2")],
+      [("a", "A"), ("n", "N2"), ("b", "B3")],
+    ]
+    for version in versions:
+      _write(version)
+      man.reload()
+    self.assertIs(man.widgets["b"].widget, b)
+    self.assertEqual(b["text"], "B3")
+    self.assertEqual(man.widgets["n"].widget["text"], "N2")
+    self.assertEqual(man.widgets["a"].widget["text"], "A")
+
+  def test_watch(self):
+    """
+    Confirm that the layout is reloaded by the timer and the callback is called under the following conditions.
+    * The layout file is changed while the layout is watched.
+    """
+    man = Generator(self.file, modules=headless.MODULES).get_manager()
+    results = []
+    watcher = man.watch(interval=1, callback=lambda changes, error: results.append((changes, error)))
+    self.assertEqual(watcher.changed(), [])
+    time.sleep(0.01)
+    shutil.copy("tests/definition/reloader_test/after.yml", self.file)
+    os.utime(self.file, ns=(time.time_ns(), time.time_ns() + 10 ** 9))
+    deadline = time.time() + 1
+    while not results and time.time() < deadline:
+      man.window.update()
+    man.unwatch()
+    self.assertEqual(results[0][1], None)
+    self.assertEqual(results[0][0]["created"], 2)
+
+if __name__ == "__main__":
+  unittest.main()
@@ -0,0 +1,66 @@
+import tkinter
+import unittest
+
+from tksugar import headless
+from tksugar.generator import Generator
+
+class Test_Routing(unittest.TestCase):
+  """
+  Tests `TkManager#handler()` and `TkManager#dispatch()`.
+  The headless backend is used, so these tests do not require a display.
+  """
+
+  def tearDown(self):
+    if headless._default_root is not None:
+      headless._default_root.destroy()
+
+  def test_handler(self):
+    """
+    Confirm that the commands are routed to the functions registered for the IDs, the classes and the menu item names,
+    and that the other commands are passed to the command handler under the following conditions.
+    * The functions are registered with the decorator and with the dictionary.
+    * The class is registered with the tkinter class, and the widgets are headless.
+    """
+    calls = []
+    man = Generator("tests/definition/generator_test/routing.yml", modules=headless.MODULES).get_manager(
+      commandhandler=lambda widget, tag: calls.append(("*", tag.id)))
+    @man.handler("save")
+    def _save(widget, tag):
+      calls.append(("save", widget["text"]))
+    man.handlers[tkinter.Checkbutton] = lambda widget, tag: calls.append(("check", widget["text"]))
+    man.handlers["saveas"] = lambda widget, tag: calls.append(("saveas", tag.tag["item"]))
+    man.widgets["save"].performclick()
+    man.widgets["other"].performclick()
+    man.findbyclass("Checkbutton")[0].performclick()
+    menu = man.findbyclass("Menu")[1].widget
+    menu.invoke(1)
+    menu.invoke(0)
+    self.assertEqual(calls, [("save", "Save"), ("*", "other"), ("check", "Check"), ("saveas", "saveas"), ("*", None)])
+
+  def test_without_handler(self):
+    """
+    Confirm that the commands without functions are ignored under the following conditions.
+    * No command handler is passed to `Generator#get_manager()`.
+    """
+    man = Generator("tests/definition/generator_test/routing.yml", modules=headless.MODULES).get_manager()
+    calls = []
+    man.handler("other", lambda widget, tag: calls.append(tag.id))
+    man.widgets["save"].performclick()
+    man.widgets["other"].performclick()
+    self.assertEqual(calls, ["other"])
+
+  def test_reuse(self):
+    """
+    Confirm that the commands are routed to the manager of their own window under the following conditions.
+    * One Generator creates two windows.
+    """
+    gen = Generator("tests/definition/generator_test/routing.yml", modules=headless.MODULES)
+    calls = []
+    man1 = gen.get_manager(commandhandler=lambda widget, tag: calls.append((1, tag.id)))
+    man2 = gen.get_manager(commandhandler=lambda widget, tag: calls.append((2, tag.id)))
+    man1.widgets["other"].performclick()
+    man2.widgets["other"].performclick()
+    self.assertEqual(calls, [(1, "other"), (2, "other")])
+
+if __name__ == "__main__":
+  unittest.main()
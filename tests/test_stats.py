@@ -0,0 +1,63 @@
+import unittest
+
+from tksugar import headless
+from tksugar.generator import Generator
+from tksugar.stats import GeneratorStats
+
+class Test_GeneratorStats(unittest.TestCase):
+  """
+  Tests the instrumentation of the Generator with `GeneratorStats`.
+  The headless backend is used, so these tests do not require a display.
+  """
+
+  def tearDown(self):
+    if headless._default_root is not None:
+      headless._default_root.destroy()
+
+  def test_get_manager(self):
+    """
+    Confirm that the time of each phase and each widget is recorded with the source of the widget,
+    and that the stats are available from the TkManager
+    when the `Generator#get_manager()` method is called under the following conditions.
+    * A `GeneratorStats` object is passed.
+    """
+    stats = GeneratorStats()
+    man = Generator("tests/definition/generator_test/multiple_files.yml", modules=headless.MODULES).get_manager(stats=stats)
+    self.assertIs(man.stats, stats)
+    for phase in ["load", "localize", "scan", "modules", "resolve", "instantiate", "variables", "manager", "total"]:
+      self.assertIn(phase, stats.phases)
+    self.assertGreaterEqual(stats.phases["total"], stats.phases["instantiate"])
+    widgets = [(w.classname, w.id, w.file, w.line) for w in stats.widgets]
+    file = "tests/definition/generator_test/multiple_files.yml"
+    self.assertEqual(widgets, [
+      ("Tk", None, file, 1),
+      ("Frame", None, file, 3),
+      ("Button", "testbutton", file, 5),
+    ])
+    self.assertEqual(stats.by_class()["Button"][0], 1)
+    self.assertIn("testbutton", stats.report())
+
+  def test_callback(self):
+    """
+    Confirm that the callback is called for each phase and each widget under the following conditions.
+    * A `GeneratorStats` object with a callback is passed to `Generator#generate()`.
+    """
+    calls = []
+    stats = GeneratorStats(callback=lambda phase, seconds, widget: calls.append((phase, widget)))
+    Generator("tests/definition/generator_test/children.yml", modules=headless.MODULES).generate(stats=stats)
+    widgets = [w for phase, w in calls if phase == "instantiate"]
+    self.assertEqual(widgets, stats.widgets)
+    self.assertEqual(calls[-1], ("total", None))
+
+  def test_disabled(self):
+    """
+    Confirm that the tree has no source elements and the TkManager has no stats under the following conditions.
+    * No `GeneratorStats` object is passed.
+    """
+    gen = Generator("tests/definition/generator_test/multiple_files.yml", modules=headless.MODULES)
+    tree, unused = gen._prepare()
+    self.assertNotIn("source", tree)
+    self.assertIsNone(gen.get_manager().stats)
+
+if __name__ == "__main__":
+  unittest.main()
@@ -0,0 +1,61 @@
+import copy
+import unittest
+
+from tksugar import headless
+from tksugar.template import LayoutTemplate
+
+class Test_LayoutTemplate(unittest.TestCase):
+  """
+  Tests the `LayoutTemplate` Class
+
+  The test classes of `tests.test_generatorsupport` and the headless backend are used, so no window is displayed.
+  """
+
+  def tearDown(self):
+    if headless._default_root is not None:
+      headless._default_root.destroy()
+
+  def test_instantiate(self):
+    """
+    Confirm that independent objects are created
+    when `LayoutTemplate#instantiate()` is called repeatedly under the following conditions.
+    * The owner object implements `GeneratorSupport#append_child()`.
+    """
+    template = LayoutTemplate("tests/definition/generator_test/support_haschild.yml", modules=["tests.test_generatorsupport"])
+    man1 = template.instantiate()
+    man2 = template.instantiate()
+    self.assertIsNot(man1.window, man2.window)
+    self.assertEqual(man1.window.children[0]["obj"].a, 1)
+    self.assertEqual(man2.window.children[0]["obj"].a, 1)
+    self.assertIsNot(man1.window.children[0]["obj"], man2.window.children[0]["obj"])
+
+  def test_immutable(self):
+    """
+    Confirm that the scanned tree is not modified
+    when `LayoutTemplate#instantiate()` is called under the following conditions.
+    * The owner object implements `GeneratorSupport#append_child()`.
+    """
+    template = LayoutTemplate("tests/definition/generator_test/support_haschild.yml", modules=["tests.test_generatorsupport"])
+    tree = copy.deepcopy(template._tree)
+    template.instantiate()
+    self.assertEqual(template._tree, tree)
+
+  def test_command(self):
+    """
+    Confirm that the commands of each instance are routed to its own handlers and command handler
+    when `LayoutTemplate#instantiate()` is called under the following conditions.
+    * A command handler is passed, and a function is registered for an ID.
+    """
+    template = LayoutTemplate("tests/definition/generator_test/routing.yml", modules=headless.MODULES)
+    calls = []
+    man1 = template.instantiate(command=lambda widget, tag: calls.append((1, tag.id)))
+    man2 = template.instantiate(command=lambda widget, tag: calls.append((2, tag.id)))
+    man1.handler("save", lambda widget, tag: calls.append((1, "save")))
+    self.assertIsNotNone(man1.generator)
+    man1.widgets["save"].performclick()
+    man1.widgets["other"].performclick()
+    man2.widgets["save"].performclick()
+    self.assertEqual(calls, [(1, "save"), (1, "other"), (2, "save")])
+
+if __name__ == "__main__":
+  unittest.main()
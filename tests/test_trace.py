@@ -0,0 +1,79 @@
+import unittest
+
+from tksugar import headless
+from tksugar.generator import Generator
+from tksugar.template import LayoutTemplate
+
+class Test_Trace(unittest.TestCase):
+  """
+  Tests `TkManager#on_change()` and `TkManager#coalesce`.
+  The headless backend is used, so these tests do not require a display.
+  """
+
+  def tearDown(self):
+    if headless._default_root is not None:
+      headless._default_root.destroy()
+
+  def test_on_change(self):
+    """
+    Confirm that the registered functions are called only for their variables,
+    and are called synchronously with the trace handler under the following conditions.
+    * A function is registered with the decorator and another function is registered and unregistered.
+    """
+    man = Generator("tests/definition/generator_test/variable.yml", modules=headless.MODULES).get_manager()
+    calls = []
+    man.trace_handler = lambda obj, name: calls.append(("all", name))
+    @man.on_change("test2")
+    def _changed(obj, name):
+      calls.append((name, obj.get()))
+    removed = man.on_change("test2", lambda obj, name: calls.append("removed"))
+    man.off_change("test2", removed)
+    man.vars["test1"].set("a")
+    man.vars["test2"].set(5)
+    self.assertEqual(calls, [("all", "test1"), ("all", "test2"), ("test2", 5)])
+
+  def test_coalesce(self):
+    """
+    Confirm that the writes are dispatched once per variable in an idle callback,
+    and that the batch handler receives the final values under the following conditions.
+    * `TkManager#coalesce` is True.
+    * The variables are written many times before the main loop becomes idle.
+    """
+    man = Generator("tests/definition/generator_test/variable.yml", modules=headless.MODULES).get_manager()
+    man.coalesce = True
+    calls = []
+    batches = []
+    man.on_change("test2", lambda obj, name: calls.append(obj.get()))
+    man.batch_handler = batches.append
+    for i in range(200):
+      man.vars["test2"].set(i)
+      man.vars["test1"].set(str(i))
+    self.assertEqual(calls, [])
+    man.window.update()
+    self.assertEqual(calls, [199])
+    self.assertEqual(batches, [{"test2": 199, "test1": "199"}])
+    man.window.update()
+    self.assertEqual(len(batches), 1)
+
+  def test_template(self):
+    """
+    Confirm that the handlers receive the declared names of the variables under the following conditions.
+    * The window is an instance of `LayoutTemplate`, so the Tcl names of the variables are generated.
+    * `TkManager#coalesce` is True for the second write.
+    """
+    man = LayoutTemplate("tests/definition/generator_test/variable.yml", modules=headless.MODULES).instantiate()
+    self.assertNotEqual(str(man.vars["test1"]), "test1")
+    calls = []
+    batches = []
+    man.trace_handler = lambda obj, name: calls.append(("all", name))
+    man.on_change("test1", lambda obj, name: calls.append((name, obj.get())))
+    man.batch_handler = batches.append
+    man.vars["test1"].set("a")
+    man.coalesce = True
+    man.vars["test1"].set("b")
+    man.window.update()
+    self.assertEqual(calls, [("all", "test1"), ("test1", "a"), ("all", "test1"), ("test1", "b")])
+    self.assertEqual(batches, [{"test1": "b"}])
+
+if __name__ == "__main__":
+  unittest.main()
@@ -0,0 +1,156 @@
+import tkinter
+import unittest
+
+from tksugar import headless
+from tksugar.generator import Generator
+from tksugar.template import LayoutTemplate
+from tksugar.tkmanager import TagData
+from tksugar.widgetindex import WidgetIndex
+
+BIND = """
+proc bind {tag sequence args} {
+  global bindings
+  if {[llength $args] == 0} {
+    if {[info exists bindings($tag,$sequence)]} { return $bindings($tag,$sequence) }
+    return ""
+  }
+  set script [lindex $args 0]
+  if {[string index $script 0] eq "+"} {
+    set script [string range $script 1 end]
+    if {[info exists bindings($tag,$sequence)] && $bindings($tag,$sequence) ne ""} {
+      set script "$bindings($tag,$sequence)\n$script"
+    }
+  }
+  set bindings($tag,$sequence) $script
+}
+proc destroy {args} {}
+"""
+"""
+The `bind` and `destroy` commands of Tk for the Tcl interpreter without Tk. The bound scripts are kept.
+"""
+
+class Test_WidgetIndex(unittest.TestCase):
+  """
+  Tests the widget lookups of `Generator` and `TkManager`.
+  The headless backend is used, so these tests do not require a display.
+  """
+
+  def setUp(self):
+    self.man = Generator("tests/definition/generator_test/selector.yml", modules=headless.MODULES).get_manager()
+
+  def tearDown(self):
+    if headless._default_root is not None:
+      headless._default_root.destroy()
+
+  def ids(self, widgets):
+    return [t.id for t in widgets]
+
+  def test_lookup(self):
+    """
+    Confirm that the widgets are found by ID, by class name and by tag key under the following conditions.
+    * Two widgets have the same ID.
+    * The tags are a dict and a string.
+    """
+    man = self.man
+    self.assertEqual(man.findbyid("dup").widget.cget("text"), "Body")
+    self.assertIs(type(man.findbyid("dup").widget), headless.Button)
+    self.assertIs(man.widgets["dup"], man.findbyid("dup"))
+    self.assertEqual([type(t.widget) for t in man.findallbyid("dup")], [headless.Button, headless.Label])
+    self.assertEqual(self.ids(man.findbyclass("Button")), ["new", "open", "nested", "dup"])
+    self.assertEqual(len(man.findbyclass("Frame")), 3)
+    self.assertEqual(self.ids(man.findbytag("editable")), ["new", "dup"])
+    self.assertIsNone(man.findbyid("unknown"))
+
+  def test_select(self):
+    """
+    Confirm that `TkManager#select()` returns the widgets that match the selector under the following conditions.
+    * Descendant and child combinators, IDs, class names and tag keys are used.
+    """
+    man = self.man
+    self.assertEqual(self.ids(man.select("#toolbar Button")), ["new", "open", "nested"])
+    self.assertEqual(self.ids(man.select("#toolbar > Button")), ["new", "open"])
+    self.assertEqual(self.ids(man.select("Frame>.editable")), ["new", "dup"])
+    self.assertEqual(self.ids(man.select("#body Label.editable#dup")), ["dup"])
+    self.assertEqual(len(man.select("*")), 9)
+    with self.assertRaises(ValueError):
+      man.select("#toolbar >")
+
+  def test_destroy(self):
+    """
+    Confirm that the widgets are removed from the indexes under the following conditions.
+    * A frame that contains widgets is destroyed.
+    """
+    man = self.man
+    man.findbyid("toolbar").widget.destroy()
+    self.assertIsNone(man.findbyid("new"))
+    self.assertNotIn("toolbar", man.widgets)
+    self.assertEqual(self.ids(man.findbyclass("Button")), ["dup"])
+    self.assertEqual(self.ids(man.findbytag("editable")), ["dup"])
+    self.assertEqual(man.select("#toolbar Button"), [])
+
+  def test_unwatch(self):
+    """
+    Confirm that the event handlers bound to all widgets are unbound when the windows are destroyed
+    under the following conditions.
+    * 50 toplevel windows are instantiated from a template and destroyed.
+    """
+    root = self.man.window
+    count = len(root._bindall["<Destroy>"])
+    template = LayoutTemplate("tests/definition/generator_test/toplevel.yml", modules=headless.MODULES)
+    for i in range(50):
+      man = template.instantiate(master=root)
+      button = man.widgets["button"].widget
+      man.window.destroy()
+      self.assertNotIn(button, man.index)
+    self.assertEqual(len(root._bindall["<Destroy>"]), count)
+
+  def test_unwatch_tcl(self):
+    """
+    Confirm that only the script bound by `WidgetIndex#watch()` is removed from the bindings of all widgets
+    under the following conditions.
+    * The Tcl interpreter is used, and the `bind` command is defined by Tcl.
+    * Other scripts are bound before and after it, and one of them contains the name of the event handler.
+    """
+    tcl = tkinter.Tcl()
+    try:
+      tcl.tk.eval(BIND)
+      first = tcl.bind_all("<Destroy>", lambda e: None)
+      index = WidgetIndex()
+      index.watch(tcl)
+      funcid = index._watching["."][1]
+      user = f"set unused {{{funcid}}}"
+      tcl.tk.call("bind", "all", "<Destroy>", "+" + user)
+      WidgetIndex._unwatch(*index._watching.pop("."))
+      script = tcl.tk.call("bind", "all", "<Destroy>")
+      self.assertIn(f"{first} %#", script)
+      self.assertNotIn(f"{funcid} %#", script)
+      self.assertTrue(script.endswith("\n" + user))
+    finally:
+      tcl.destroy()
+
+  def test_assign(self):
+    """
+    Confirm that the widgets set to `TkManager#widgets` are found by the IDs,
+    and that the deleted IDs are not found under the following conditions.
+    * A widget that has not been added and a widget that has been added with another ID are set.
+    * An ID is deleted.
+    """
+    man = self.man
+    label = TagData(headless.Label(man.window, text="New"))
+    man.widgets["label"] = label
+    man.widgets["first"] = man.widgets["open"]
+    self.assertIs(man.findbyid("label"), label)
+    self.assertEqual(self.ids(man.findbyclass("Label")), ["dup", "label"])
+    self.assertNotIn("open", man.widgets)
+    self.assertEqual(man.widgets["first"].widget.cget("text"), "Open")
+    man.widgets["dup"] = man.widgets["new"]
+    self.assertEqual(man.widgets["dup"].widget.cget("text"), "New")
+    del man.widgets["toolbar"]
+    self.assertNotIn("toolbar", man.widgets)
+    self.assertIsNone(man.findbyid("toolbar"))
+    self.assertEqual(self.ids(man.select("Frame Button")), ["dup", "first", "nested", "dup"])
+    label.widget.destroy()
+    self.assertNotIn("label", man.widgets)
+
+if __name__ == "__main__":
+  unittest.main()
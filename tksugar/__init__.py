@@ -1,3 +1,14 @@
 __version__ = "0.1.3"
-from tksugar.generator import Generator
 from tksugar.tkmanager import TkManager
+from tksugar.stats import GeneratorStats
+
+def __getattr__(name):
+  # Generator and LayoutTemplate are imported on first use, so that the modules generated by `tksugar.compile`
+  # can be run without importing PyYAML.
+  if name == "Generator":
+    from tksugar.generator import Generator
+    return Generator
+  if name == "LayoutTemplate":
+    from tksugar.template import LayoutTemplate
+    return LayoutTemplate
+  raise AttributeError(f"module 'tksugar' has no attribute '{name}'")
@@ -0,0 +1,198 @@
+"""
+The argument table of the widget constructors used by `tksugar.Generator`.
+
+The argument list of a constructor is collected from its signature and from its document comment,
+which is costly, so the result is kept for each constructor.
+The table for the stock `tkinter` and `tkinter.ttk` classes can be saved as `argtable.json` in this package
+by running `python -m tksugar.argtable` on each supported Python version.
+Each entry is keyed by the qualified name of the constructor and a hash of its parameter names and document comment,
+which are all the argument list depends on.
+So one saved table can be shared by every Python version,
+and the entries whose document comments differ in the running version are simply not used.
+"""
+import hashlib
+import importlib
+import inspect
+import json
+from pathlib import Path
+import re
+import sys
+
+TABLE_FILE = Path(__file__).parent / "argtable.json"
+STOCK_MODULES = ["tkinter", "tkinter.ttk"]
+
+_table = {}
+_prebuilt = None
+
+def get_argnames(method):
+  """
+  Get method argument list.
+  The result is kept for each method for the life of the process.
+
+  Parameters
+  ----
+  method: func
+    Function object.
+
+  Returns
+  ----
+  arglist: list(str)
+    Argument list. Do not modify the returned list.
+  """
+  global _prebuilt
+  try:
+    return _table[method]
+  except KeyError:
+    pass
+  except TypeError:
+    # Unhashable objects are not kept.
+    return parse_argnames(method)
+  if _prebuilt is None:
+    _prebuilt = load()
+  result = _prebuilt.get(make_key(method))
+  if result is None:
+    result = parse_argnames(method)
+  _table[method] = result
+  return result
+
+def parse_argnames(method):
+  """
+  Get method argument list.
+  If the document comment includes "STANDARD OPTIONS" and "WIDGET-SPECIFIC" OPTIONS,
+  use that as the argument list.
+
+  Parameters
+  ----
+  method: func
+    Function object.
+
+  Returns
+  ----
+  arglist: list(str)
+    Argument list.
+  """
+  result = []
+  # add inspect result
+  for p in filter(lambda p: p.kind == p.POSITIONAL_OR_KEYWORD, inspect.signature(method).parameters.values()):
+    result.append(p.name)
+
+  # add comment args
+  lines = method.__doc__.split("\n") if method.__doc__ else []
+  i = 0
+  collect = False
+  while i < len(lines):
+    if collect:
+      if lines[i] == "":
+        collect = False
+      else:
+        for p in filter(lambda x: x, re.split(r"[\s,]", lines[i].strip())):
+          result.append(p.strip())
+    else:
+      if "STANDARD OPTIONS" in lines[i] or "WIDGET-SPECIFIC OPTIONS" in lines[i]:
+        collect = True
+        i += 1
+      if "Valid resource names:" in lines[i]:
+        collect = True
+        lines[i] = lines[i].split(":")[1]
+        i -= 1
+    i += 1
+  return result
+
+def make_key(method):
+  """
+  Get the key of the method in the saved table.
+
+  Parameters
+  ----
+  method: func
+    Function object.
+
+  Returns
+  ----
+  key: str|None
+    The qualified name of the method followed by the hash of its parameter names and document comment.
+    None if the method is not a plain function.
+  """
+  module = getattr(method, "__module__", None)
+  qualname = getattr(method, "__qualname__", None)
+  code = getattr(method, "__code__", None)
+  if not module or not qualname or code is None:
+    return None
+  # Same as the POSITIONAL_OR_KEYWORD parameters collected by parse_argnames().
+  params = code.co_varnames[getattr(code, "co_posonlyargcount", 0):code.co_argcount]
+  h = hashlib.sha256()
+  h.update(",".join(params).encode("UTF-8"))
+  h.update(b"\0")
+  h.update((method.__doc__ or "").encode("UTF-8"))
+  return f"{module}.{qualname}:{h.hexdigest()[:16]}"
+
+def build(modules=STOCK_MODULES):
+  """
+  Create the argument table of the constructors of all classes in the modules.
+
+  Parameters
+  ----
+  modules: list[str]
+    Module names.
+
+  Returns
+  ----
+  table: dict[str, list[str]]
+    A dictionary object that associates the keys of the constructors with the argument lists, see `make_key()`.
+  """
+  table = {}
+  for name in modules:
+    module = importlib.import_module(name)
+    for unused, cls in inspect.getmembers(module, inspect.isclass):
+      if not inspect.isfunction(cls.__init__) or not cls.__init__.__module__ in modules:
+        continue
+      key = make_key(cls.__init__)
+      if key is not None and not key in table:
+        table[key] = parse_argnames(cls.__init__)
+  return table
+
+def save(path=TABLE_FILE, modules=STOCK_MODULES):
+  """
+  Create the argument table and save it to the file.
+  The entries already saved in the file are kept,
+  so running this on each supported Python version collects the entries of all of them.
+
+  Parameters
+  ----
+  path: str
+    File path.
+  modules: list[str]
+    Module names.
+  """
+  table = load(path)
+  table.update(build(modules))
+  data = {
+    "table": table,
+  }
+  with open(path, "w", encoding="UTF-8") as f:
+    json.dump(data, f, indent=2, sort_keys=True)
+
+def load(path=TABLE_FILE):
+  """
+  Read the saved argument table.
+
+  Parameters
+  ----
+  path: str
+    File path.
+
+  Returns
+  ----
+  table: dict[str, list[str]]
+    The argument table.
+    If the file does not exist, an empty table is returned.
+  """
+  try:
+    with open(path, "r", encoding="UTF-8") as f:
+      data = json.load(f)
+  except (OSError, ValueError):
+    return {}
+  return data.get("table", {})
+
+if __name__ == "__main__":
+  save(sys.argv[1] if len(sys.argv) > 1 else TABLE_FILE)
@@ -0,0 +1,340 @@
+"""
+Compiles a layout file into a Python module.
+
+The generated module has a `build(command=None)` function that returns the same `TkManager`
+as `Generator#get_manager()`, whose commands are routed by `TkManager#dispatch()`.
+The layout is read, localized and scanned, the classes are resolved and the parameters are split
+when the module is generated, so the generated module does not use PyYAML, the Localizer
+or the reflection of `Generator` at runtime.
+The untranslated parameters are kept in the module, so the window can be translated again by `TkManager#set_language()`.
+The window cannot be reloaded by `TkManager#reload()` or `TkManager#watch()`, because it has no Generator.
+
+```
+python -m tksugar.compile layout.yml layout.py
+```
+"""
+import argparse
+import inspect
+import keyword
+from pathlib import Path
+
+from tksugar.generator import Generator, TemporaryVariable
+from tksugar.widgets.generatorsupport import GeneratorSupport
+
+HEADER = '''"""
+This module was generated by tksugar.compile from {source}.
+Do not edit this file directly, edit the layout file and compile it again.
+"""
+{imports}
+from tksugar.eventreciever import EventReciever
+from tksugar.tkmanager import TagData, TkManager
+from tksugar.widgetindex import WidgetIndex
+
+def _tagdata(tags, obj, command, parent=None, localized=None, localizedfields=None):
+  tagdata = TagData(obj)
+  tagdata.callback = command
+  tagdata.parent = parent
+  tagdata.localized = localized
+  tagdata.localizedfields = localizedfields
+  tags.append(tagdata)
+  return tagdata
+
+def _set(obj, name, value):
+  attr = getattr(obj, name)
+  if callable(attr):
+    attr() if value is None else attr(value)
+  else:
+    setattr(obj, name, value)
+
+def _bind_command(obj, tagdata, command):
+  try:
+    if not command is None:
+      resv = EventReciever(obj, tagdata, command)
+      if "command" in dir(obj):
+        setattr(obj, "command", resv)
+      else:
+        obj["command"] = resv
+  except tkinter.TclError:
+    pass
+
+def build(command=None):
+  """
+  Create the window.
+
+  Parameters
+  ----
+  command: func
+    An event handler for processing commands for widgets with the ::command element set.
+    It is registered with `TkManager#handlers` as "*", see `TkManager#dispatch()`.
+
+  Returns
+  ----
+  manager: TkManager
+    A TkManager object that contains a window object.
+  """
+  widgets = []
+  tags = []
+  vars = {{}}
+  manager = None
+
+  def dispatch(obj, tagdata):
+    if manager is not None:
+      return manager.dispatch(obj, tagdata)
+'''
+
+class LayoutCompiler(object):
+  """
+  Converts the tree scanned by `Generator` into the source code of a Python module.
+  """
+  def __init__(self, generator):
+    """
+    Constructor
+
+    Parameters
+    ----
+    generator: Generator
+      The Generator object that reads the layout file.
+    """
+    self._generator = generator
+    self._imports = {"tkinter"}
+    self._lines = []
+    self._count = 0
+    self._indent = 1
+
+  def compile(self, source=""):
+    """
+    Compile the layout.
+
+    Parameters
+    ----
+    source: str
+      The name of the layout file that is written in the document comment of the module.
+
+    Returns
+    ----
+    code: str
+      Source code of the Python module.
+    """
+    tree, vars = self._generator._prepare()
+    modules = self._generator._load_modules()
+    # Load Root Object
+    cls = Generator._load_class(modules, tree["classname"])
+    root = self._widget(cls, tree, None, None, None)
+    # Load Variable
+    # The variable class with the same name in the modules takes precedence, as `Generator#_build()` does.
+    index = Generator._get_class_index(modules)
+    for n, v in vars.items():
+      self._emit(f"vars[{n!r}] = {self._classref(index.get(v['class'].__name__, v['class']))}(master={root}, name={n!r})")
+      if not v["default"] is None:
+        self._emit(f"vars[{n!r}].set({v['default']!r})")
+    # Load Child Object
+    self._children(tree["children"], root, cls, modules)
+    self._emit(f"manager = TkManager({root}, widgets, vars, WidgetIndex(tags))")
+    self._emit("if command is not None: manager.handlers['*'] = command")
+    self._emit("return manager")
+    imports = "\n".join(f"import {m}" for m in sorted(self._imports))
+    return HEADER.format(source=source or "a string", imports=imports) + "\n".join(self._lines) + "\n"
+
+  def _children(self, children, owner, ownercls, modules):
+    """
+    Write the code that creates the child objects.
+    """
+    for i in children:
+      cls = Generator._load_class(modules, i["classname"])
+      name = self._widget(cls, i, owner, ownercls, _tagname(owner))
+      if not i["children"]:
+        continue
+      if ownercls is None or not issubclass(ownercls, GeneratorSupport):
+        self._children(i["children"], name, cls, modules)
+        continue
+      # The owner may defer the creation of the child elements.
+      self._emit(f"def _children_{name}():")
+      self._indent += 1
+      self._emit("start = len(widgets)")
+      self._emit("created = len(tags)")
+      self._children(i["children"], name, cls, modules)
+      self._emit("if manager is not None:")
+      self._indent += 1
+      self._emit("for tagdata in tags[created:]: manager.index.add(tagdata)")
+      self._emit("manager.add_widgets(widgets[start:])")
+      self._emit("manager.relocalize(tags[created:])")
+      self._indent -= 1
+      self._indent -= 1
+      self._emit(f"if not {owner}.defer_children({name}, _children_{name}): _children_{name}()")
+
+  def _widget(self, cls, node, owner, ownercls, ownertag):
+    """
+    Write the code that creates an object in the same way as `Generator#_instantiate()`.
+
+    Returns
+    ----
+    name: str
+      The name of the local variable that holds the object.
+    """
+    params = dict(node["params"])
+    support = ownercls is not None and issubclass(ownercls, GeneratorSupport)
+    if owner is not None and not support:
+      params["master"] = Symbol(owner)
+    initparams, others = Generator._split_params(cls.__init__, params)
+    name = f"w{self._count}"
+    tag = _tagname(name)
+    self._count += 1
+    args = [f"{n}={self._literal(v, owner)}" for n, v in initparams.items() if isname(n)]
+    others_args = {n: v for n, v in initparams.items() if not isname(n)}
+    if others_args:
+      args.append(f"**{self._literal(others_args, owner)}")
+    args = ", ".join(args)
+    self._emit(f"# {cls.__name__}")
+    self._emit(f"{name} = {self._classref(cls)}({args})")
+    tagargs = [f"{name}", "dispatch"]
+    if ownertag is not None or "localized" in node:
+      tagargs.append(str(ownertag))
+    if "localized" in node:
+      tagargs.append(self._literal(node["localized"], owner))
+      if node.get("localizedfields") is not None:
+        tagargs.append(self._literal(node["localizedfields"], owner))
+    self._emit(f"{tag} = _tagdata(tags, {', '.join(tagargs)})")
+    postactions = []
+    hasdata = False
+    for n, v in others.items():
+      if n.startswith("::"):
+        command = n[2:]
+        if command == "id":
+          self._emit(f"{tag}.id = {str(v)!r}")
+          hasdata = True
+        elif command == "tag":
+          self._emit(f"{tag}.tag = {self._literal(v, owner)}")
+          hasdata = True
+        elif command == "command":
+          self._emit(f"_bind_command({name}, {tag}, dispatch)")
+        elif command in ("gridcolumn", "gridrow"):
+          value = dict(v)
+          index = value.pop("index")
+          postactions.append(f"{name}.grid_{command[4:]}configure({index!r}, {self._literal(value, owner)})")
+        else:
+          raise NameError("Command Not Found('{0}')".format(command))
+      elif n.startswith("/"):
+        pass
+      elif inspect.isroutine(getattr(cls, n, None)) and isname(n):
+        self._emit(f"{name}.{n}()" if v is None else f"{name}.{n}({self._literal(v, owner)})")
+      elif hasattr(cls, n) and isname(n):
+        self._emit(f"{name}.{n} = {self._literal(v, owner)}")
+      else:
+        self._emit(f"_set({name}, {n!r}, {self._literal(v, owner)})")
+    for action in postactions:
+      self._emit(action)
+    if support:
+      childparam = {n[1:]: v for n, v in params.items() if n.startswith("/")}
+      self._emit(f"{owner}.append_child({name}, **{self._literal(childparam, owner)})")
+    if hasdata:
+      self._emit(f"if {tag}.hasdata(): widgets.append({tag})")
+    return name
+
+  def _classref(self, cls):
+    """
+    Get the expression that refers to the class, and add its module to the imports.
+    """
+    self._imports.add(cls.__module__)
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+  def _literal(self, value, owner):
+    """
+    Get the expression of the value.
+
+    Raises
+    ----
+    ValueError
+      The value cannot be written in the source code.
+    """
+    if type(value) is TemporaryVariable:
+      if owner is None:
+        raise ValueError("Variables cannot be used in the root widget.")
+      return f"vars[{value.name!r}]"
+    elif type(value) is Symbol:
+      return str(value)
+    elif type(value) is dict:
+      return "{" + ", ".join(f"{self._literal(k, owner)}: {self._literal(v, owner)}" for k, v in value.items()) + "}"
+    elif type(value) is list:
+      return "[" + ", ".join(self._literal(v, owner) for v in value) + "]"
+    elif value is None or type(value) in (str, int, float, bool):
+      return repr(value)
+    raise ValueError(f"The value cannot be compiled. {value!r}")
+
+  def _emit(self, line):
+    """
+    Add a line to the body of the build function.
+    """
+    self._lines.append("  " * self._indent + line)
+
+def _tagname(name):
+  """
+  Get the name of the local variable that holds the TagData of the object.
+  """
+  return f"t{name[1:]}"
+
+def isname(name):
+  """
+  True if the string can be written in the source code as a name.
+  """
+  return name.isidentifier() and not keyword.iskeyword(name)
+
+class Symbol(str):
+  """
+  A string that is written in the source code as it is.
+  """
+  pass
+
+def compile_layout(file, modules=["tksugar.widgets", "tkinter"], localization_file="", encoding="UTF-8"):
+  """
+  Compile the layout file into the source code of a Python module.
+
+  Parameters
+  ----
+  file: str
+    A file path describing the window's object and layout.
+  modules: list[str]
+    An array indicating the name of the module to be used.
+  localization_file: str
+    Path indicating a YAML-formatted dictionary file used for UI localization.
+    The layout is localized when it is compiled.
+  encoding: str
+    File Encoding.
+
+  Returns
+  ----
+  code: str
+    Source code of the Python module.
+  """
+  gen = Generator(file, modules=list(modules), localization_file=localization_file, encoding=encoding)
+  return LayoutCompiler(gen).compile(Path(file).as_posix())
+
+def compile_file(file, output, modules=["tksugar.widgets", "tkinter"], localization_file="", encoding="UTF-8"):
+  """
+  Compile the layout file and write the Python module.
+
+  Parameters
+  ----
+  file: str
+    A file path describing the window's object and layout.
+  output: str
+    The path of the Python module to write.
+  modules: list[str]
+    An array indicating the name of the module to be used.
+  localization_file: str
+    Path indicating a YAML-formatted dictionary file used for UI localization.
+  encoding: str
+    File Encoding.
+  """
+  code = compile_layout(file, modules, localization_file, encoding)
+  with open(output, "w", encoding="UTF-8") as f:
+    f.write(code)
+
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser(prog="python -m tksugar.compile", description="Compile a layout file into a Python module.")
+  parser.add_argument("file", help="layout file")
+  parser.add_argument("output", help="Python module to write")
+  parser.add_argument("-m", "--module", action="append", dest="modules", help="module to be used (can be repeated)")
+  parser.add_argument("-l", "--localization", default="", help="localization file")
+  parser.add_argument("-e", "--encoding", default="UTF-8", help="file encoding")
+  args = parser.parse_args()
+  compile_file(args.file, args.output, args.modules or ["tksugar.widgets", "tkinter"], args.localization, args.encoding)
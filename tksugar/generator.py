@@ -1,54 +1,60 @@
+from concurrent.futures import Future, ThreadPoolExecutor
 import importlib
 import inspect
+import os
 from pathlib import Path
-import tkinter
 import re
+import time
+import tkinter
 from typing import Type
 
 import yaml
 from yamlinclude import YamlIncludeConstructor
+from yamlinclude.readers import YamlReader, get_reader_class_by_path
 
-from tksugar.tkmanager import TkManager
+from tksugar import argtable
+from tksugar.tkmanager import TagData, TkManager
+from tksugar.stats import GeneratorStats, WidgetStat
+from tksugar.widgetindex import WidgetIndex
 from tksugar.localizer import Localizer
+from tksugar.layoutcache import LayoutCache
 from tksugar.widgets.generatorsupport import GeneratorSupport
 from tksugar.eventreciever import EventReciever
 
-class TagData(object):
-  """
-  An object that represents additional data for the widget.
-  In TkManager, it is used to link the TkManager ID and the widget.
-  """
-  def __init__(self, widget):
-    """
-    Constructor
-
-    Parameters
-    ----
-    widget: object
-      Tk widget.
-    """
-    self.widget = widget
-    self.id = None
-    self.tag= None
-    self.callback = None
+PLACEHOLDER = re.compile(r"\{(\w+)\}")
+"""
+The placeholder in the template of the `::foreach` node.
+"""
 
-  def hasdata(self):
-    """
-    True if there is data.
+def substitute(value, fields):
+  """
+  Replace `{name}` in the strings of the value with the fields, as the `::foreach` node does.
+  If the whole string is a single `{name}`, it is replaced with the value itself, keeping its type.
 
-    Returns
-    ----
-    hasdata: bool
-      True if there is data
-    """
-    return self.id or self.tag
+  Parameters
+  ----
+  value: Any
+    A string, or a dict or list containing strings.
+  fields: dict[str, Any]
+    The values of the names.
 
-  def performclick(self):
-    """
-    If the button has a command, execute it.
-    """
-    if self.callback is not None:
-      self.callback(self.widget, self)
+  Returns
+  ----
+  value: Any
+    The replaced value. Dicts and lists are copied.
+  """
+  if type(value) is str:
+    if not "{" in value:
+      return value
+    m = PLACEHOLDER.fullmatch(value)
+    if m and m.group(1) in fields:
+      return fields[m.group(1)]
+    return PLACEHOLDER.sub(lambda m: str(fields[m.group(1)]) if m.group(1) in fields else m.group(0), value)
+  elif type(value) is dict:
+    return {n: substitute(v, fields) for n, v in value.items()}
+  elif type(value) is list:
+    return [substitute(v, fields) for v in value]
+  return value
 
 class TemporaryVariable(object):
   """
@@ -58,16 +64,48 @@ class TemporaryVariable(object):
   def __init__(self, name):
     self.name = name
 
-class GeneratorLoader(yaml.SafeLoader):
+  def __eq__(self, other):
+    return type(other) is TemporaryVariable and other.name == self.name
+
+  def __hash__(self):
+    return hash(self.name)
+
+class GeneratorLoaderBase(object):
   """
-  YAML Loader used in Generator.
-  A custom tag reading process is added.
+  The custom tag reading process of the YAML Loader used in Generator.
+  This class is combined with the loader class of PyYAML.
   """
-  def __init__(self, stream):
+  def __init__(self, stream, base_dir=""):
+    """
+    Constructor
+
+    Parameters
+    ----
+    stream: str|file
+      YAML document.
+    base_dir: str
+      The directory from which the `!include` file paths are resolved.
+      If omitted, the paths are resolved from the current directory.
+    """
     super().__init__(stream)
     self.vars = {}
-    yaml.add_multi_constructor("tag:yaml.org,2002:var", GeneratorLoader.var_handler,
-      Loader=GeneratorLoader)
+    self.base_dir = base_dir
+    self.includes = []
+    self.source_name = None
+    self.source_marks = None
+
+  @staticmethod
+  def map_handler(loader, node):
+    """
+    A handler that constructs a mapping.
+    If `source_marks` is a dict, the file and line of each key are recorded in it by the id of the mapping.
+    """
+    data = {}
+    if loader.source_marks is not None:
+      name = loader.source_name or node.start_mark.name
+      loader.source_marks[id(data)] = {k.value: (name, k.start_mark.line + 1) for k, unused in node.value if type(k.value) is str}
+    yield data
+    data.update(loader.construct_mapping(node))
 
   @staticmethod
   def var_handler(loader, suffix, node=None):
@@ -88,6 +126,132 @@ class GeneratorLoader(yaml.SafeLoader):
     else:
       raise ValueError("The variable name is not set.")
 
+class GeneratorIncludeConstructor(YamlIncludeConstructor):
+  """
+  `!include` constructor used in GeneratorLoader.
+  The included file paths are resolved from the `base_dir` of each loader,
+  and the variables declared and files included in the included file are passed on to the including loader.
+
+  The included YAML files are parsed once and shared by all includes and all Generator objects,
+  until the file or any file it includes is modified.
+  Each include gets its own copy of the parsed data, so changing it does not change the shared data.
+  The files are parsed every time while the sources of the widgets are recorded, see `GeneratorStats`.
+  """
+  _fragments = {}
+
+  def load(self, loader, pathname, *args, **kwargs):
+    if loader.base_dir:
+      pathname = os.path.join(loader.base_dir, pathname)
+    return super().load(loader, pathname, *args, **kwargs)
+
+  def _read_file(self, path, loader, encoding):
+    path = os.path.abspath(path)
+    loader.includes.append(path)
+    if get_reader_class_by_path(path, self._reader_map) is not YamlReader:
+      return super()._read_file(path, loader, encoding)
+    key = (path, encoding, loader.base_dir, type(loader))
+    cacheable = loader.source_marks is None
+    if cacheable:
+      entry = GeneratorIncludeConstructor._fragments.get(key)
+      if entry is not None and all(_filestamp(p) == stamp for p, stamp in entry["stamps"]):
+        loader.vars.update(entry["vars"])
+        loader.includes.extend(entry["includes"])
+        return _copydata(entry["data"])
+      stamp = _filestamp(path)
+    with open(path, "r", encoding=encoding) as f:
+      sub = type(loader)(f, base_dir=loader.base_dir)
+      sub.source_marks = loader.source_marks
+      try:
+        data = sub.get_single_data()
+      finally:
+        sub.dispose()
+    loader.vars.update(sub.vars)
+    loader.includes.extend(sub.includes)
+    if cacheable:
+      GeneratorIncludeConstructor._fragments[key] = {
+        "stamps": [(path, stamp)] + [(p, _filestamp(p)) for p in dict.fromkeys(sub.includes)],
+        "data": _copydata(data),
+        "vars": dict(sub.vars),
+        "includes": list(sub.includes),
+      }
+    return data
+
+  @staticmethod
+  def clear_cache():
+    """
+    Discard all parsed files kept by the constructor.
+    """
+    GeneratorIncludeConstructor._fragments.clear()
+
+def _filestamp(path):
+  """
+  Get the modification time and the size of the file. None if the file does not exist.
+  """
+  try:
+    st = os.stat(path)
+  except OSError:
+    return None
+  return (st.st_mtime_ns, st.st_size)
+
+def _copydata(value):
+  """
+  Copy the dicts and lists of the data read from YAML. The other values are not changed by the Generator, so they are shared.
+  """
+  if type(value) is dict:
+    return {k: _copydata(v) for k, v in value.items()}
+  elif type(value) is list:
+    return [_copydata(v) for v in value]
+  return value
+
+def _count(node):
+  """
+  Count the nodes of the scanned tree.
+  """
+  return 1 + sum(_count(c) for c in node["children"])
+
+class GeneratorLoader(GeneratorLoaderBase, yaml.SafeLoader):
+  """
+  YAML Loader used in Generator.
+  It is a pure Python implementation and can be used in any environment.
+  """
+  pass
+
+CGeneratorLoader = None
+if getattr(yaml, "CSafeLoader", None) is not None:
+  class CGeneratorLoader(GeneratorLoaderBase, yaml.CSafeLoader):
+    """
+    YAML Loader used in Generator.
+    It is implemented by libyaml and can only be used if PyYAML is built with libyaml.
+    """
+    def __init__(self, stream, base_dir=""):
+      super().__init__(stream, base_dir)
+      self._stream = stream
+
+    def get_single_data(self):
+      """
+      Read the document.
+      If the document has a syntax error, it is read again by `GeneratorLoader`,
+      so the error message is the same as the pure Python implementation.
+      """
+      try:
+        return super().get_single_data()
+      except (yaml.scanner.ScannerError, yaml.parser.ParserError, yaml.composer.ComposerError):
+        if not isinstance(self._stream, (str, bytes)):
+          raise
+        loader = GeneratorLoader(self._stream, base_dir=self.base_dir)
+        try:
+          loader.get_single_data()
+        except yaml.YAMLError as e:
+          raise e from None
+        finally:
+          loader.dispose()
+        raise
+
+for loader_class in filter(None, [GeneratorLoader, CGeneratorLoader]):
+  yaml.add_multi_constructor("tag:yaml.org,2002:var", GeneratorLoaderBase.var_handler, Loader=loader_class)
+  yaml.add_constructor("tag:yaml.org,2002:map", GeneratorLoaderBase.map_handler, Loader=loader_class)
+  GeneratorIncludeConstructor.add_to_loader_class(loader_class=loader_class)
+
 #region command classes
 
 class CommandBaseClass(object):
@@ -182,9 +346,9 @@ class GridColumnCommand(CommandBaseClass):
 
   def command(self, object, tag, value):
     def _command():
-      indx = value["index"]
-      del value["index"]
-      object.grid_columnconfigure(indx, value)
+      params = dict(value)
+      indx = params.pop("index")
+      object.grid_columnconfigure(indx, params)
 
     self.postactions.append(_command)
 
@@ -206,9 +370,9 @@ class GridRowCommand(CommandBaseClass):
 
   def command(self, object, tag, value):
     def _command():
-      indx = value["index"]
-      del value["index"]
-      object.grid_rowconfigure(indx, value)
+      params = dict(value)
+      indx = params.pop("index")
+      object.grid_rowconfigure(indx, params)
 
     self.postactions.append(_command)
 
@@ -219,7 +383,15 @@ class Generator(object):
   The core object that creates the Tk window.
   Users of this module will use this core object to generate a Tk window.
   """
-  def __init__(self, file="",modules=["tksugar.widgets", "tkinter"], localization_file="", encoding="UTF-8"):
+  loader_class = CGeneratorLoader or GeneratorLoader
+  """
+  The YAML Loader class used to read the file.
+  The libyaml implementation is used if it is available.
+  """
+  _class_indexes = {}
+  _executor = None
+
+  def __init__(self, file="",modules=["tksugar.widgets", "tkinter"], localization_file="", encoding="UTF-8", cache_dir=""):
     """
     constructor.
 
@@ -229,8 +401,10 @@ class Generator(object):
       A file path describing the window's object and layout.
       This argument can be omitted, but in actual use it is not omitted in principle.
       Omitted only when testing.
-      If you omit the file name, YamlIncludeConstructor will not be deleted, so YAML's `!Include` will remain valid.
-      However, this operation is not dealt with because it is impossible in principle to omit the file in the first place and there is no actual harm.
+      If you omit the file name, the file paths of YAML's `!include` are resolved from the current directory.
+      A file precompiled by `tksugar.precompile` can also be specified.
+      If the layout file has been changed since it was precompiled,
+      or it was precompiled with other modules or another localization file, the layout file is read instead.
     modules: list[str]
       An array indicating the name of the module to be used.
       By default, it is "tkinter" only.
@@ -245,18 +419,68 @@ class Generator(object):
       If omitted, the UI localizer is disabled.
     encoding: str
       File Encoding.
+    cache_dir: str
+      The directory where the scanned layouts are cached.
+      When the layout file, the included files and the localization file have not been changed,
+      the cached layout is used and YAML is not read.
+
+      If omitted, the cache is disabled.
+      The cache is not used when a precompiled file is read instead of the layout file.
     """
     self.string = ""
-    if file:
-      with open(file, "r", encoding=encoding) as f:
-        self.string = f.read()
-      YamlIncludeConstructor.add_to_loader_class(loader_class=GeneratorLoader, base_dir=str(Path(file).parent))
+    self._precompiled = None
     self._modules = modules
-    self._widgets = []
     self.localization_file = localization_file
     self.localization_file_encoding = encoding
+    if file and str(file).endswith(".tkc"):
+      from tksugar.precompile import load_precompiled
+      artifact = load_precompiled(file)
+      if self._accepts(artifact):
+        self._precompiled = artifact
+      else:
+        file = artifact["source"]
+    self.file = file
+    self.base_dir = ""
+    if file and self._precompiled is None:
+      self._read_file(file)
+    self.cache_dir = cache_dir
+    self._widgets = []
+    self._manager = None
+    self._managerref = [None]
+    self._stats = None
+    self._command = None
+    self._data = None
+    self.includes = []
+    self.index = WidgetIndex()
     self.vars = None
 
+  def _read_file(self, file):
+    """
+    Read the layout file.
+    """
+    with open(file, "r", encoding=self.localization_file_encoding) as f:
+      self.string = f.read()
+    self.file = file
+    self.base_dir = str(Path(file).parent)
+
+  def _accepts(self, artifact):
+    """
+    Check whether the precompiled layout can be used instead of the layout file.
+
+    Parameters
+    ----
+    artifact: dict
+      The precompiled layout returned by `tksugar.precompile.load_precompiled()`.
+
+    Returns
+    ----
+    accepts: bool
+      True if the layout file and the dictionary file have not been changed since it was compiled,
+      and it was compiled with the same modules and the same dictionary file as this object.
+    """
+    localization_file = os.path.realpath(self.localization_file) if self.localization_file else None
+    return artifact["fresh"] and artifact["modules"] == list(self._modules) and artifact["localization_file"] == localization_file
+
   def add_modules(self, *modules):
     """
     Add a module to be used.
@@ -268,7 +492,7 @@ class Generator(object):
     """
     self._modules.append(*modules)
 
-  def generate(self, command=None):
+  def generate(self, command=None, data=None, stats=None):
     """
     Generate a Tk window based on the specified files and modules.
 
@@ -276,61 +500,102 @@ class Generator(object):
     ----
     command: func
       An event handler for processing commands for widgets with the ::command element set.
+    data: dict[str, list]
+      The lists referenced by name from the `::foreach` nodes.
+    stats: GeneratorStats
+      If specified, the time spent in each phase and on each widget is recorded in it.
 
     Returns
     ----
     window: tkinter.Tk
       Tk window object.
     """
-    def _generate_core(children, owner, modules):
-      for i in children:
-        cls = self._load_class(modules, i["classname"])
-        objparam = i["params"]
-        if not issubclass(type(owner), GeneratorSupport):
-          # GenetratorSupport non inherited class, which adds a master parameter and adds a child object.
-          objparam["master"] = owner
-        obj, tag = self._instantiate(cls, callback=command, **objparam)
-        if issubclass(type(owner), GeneratorSupport):
-          # GeneratorSupport inherited class, which adds a child object via append_child.
-          childparam = {}
-          for n, v in objparam.items():
-            if n.startswith("/"):
-              childparam[n[1:]] = v
-          owner.append_child(obj, **childparam)
-        if tag.hasdata(): self._widgets.append(tag)
-        if i["children"]:
-          _generate_core(i["children"], obj, modules)
-    # Load YAML
-    loader = GeneratorLoader(self.string)
-    try:
-      struct = loader.get_single_data()
-    finally:
-      loader.dispose()
-    self.vars = loader.vars
-    if not type(struct) is dict or len(struct) > 1:
-      raise ValueError("The root node must be a dict and single.")
-    # Prepare
-    l = Localizer(self.localization_file, self.localization_file_encoding)
-    l.localize(struct)
-    modules = self._load_modules()
-    tree = self._scantree(struct)
-    # Load Root Object
-    cls  = self._load_class(modules, tree["classname"])
-    root, tag = self._instantiate(cls, callback=command, **tree["params"])
-    if tag.hasdata(): self._widgets.append(tag)
-    # Load Variable
-    for n, v in self.vars.items():
-      self.vars[n] = v["class"](master=root, name=n)
-      if not v["default"] is None:
-        self.vars[n].set(v["default"])
-    # Load Child Object
-    _generate_core(tree["children"], root, modules)
-    return root
+    if stats is not None:
+      start = stats.clock()
+    self._data = data
+    tree, vars = self._prepare(data, stats)
+    window = self._build(tree, vars, command, stats=stats)
+    if stats is not None:
+      stats.lap("total", start)
+    return window
+
+  def prepare_async(self, data=None, executor=None):
+    """
+    Read the YAML, localize it and scan it into a tree on a worker thread.
+    No Tk objects are used in this work, so the Tk thread can keep running the main loop.
+
+    Parameters
+    ----
+    data: dict[str, list]
+      The lists referenced by name from the `::foreach` nodes.
+    executor: concurrent.futures.Executor
+      The executor that runs the work.
+      If omitted, a thread pool shared by all Generator objects is used.
+
+    Returns
+    ----
+    future: concurrent.futures.Future
+      A future whose result is the tuple of the tree and the variable declarations.
+    """
+    self._data = data
+    return (executor or Generator._get_executor()).submit(self._prepare, data)
+
+  def generate_async(self, widget, command=None, data=None, master=None, executor=None, interval=10):
+    """
+    Generate a Tk window without blocking the main loop while the layout is prepared.
+    The layout is prepared on a worker thread by `Generator#prepare_async()`,
+    and only the widgets are created on the Tk thread, when the main loop finds that the preparation has finished.
+
+    ```
+    splash = tkinter.Tk()
+    future = Generator("main.yml").generate_async(splash)
+    future.add_done_callback(lambda f: splash.withdraw())
+    splash.mainloop()
+    ```
+
+    Parameters
+    ----
+    widget: tkinter.Misc
+      A widget of the running Tk, such as a splash window, whose timer checks the preparation.
+    command: func
+      An event handler for processing commands for widgets with the ::command element set.
+    data: dict[str, list]
+      The lists referenced by name from the `::foreach` nodes.
+    master: object
+      The master of the root object, such as the splash window if the root of the layout is a Toplevel.
+      If omitted, no master is specified.
+    executor: concurrent.futures.Executor
+      The executor that prepares the layout. If omitted, a thread pool shared by all Generator objects is used.
+    interval: int
+      The interval to check the preparation, in milliseconds.
+
+    Returns
+    ----
+    future: concurrent.futures.Future
+      A future whose result is the generated window. It is completed on the Tk thread,
+      so its done callbacks can use Tk. If the future is cancelled before the widgets are created, they are not created.
+    """
+    result = Future()
+    prepared = self.prepare_async(data, executor)
+    def _check():
+      if not prepared.done():
+        widget.after(interval, _check)
+        return
+      if not result.set_running_or_notify_cancel():
+        return
+      try:
+        tree, vars = prepared.result()
+        result.set_result(self._build(tree, vars, command, master=master))
+      except BaseException as e:
+        result.set_exception(e)
+    widget.after(interval, _check)
+    return result
 
   def findbyid(self, id):
     """
     Search for widgets by ID.
     If multiple items with the same ID are defined, the first item is returned.
+    The search uses `Generator#index`, which also supports other lookups, see `WidgetIndex`.
 
     Parameters
     ----
@@ -341,12 +606,11 @@ class Generator(object):
     ----
     widget: TagData|None
       If an item is found, TagData containing that widget.
-      None if the item is not found.
+      None if the item is not found or the widget has been destroyed.
     """
-    l = list(filter(lambda x: x.id == id, self._widgets))
-    return None if l == [] else l[0]
+    return self.index.findbyid(id)
 
-  def get_manager(self, commandhandler=None):
+  def get_manager(self, commandhandler=None, data=None, stats=None):
     """
     Create a window, store it in the `TkManager` that manages the window, and return it.
 
@@ -356,12 +620,409 @@ class Generator(object):
       A TkManager object that contains a window object.
     commandhandler: func
       An event handler for processing commands for widgets with the ::command element set.
+      It is registered with `TkManager#handlers` as "*", and is called for the widgets without their own handlers,
+      see `TkManager#dispatch()`.
+    data: dict[str, list]
+      The lists referenced by name from the `::foreach` nodes.
+    stats: GeneratorStats
+      If specified, the time spent in each phase and on each widget is recorded in it,
+      and it is stored in `TkManager#stats`.
+    """
+    if stats is not None:
+      start = stats.clock()
+    window = self.generate(command=self._dispatch, data=data, stats=stats)
+    if stats is not None:
+      t = stats.clock()
+    self._attach(TkManager(window, self._widgets, self.vars, self.index))
+    if commandhandler is not None:
+      self._manager.handlers["*"] = commandhandler
+    if stats is not None:
+      self._manager.stats = stats
+      stats.lap("manager", t)
+      # The total of generate() is replaced by the total of this call.
+      stats.phases["total"] = stats.clock() - start
+    return self._manager
+
+  def get_manager_incremental(self, commandhandler=None, data=None, budget=10, progress=None, stats=None):
+    """
+    Create the root window and the variables, and return the `TkManager` immediately.
+    The child widgets are created in slices of the main loop, so the window keeps responding
+    and the containers that have been created are displayed while the others are created.
+
+    ```
+    man = Generator("large.yml").get_manager_incremental(progress=lambda done, total: bar.configure(value=done * 100 / total))
+    man.ready.add_done_callback(lambda f: print("ready"))
+    man.mainloop()
+    ```
+
+    Parameters
+    ----
+    commandhandler: func
+      An event handler for processing commands for widgets with the ::command element set.
+      It is registered with `TkManager#handlers` as "*", and is called for the widgets without their own handlers,
+      see `TkManager#dispatch()`.
+    data: dict[str, list]
+      The lists referenced by name from the `::foreach` nodes.
+    budget: int
+      The time spent creating the widgets in each slice, in milliseconds.
+      At least one widget is created in each slice.
+    progress: func
+      A function that is called with `(done, total)` after each slice,
+      the number of the tree nodes that have been processed and the number of all nodes.
+    stats: GeneratorStats
+      If specified, the time spent in each phase and on each widget is recorded in it,
+      and it is stored in `TkManager#stats`.
+
+    Returns
+    ----
+    manager: TkManager
+      A TkManager object that contains a window object.
+      Its `ready` future is completed with the manager when all widgets have been created.
+      If the future is cancelled or the window is destroyed, the remaining widgets are not created.
     """
-    window = self.generate(command=commandhandler)
-    return TkManager(window, self._widgets, self.vars)
+    self._data = data
+    tree, vars = self._prepare(data, stats)
+    root, tag, modules = self._build_root(tree, vars, self._dispatch, stats=stats)
+    self._attach(TkManager(root, self._widgets, self.vars, self.index))
+    if commandhandler is not None:
+      self._manager.handlers["*"] = commandhandler
+    if stats is not None:
+      self._manager.stats = stats
+    manager = self._manager
+    manager.ready = ready = Future()
+    steps = self._iter_children(tree["children"], root, tag, modules)
+    total = _count(tree) - 1
+    state = {"done": 0, "registered": len(self._widgets)}
+    # This object may generate another window before all widgets of this window have been created.
+    build = self._save_build()
+    def _slice():
+      if ready.done():
+        return
+      try:
+        alive = root.winfo_exists()
+      except tkinter.TclError:
+        alive = False
+      if not alive:
+        ready.cancel()
+        return
+      try:
+        finished = True
+        end = time.perf_counter() + budget / 1000
+        saved = self._save_build()
+        self._restore_build(build)
+        try:
+          for n in steps:
+            state["done"] += n
+            if state["done"] < total and time.perf_counter() >= end:
+              finished = False
+              break
+          widgets = self._widgets[state["registered"]:]
+        finally:
+          self._restore_build(saved)
+        manager.add_widgets(widgets)
+        state["registered"] += len(widgets)
+        if progress is not None:
+          progress(state["done"], total)
+      except BaseException as e:
+        ready.set_exception(e)
+        return
+      if finished:
+        ready.set_result(manager)
+      else:
+        # The idle callbacks (such as redrawing) and the events are handled between the slices.
+        root.after_idle(root.after, 0, _slice)
+    root.after_idle(_slice)
+    return manager
 
   ### Private Methods
 
+  def _build(self, tree, vars, command=None, master=None, unique_vars=False, stats=None):
+    """
+    Generate a Tk window from the scanned tree.
+    The tree and the variable declarations are not modified, so they can be used any number of times.
+
+    Parameters
+    ----
+    tree: dict
+      Tree data
+    vars: dict[str, dict]
+      The variable declarations.
+    command: func
+      An event handler for processing commands for widgets with the ::command element set.
+    master: object
+      The master of the root object. If omitted, no master is specified.
+    unique_vars: bool
+      If True, the Tcl variable names are generated automatically instead of using the declared names,
+      so that the variables of the windows generated from the same tree do not share their values.
+    stats: GeneratorStats
+      If specified, the time spent in each phase and on each widget is recorded in it.
+      The widgets whose creation is deferred are also recorded when they are created.
+
+    The widgets of the window generated before by this object are forgotten,
+    and the widgets of the new window are registered with `Generator#index`.
+
+    Returns
+    ----
+    window: tkinter.Tk
+      Tk window object.
+    """
+    root, tag, modules = self._build_root(tree, vars, command, master, unique_vars, stats)
+    # Load Child Object
+    self._generate_children(tree["children"], root, tag, modules)
+    return root
+
+  def _build_root(self, tree, vars, command=None, master=None, unique_vars=False, stats=None):
+    """
+    Generate the root widget and the variables from the scanned tree, see `Generator#_build()`.
+
+    Returns
+    ----
+    root: tkinter.Tk
+      Tk window object.
+    tag: TagData
+      TagData of the root widget.
+    modules: dict[str, module]
+      A dictionary object that associates module names with module objects.
+    """
+    self._managerref = managerref = [None]
+    if command == self._dispatch:
+      # The commands are routed to the manager of this window, even if this object generates another window.
+      command = lambda widget, tagdata: managerref[0].dispatch(widget, tagdata) if managerref[0] is not None else None
+    self._stats = stats
+    self._command = command
+    self._widgets = []
+    self.index = WidgetIndex()
+    self.vars = dict(vars)
+    if stats is not None:
+      t = stats.clock()
+    modules = self._load_modules()
+    if stats is not None:
+      t = stats.lap("modules", t)
+    # Load Root Object
+    cls  = tree.get("class") or self._load_class(modules, tree["classname"])
+    if stats is not None:
+      t = stats.lap("resolve", t)
+    rootparam = dict(tree["params"])
+    if master is not None:
+      rootparam["master"] = master
+    root, tag = self._instantiate(cls, callback=command, initnames=tree.get("init"), **rootparam)
+    tag.node = tree
+    tag.localized = tree.get("localized")
+    if stats is not None:
+      stats.add_widget(WidgetStat(tree["classname"], tag.id, *tree.get("source", (None, None)), stats.clock() - t))
+      t = stats.clock()
+    self.index.add(tag)
+    self.index.watch(root)
+    if tag.hasdata(): self._widgets.append(tag)
+    # Load Variable
+    # The variable class with the same name in the modules takes precedence, such as the classes of `tksugar.headless`.
+    index = self._get_class_index(modules)
+    for n, v in vars.items():
+      self.vars[n] = index.get(v["class"].__name__, v["class"])(master=root, name=None if unique_vars else n)
+      if not v["default"] is None:
+        self.vars[n].set(v["default"])
+    if stats is not None:
+      stats.lap("variables", t)
+    return root, tag, modules
+
+  def _generate_children(self, children, owner, ownertag, modules, created=None):
+    """
+    Generate the child widgets of the widget from the scanned tree and register them with `Generator#index`.
+
+    Parameters
+    ----
+    children: list[dict]
+      The tree nodes of the child widgets.
+    owner: object
+      The widget.
+    ownertag: TagData
+      TagData of the widget.
+    modules: dict[str, module]
+      A dictionary object that associates module names with module objects.
+    created: list[TagData]
+      If specified, TagData of all created widgets are appended to it, including the descendants.
+    """
+    for unused in self._iter_children(children, owner, ownertag, modules, created):
+      pass
+
+  def _iter_children(self, children, owner, ownertag, modules, created=None):
+    """
+    Generate the child widgets one by one, see `Generator#_generate_children()`.
+    This is a generator that yields after each widget is created,
+    so the work can be split into slices of the main loop.
+
+    Yields
+    ----
+    count: int
+      The number of the tree nodes that have been processed, 1 and the descendants whose creation is deferred.
+    """
+    stats = self._stats
+    for i in children:
+      if stats is not None:
+        start = stats.clock()
+      # The class is resolved and the constructor arguments are known if the layout was precompiled.
+      cls = i.get("class") or self._load_class(modules, i["classname"])
+      if stats is not None:
+        start = stats.lap("resolve", start)
+      objparam = dict(i["params"])
+      if not issubclass(type(owner), GeneratorSupport):
+        # GenetratorSupport non inherited class, which adds a master parameter and adds a child object.
+        objparam["master"] = owner
+      obj, tag = self._instantiate(cls, callback=self._command, initnames=i.get("init"), **objparam)
+      tag.parent = ownertag
+      tag.node = i
+      tag.localized = i.get("localized")
+      tag.localizedfields = i.get("localizedfields")
+      support = issubclass(type(owner), GeneratorSupport)
+      if support:
+        # GeneratorSupport inherited class, which adds a child object via append_child.
+        childparam = {}
+        for n, v in objparam.items():
+          if n.startswith("/"):
+            childparam[n[1:]] = v
+        owner.append_child(obj, **childparam)
+      if stats is not None:
+        stats.add_widget(WidgetStat(i["classname"], tag.id, *i.get("source", (None, None)), stats.clock() - start))
+      self.index.add(tag)
+      if created is not None: created.append(tag)
+      if tag.hasdata(): self._widgets.append(tag)
+      if i["children"]:
+        if not support or not owner.defer_children(obj, self._deferred_children(i["children"], obj, tag, modules)):
+          yield 1
+          yield from self._iter_children(i["children"], obj, tag, modules, created)
+          continue
+        yield 1 + sum(_count(c) for c in i["children"])
+        continue
+      yield 1
+
+  def _dispatch(self, widget, tagdata):
+    """
+    The command handler of the windows generated by `Generator#get_manager()`, which routes the commands by `TkManager#dispatch()`.
+    """
+    if self._manager is not None:
+      return self._manager.dispatch(widget, tagdata)
+
+  def _attach(self, manager):
+    """
+    Make the manager the owner of the window generated last, and return it.
+    The commands and the deferred child widgets of the window are passed to this manager.
+    """
+    self._manager = manager
+    self._managerref[0] = manager
+    manager.generator = self
+    return manager
+
+  def _save_build(self):
+    """
+    Get the state of the window generated last, see `Generator#_restore_build()`.
+    """
+    return (self._managerref, self._widgets, self.index, self._command, self._stats)
+
+  def _restore_build(self, build):
+    """
+    Restore the state returned by `Generator#_save_build()`,
+    so that the child widgets created later belong to that window even if this object generated another window.
+    """
+    self._managerref, self._widgets, self.index, self._command, self._stats = build
+
+  def _deferred_children(self, children, owner, ownertag, modules):
+    """
+    Get a function that generates the child widgets later, see `GeneratorSupport#defer_children()`.
+    The widgets are registered with the `TkManager` of the window when they are created.
+    """
+    build = self._save_build()
+    def _builder():
+      saved = self._save_build()
+      self._restore_build(build)
+      try:
+        start = len(self._widgets)
+        created = []
+        self._generate_children(children, owner, ownertag, modules, created)
+        widgets = self._widgets[start:]
+      finally:
+        self._restore_build(saved)
+      manager = build[0][0]
+      if manager is not None:
+        manager.add_widgets(widgets)
+        # The widgets are created from the tree, so they are translated into the language of the manager.
+        manager.relocalize(created)
+    return _builder
+
+  def _prepare(self, data=None, stats=None):
+    """
+    Read the YAML, localize it and scan it into a tree.
+    If the cache is enabled and the cached layout is up to date, the cached layout is returned.
+
+    Parameters
+    ----
+    data: dict[str, list]
+      The lists referenced by name from the `::foreach` nodes.
+    stats: GeneratorStats
+      If specified, the time spent in each phase is recorded in it,
+      and the tree nodes have the file and line of the widgets in their "source" element.
+
+    Returns
+    ----
+    tree: dict
+      Tree data
+    vars: dict[str, dict]
+      The variable declarations.
+    """
+    if stats is not None:
+      t = stats.clock()
+    if self._precompiled is not None and not self._accepts(self._precompiled):
+      # The modules have been added since the precompiled file was read.
+      self._read_file(self._precompiled["source"])
+      self._precompiled = None
+    if self._precompiled is not None:
+      # The `::foreach` nodes have been expanded when the layout was precompiled.
+      self.includes = self._precompiled["includes"]
+      if stats is not None:
+        stats.lap("load", t)
+      return self._precompiled["tree"], self._precompiled["vars"]
+    cache = None
+    if self.cache_dir:
+      cache = LayoutCache(self.cache_dir)
+      key = LayoutCache.make_key(
+        os.path.abspath(self.file) if self.file else "",
+        self.string,
+        self.localization_file,
+        LayoutCache.hash_file(self.localization_file) if self.localization_file else "",
+        self.localization_file_encoding,
+        "" if data is None else repr(data))
+      entry = cache.load(key)
+      if stats is not None:
+        t = stats.lap("cache", t)
+      if entry is not None:
+        self.includes = cache.includes
+        return entry
+    # Load YAML
+    loader = self.loader_class(self.string, base_dir=self.base_dir)
+    if stats is not None and stats.sources:
+      loader.source_name = self.file or "<string>"
+      loader.source_marks = {}
+    try:
+      struct = loader.get_single_data()
+    finally:
+      loader.dispose()
+    if not type(struct) is dict or len(struct) > 1:
+      raise ValueError("The root node must be a dict and single.")
+    if stats is not None:
+      t = stats.lap("load", t)
+    # Prepare
+    localizer = Localizer(self.localization_file, self.localization_file_encoding)
+    if stats is not None:
+      t = stats.lap("localize", t)
+    tree = self._scantree(struct, data, loader.source_marks, localizer)
+    if stats is not None:
+      t = stats.lap("scan", t)
+    self.includes = loader.includes
+    if cache is not None:
+      cache.store(key, tree, loader.vars, loader.includes)
+      if stats is not None:
+        stats.lap("store", t)
+    return tree, loader.vars
+
   def _load_modules(self):
     """
     Read all modules specified in the `self._modules` array
@@ -409,45 +1070,155 @@ class Generator(object):
       If the specified class does not exist in the module specified by the argument.
       Or, if the specified class does not exist in the specified module.
     """
-    mod = None
-    cls = None
     if class_name[0] == "_":
       class_name = class_name[1:]
-    if "." in class_name:
-      # Module specified
-      mod, cls = class_name.rsplit(".", 1)
-    else:
-      # Module search
-      cls = class_name
-      for module in modules.keys():
-        cllist = list(map(lambda x: x[0], inspect.getmembers(modules[module], inspect.isclass)))
-        if cls in cllist:
-          mod = module
-          break
-
-    if mod is None:
+    index = Generator._get_class_index(modules)
+    cls = index.get(class_name)
+    if cls is not None:
+      return cls
+    if not "." in class_name:
       raise TypeError(f'Class not found. "{class_name}"')
+    # Module specified
+    mod, name = class_name.rsplit(".", 1)
     try:
-      return getattr(modules[mod], cls)
+      cls = getattr(modules[mod], name)
     except AttributeError as e:
       raise TypeError(e)
+    index[class_name] = cls
+    return cls
+
+  @staticmethod
+  def _get_executor():
+    """
+    Get the thread pool shared by all Generator objects, creating it on the first call.
+    """
+    if Generator._executor is None:
+      Generator._executor = ThreadPoolExecutor(thread_name_prefix="tksugar")
+    return Generator._executor
 
   @staticmethod
-  def _scantree(struct):
+  def _get_class_index(modules):
+    """
+    Get the index that associates class names with class objects for the modules.
+    The index is built once per set of modules and shared by all Generator objects.
+    If a class with the same name exists in multiple modules, the class of the module that comes first takes precedence.
+
+    Parameters
+    ----
+    modules: dict[str, module]
+      A dictionary object that associates module names with module objects.
+
+    Returns
+    ----
+    index: dict[str, class]
+      A dictionary object that associates class names with class objects.
+    """
+    key = tuple((name, id(module)) for name, module in modules.items())
+    index = Generator._class_indexes.get(key)
+    if index is None:
+      index = {}
+      for module in modules.values():
+        for name, cls in inspect.getmembers(module, inspect.isclass):
+          index.setdefault(name, cls)
+      Generator._class_indexes[key] = index
+    return index
+
+  @staticmethod
+  def _scantree(struct, data=None, marks=None, localizer=None):
     """
     Scan an array and convert it to a tree of class names, parameters and child objects
+    If a localizer is specified, the parameters are translated while they are scanned,
+    and the parameters that had the markers are kept untranslated in the "localized" element of the node
+    so that they can be translated again by `TkManager#set_language()`.
+    If they are expanded by a `::foreach` node, the untranslated fields are kept in the "localizedfields" element.
+    The given array is not modified.
+
+    The `::foreach` node repeats a template for each item of a list.
+    The template is scanned once and copied for each item,
+    replacing `{name}` in the strings of the template with the value of the item.
+    If the whole string is a single `{name}`, it is replaced with the value itself, keeping its type.
+    If the item is a dict, its keys can be used as names; otherwise, the item is available as `{item}`.
+    The position of the item is available as `{index}`.
+
+    ```
+    ::foreach:
+      items:            # a list, an !include of a data file, or the name of a list passed as data
+        - {label: "1", row: 0}
+      template:         # a node or a list of nodes
+        _Button:
+          text: "{label}"
+          grid: {row: "{row}"}
+          ::id: "button{label}"
+    ```
 
     Parameters
     ----
     struct: dict
       Data array
+    data: dict[str, list]
+      The lists referenced by name from the `::foreach` nodes.
+    marks: dict[int, dict[str, tuple[str, int]]]
+      The file and line of the keys of each mapping, recorded by the loader by the id of the mapping.
+      If specified, each node has the file and line of the widget in its "source" element.
+    localizer: Localizer
+      The localizer that translates the parameters and the items of the `::foreach` nodes.
+      If omitted, the strings are not translated.
 
     Retrns
     ----
     treedata: dict
       Tree data
     """
-    def _scantree_core(struct, params):
+    def _foreach(value, params):
+      if type(value) is not dict or not "items" in value or not "template" in value:
+        raise ValueError("The ::foreach node must have the items and template elements.")
+      items = value["items"]
+      if type(items) is str:
+        if data is None or not items in data:
+          raise ValueError(f'The data "{items}" referenced by the ::foreach node is not passed.')
+        items = data[items]
+      raw = items
+      if translate is not None and raw is value["items"]:
+        items = translate(items)
+      if type(items) is not list:
+        raise ValueError("The items of the ::foreach node must be a list.")
+      templates = value["template"] if type(value["template"]) is list else [value["template"]]
+      inparam = dict(params)
+      scanned = [r for r in (_scantree_core(t, inparam) for t in templates) if r is not None]
+      result = []
+      for index, item in enumerate(items):
+        fields = _fields(item, index)
+        rawfields = fields if raw is items else _fields(raw[index], index)
+        for t in scanned:
+          result.append(_stamp(t, fields, rawfields))
+      return result
+    def _fields(item, index):
+      fields = dict(item) if type(item) is dict else {"item": item}
+      fields.setdefault("index", index)
+      return fields
+    def _stamp(node, fields, rawfields):
+      stamped = dict(node)
+      stamped["params"] = substitute(node["params"], fields)
+      if "localized" in node or rawfields is not fields:
+        # Record the untranslated parameters that have the markers in the template or in the fields,
+        # and the untranslated fields to substitute after translating them.
+        marked = {k: v for k, v in rawfields.items() if v is not fields.get(k)}
+        template = node.get("localized", {})
+        localized = {}
+        for n, v in node["params"].items():
+          r = template.get(n, v)
+          if n in template or (marked and substitute(r, marked) != r):
+            localized[n] = r
+        stamped.pop("localized", None)
+        stamped.pop("localizedfields", None)
+        if localized:
+          stamped["localized"] = localized
+          stamped["localizedfields"] = dict(rawfields, **node.get("localizedfields", {}))
+      stamped["children"] = [_stamp(c, fields, rawfields) for c in node["children"]]
+      return stamped
+    def _mark(mapping, key):
+      return marks.get(id(mapping), {}).get(key, (None, None))
+    def _scantree_core(struct, params, source=None):
       props = {
         "classname": "",
         "params": {},
@@ -455,7 +1226,10 @@ class Generator(object):
       }
       rootname = next(iter(struct))
       props["classname"] = rootname[1:]
+      if marks is not None:
+        props["source"] = source or _mark(struct, rootname)
       items = {}
+      localized = {}
       # merge params.
       if "params" in params:
         if struct[rootname] is None:
@@ -473,22 +1247,34 @@ class Generator(object):
       # parse.
       for n, v in items.items():
         if n[0] == "_":
-          props["children"].append(_scantree_core({n: v}, params))
+          props["children"].append(_scantree_core({n: v}, params, None if marks is None else _mark(struct[rootname], n)))
         elif n == "::children":
           if type(v) is not list:
             raise AttributeError("The child elements of the ::children node must be an list.")
           inparam = dict(params)
           for item in v:
+            if type(item) is dict and "::foreach" in item:
+              props["children"].extend(_foreach(item["::foreach"], inparam))
+              continue
             r = _scantree_core(item, inparam)
             if r is not None: props["children"].append(r)
+        elif n == "::foreach":
+          props["children"].extend(_foreach(v, params))
         elif n == "::params":
           params["params"] = v
         else:
           if v is None:
             props["params"][n] = None
-          else:
+          elif translate is None or (type(v) is str and not ":::" in v):
             props["params"][n] = v
+          else:
+            props["params"][n] = translate(v)
+            if props["params"][n] is not v:
+              localized[n] = v
+      if localized:
+        props["localized"] = localized
       return props
+    translate = None if localizer is None else localizer.translate
     return _scantree_core(struct, {})
 
   @staticmethod
@@ -497,6 +1283,7 @@ class Generator(object):
     Get method argument list.
     If the document comment includes "STANDARD OPTIONS" and "WIDGET-SPECIFIC" OPTIONS,
     use that as the argument list.
+    The result is kept for each method, see `tksugar.argtable`.
 
     Parameters
     ----
@@ -508,32 +1295,7 @@ class Generator(object):
     arglist: list(str)
       Argument list.
     """
-    result = []
-    # add inspect result
-    for p in filter(lambda p: p.kind == p.POSITIONAL_OR_KEYWORD, inspect.signature(method).parameters.values()):
-      result.append(p.name)
-
-    # add comment args
-    lines = method.__doc__.split("\n") if method.__doc__ else []
-    i = 0
-    collect = False
-    while i < len(lines):
-      if collect:
-        if lines[i] == "":
-          collect = False
-        else:
-          for p in filter(lambda x: x, re.split("[\s,]", lines[i].strip())):
-            result.append(p.strip())
-      else:
-        if "STANDARD OPTIONS" in lines[i] or "WIDGET-SPECIFIC OPTIONS" in lines[i]:
-          collect = True
-          i += 1
-        if "Valid resource names:" in lines[i]:
-          collect = True
-          lines[i] = lines[i].split(":")[1]
-          i -= 1
-      i += 1
-    return result
+    return argtable.get_argnames(method)
 
   @staticmethod
   def _split_params(method, params):
@@ -561,7 +1323,7 @@ class Generator(object):
         del params[p]
     return methodparams, params
 
-  def _instantiate(self, cls, callback=None, **params):
+  def _instantiate(self, cls, callback=None, initnames=None, **params):
     """
     Generate an object with set properties based on class and property list.
 
@@ -571,6 +1333,9 @@ class Generator(object):
       The object to instantiate.
     callback: func
       An event handler for processing commands for widgets with the ::command element set.
+    initnames: list[str]
+      The names of the parameters passed to the constructor, other than master.
+      If omitted, they are obtained by `Generator#_split_params()`.
     params: dict(str, any)
       Property list.
 
@@ -581,18 +1346,13 @@ class Generator(object):
     tagdata: TagData
       Widget additional data.
     """
-    def replace_variable(params):
-      """
-      Recursively replaces the TemporaryVariable class present in all parameters.
-      """
-      for n in params.keys() if type(params) is dict else range(len(params)):
-        if type(params[n]) is TemporaryVariable:
-          params[n] = self.vars[params[n].name]
-        elif type(params[n]) is list or type(params[n]) is dict:
-          replace_variable(params[n])
     # Prepare
-    replace_variable(params)
-    initparams, others = Generator._split_params(cls.__init__, params)
+    params = self._replace_variables(params)
+    if initnames is None:
+      initparams, others = Generator._split_params(cls.__init__, params)
+    else:
+      initparams = {n: params.pop(n) for n in list(initnames) + ["master"] if n in params}
+      others = params
     postactions = []
     commands = {
       "id": IdCommand(postactions),
@@ -621,9 +1381,37 @@ class Generator(object):
       else:
         setattr(obj, n, v)
     # Post actions
+    self._run_postactions(postactions)
+    return obj, tagdata
+
+  def _replace_variables(self, value):
+    """
+    Recursively replaces the TemporaryVariable class present in all parameters.
+    The lists and dicts are copied, so the given parameters are not modified.
+    """
+    if type(value) is TemporaryVariable:
+      return self.vars[value.name]
+    elif type(value) is dict:
+      return {n: self._replace_variables(v) for n, v in value.items()}
+    elif type(value) is list:
+      return [self._replace_variables(v) for v in value]
+    return value
+
+  def _run_postactions(self, postactions):
+    """
+    Execute the methods registered by the commands after the object has been created.
+
+    Parameters
+    ----
+    postactions: list[func]
+      Methods to be executed.
+    """
+    if self._stats is not None and postactions:
+      start = self._stats.clock()
     for fun in postactions:
       fun()
-    return obj, tagdata
+    if self._stats is not None and postactions:
+      self._stats.lap("postactions", start)
 
 if __name__ == "__main__":
   gen = Generator()
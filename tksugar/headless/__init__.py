@@ -0,0 +1,920 @@
+"""
+A headless backend that can be used in place of `tkinter`.
+
+The widget and variable classes of this package have the same constructor signatures and
+document comments as the classes of `tkinter`, so the Generator passes them the same arguments,
+but they do not create any Tk window. They only record the options and method calls,
+so layouts can be generated and checked without a display, and the cost of TkSugar itself
+can be measured apart from the cost of Tk.
+
+```
+from tksugar import Generator, headless
+man = Generator("window.yml", modules=headless.MODULES).get_manager()
+man.window.calls  # [("title", ("TEST Window",), {}), ...]
+```
+
+* `tksugar.headless` replaces `tkinter`.
+* `tksugar.headless.ttk` replaces `tkinter.ttk`.
+* `tksugar.headless.widgets` replaces `tksugar.widgets`.
+
+The variables are typed like the variables of `tkinter` and call their traces when they are written.
+The `after()`, `after_idle()` and `event_generate(..., when="tail")` callbacks are queued
+and are executed by `update()`, `update_idletasks()` or `mainloop()`.
+`mainloop()` returns when there are no queued callbacks left.
+"""
+import fnmatch
+import inspect
+import time
+import tkinter
+from tkinter.constants import *
+
+from tksugar import argtable
+
+TclError = tkinter.TclError
+
+MODULES = ["tksugar.headless.widgets", "tksugar.headless"]
+"""
+The modules passed to the Generator instead of the default modules.
+"""
+
+_default_root = None
+_varnum = 0
+
+def _get_default_root(what=None):
+  """
+  Get the default root window. If there is no root window, it is created.
+
+  Parameters
+  ----
+  what: str
+    If specified, RuntimeError is raised instead of creating the root window.
+  """
+  if _default_root is None:
+    if what:
+      raise RuntimeError(f"Too early to {what}: no default root window")
+    return Tk()
+  return _default_root
+
+def _mimic(real, options_from=None):
+  """
+  A class decorator that gives the headless class the constructor signature,
+  the document comments and the options of the tkinter class.
+
+  Parameters
+  ----
+  real: class
+    The tkinter class.
+  options_from: class
+    The class whose constructor document lists the options. If omitted, `real` is used.
+  """
+  def decorator(cls):
+    signature = inspect.signature(real.__init__)
+    names = set(signature.parameters)
+    ignore = names | {"self", "master", "cnf"}
+    options = frozenset(n.rstrip(".") for n in argtable.parse_argnames((options_from or real).__init__) if not n in ignore)
+    cls._real = real
+    cls._options = options or None
+    cls._params = frozenset(names - {"self", "master", "cnf"})
+    if not "__init__" in cls.__dict__:
+      def __init__(self, master=None, cnf={}, **kw):
+        super(cls, self).__init__(master, cnf, **kw)
+      cls.__init__ = __init__
+      __init__.__signature__ = signature
+      __init__.__qualname__ = f"{cls.__qualname__}.__init__"
+      __init__.__module__ = cls.__module__
+    if cls.__init__.__doc__ is None:
+      cls.__init__.__doc__ = real.__init__.__doc__
+    if cls.__doc__ is None:
+      cls.__doc__ = real.__doc__
+    return cls
+  return decorator
+
+class Event(object):
+  """
+  The event object passed to the event handlers.
+  """
+  def __init__(self, widget, type, **fields):
+    self.widget = widget
+    self.type = type
+    self.__dict__.update(fields)
+
+  def __repr__(self):
+    return f"<Event {self.type} {self.widget}>"
+
+class Misc(object):
+  """
+  The behavior shared by the headless windows and widgets.
+  The methods of the tkinter class that are not implemented here are recorded in `calls` and return None.
+  """
+  _real = tkinter.Misc
+  _options = None
+  _params = frozenset()
+
+  def __init__(self):
+    self.calls = []
+    self.options = {}
+    self.children = {}
+    self.master = None
+    self._name = ""
+    self._w = "."
+    self._childcounts = {}
+    self._bindings = {}
+    self._destroyed = False
+    self.manager = ""
+
+  def __getattr__(self, name):
+    if name.startswith("_") or not callable(getattr(self._real, name, None)):
+      raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+    def record(*args, **kw):
+      self._record(name, args, kw)
+    record.__name__ = name
+    return record
+
+  def __str__(self):
+    return self._w
+
+  def __repr__(self):
+    return f"<{type(self).__module__}.{type(self).__qualname__} object {self._w}>"
+
+  def _record(self, name, args=(), kw={}):
+    """
+    Record a method call.
+    """
+    self.calls.append((name, tuple(args), dict(kw)))
+
+  def _root(self):
+    """
+    Get the root window.
+    """
+    w = self
+    while w.master is not None:
+      w = w.master
+    return w
+
+  #region options
+
+  def configure(self, cnf=None, **kw):
+    """
+    Set or get the options.
+    If no option is specified, a dictionary of the current options is returned.
+    """
+    if type(cnf) is str:
+      return (cnf, self.cget(cnf))
+    options = self._normalize(dict(cnf or {}, **kw))
+    if not options:
+      return dict(self.options)
+    self._check_options(options)
+    self._record("configure", (), options)
+    self.options.update(options)
+
+  config = configure
+
+  def cget(self, key):
+    """
+    Get the value of the option.
+    """
+    key = self._normalize({key: None}).popitem()[0]
+    self._check_options({key: None})
+    return self.options.get(key, "")
+
+  __getitem__ = cget
+
+  def __setitem__(self, key, value):
+    self.configure({key: value})
+
+  def keys(self):
+    """
+    Get the names of the options.
+    """
+    return sorted(self._options if self._options is not None else self.options)
+
+  @staticmethod
+  def _normalize(options):
+    """
+    Remove the trailing "_" of the option names, as tkinter does.
+    """
+    return {(n[:-1] if n.endswith("_") else n): v for n, v in options.items()}
+
+  def _check_options(self, options):
+    """
+    Raise TclError if there is an option that the tkinter class does not have.
+    """
+    if self._options is None:
+      return
+    for n in options:
+      if not n in self._options:
+        raise TclError(f'unknown option "-{n}"')
+
+  #endregion
+
+  #region widget tree
+
+  def winfo_children(self):
+    """
+    Get the child widgets.
+    """
+    return list(self.children.values())
+
+  def winfo_exists(self):
+    """
+    1 if the widget has not been destroyed.
+    """
+    return 0 if self._destroyed else 1
+
+  def winfo_toplevel(self):
+    """
+    Get the window that contains the widget.
+    """
+    w = self
+    while not isinstance(w, Wm) and w.master is not None:
+      w = w.master
+    return w
+
+  def nametowidget(self, name):
+    """
+    Get the widget from its path name.
+    """
+    w = self._root() if str(name).startswith(".") else self
+    for n in filter(None, str(name).split(".")):
+      w = w.children[n]
+    return w
+
+  def destroy(self):
+    """
+    Destroy the widget and its child widgets.
+    The <Destroy> event handlers are called for each widget.
+    """
+    for c in list(self.children.values()):
+      c.destroy()
+    if self._destroyed:
+      return
+    self._destroyed = True
+    self._fire("<Destroy>")
+    if self.master is not None:
+      self.master.children.pop(self._name, None)
+
+  #endregion
+
+  #region events
+
+  def bind(self, sequence=None, func=None, add=None):
+    """
+    Bind an event handler to the widget.
+    """
+    return self._bind(self._bindings, sequence, func, add)
+
+  def unbind(self, sequence, funcid=None):
+    """
+    Unbind the event handler from the widget.
+    """
+    self._unbind(self._bindings, sequence, funcid)
+
+  def bind_all(self, sequence=None, func=None, add=None):
+    """
+    Bind an event handler to all widgets.
+    """
+    return self._bind(self._root()._bindall, sequence, func, add)
+
+  def unbind_all(self, sequence, funcid=None):
+    """
+    Unbind the event handlers from all widgets.
+    If funcid is given, only the event handler is unbound.
+    """
+    self._unbind(self._root()._bindall, sequence, funcid)
+
+  def event_generate(self, sequence, **kw):
+    """
+    Generate the event.
+    If `when` is specified, the event handlers are called when the idle callbacks are executed.
+    """
+    when = kw.pop("when", None)
+    if when is None or when == "now":
+      self._fire(sequence, **kw)
+    else:
+      self.after_idle(lambda: self._fire(sequence, **kw))
+
+  @staticmethod
+  def _bind(table, sequence, func, add):
+    if sequence is None:
+      return list(table.keys())
+    if func is None:
+      return [f for unused, f in table.get(sequence, [])]
+    funcid = f"{id(func)}{getattr(func, '__name__', '')}"
+    if not add:
+      table[sequence] = []
+    table.setdefault(sequence, []).append((funcid, func))
+    return funcid
+
+  @staticmethod
+  def _unbind(table, sequence, funcid):
+    if funcid is None:
+      table.pop(sequence, None)
+    else:
+      table[sequence] = [h for h in table.get(sequence, []) if h[0] != funcid]
+
+  def _fire(self, sequence, **fields):
+    """
+    Call the event handlers bound to the widget and to all widgets.
+    """
+    event = Event(self, sequence, **fields)
+    for unused, func in self._bindings.get(sequence, []) + self._root()._bindall.get(sequence, []):
+      if func(event) == "break":
+        break
+
+  #endregion
+
+  #region event loop
+
+  def after(self, ms, func=None, *args):
+    """
+    Call the function after the specified milliseconds.
+    """
+    if func is None:
+      time.sleep(ms / 1000)
+      return None
+    root = self._root()
+    root._taskcount += 1
+    id = f"after#{root._taskcount}"
+    root._timers[id] = (time.monotonic() + ms / 1000, func, args)
+    return id
+
+  def after_idle(self, func, *args):
+    """
+    Call the function when the idle callbacks are executed.
+    """
+    root = self._root()
+    root._taskcount += 1
+    id = f"after#{root._taskcount}"
+    root._idles[id] = (func, args)
+    return id
+
+  def after_cancel(self, id):
+    """
+    Cancel the callback.
+    """
+    root = self._root()
+    root._timers.pop(id, None)
+    root._idles.pop(id, None)
+
+  def update_idletasks(self):
+    """
+    Execute the idle callbacks, including the callbacks added while they are executed.
+    """
+    root = self._root()
+    while root._idles:
+      id = next(iter(root._idles))
+      func, args = root._idles.pop(id)
+      func(*args)
+
+  def update(self):
+    """
+    Execute the timer callbacks whose time has come and the idle callbacks.
+    """
+    root = self._root()
+    while True:
+      now = time.monotonic()
+      due = sorted((t[0], id) for id, t in root._timers.items() if t[0] <= now)
+      if not due and not root._idles:
+        break
+      for unused, id in due:
+        if id in root._timers:
+          unused, func, args = root._timers.pop(id)
+          func(*args)
+      self.update_idletasks()
+
+  def mainloop(self, n=0):
+    """
+    Execute the callbacks until there are no queued callbacks left or `quit()` is called.
+    """
+    root = self._root()
+    root._quit = False
+    while not root._quit and not root._destroyed:
+      self.update()
+      if not root._timers or root._quit:
+        break
+      wait = min(t[0] for t in root._timers.values()) - time.monotonic()
+      if wait > 0:
+        time.sleep(wait)
+
+  def quit(self):
+    """
+    Quit the main loop.
+    """
+    self._root()._quit = True
+
+  #endregion
+
+class Wm(object):
+  """
+  The marker class of the windows.
+  """
+  pass
+
+class Widget(Misc):
+  """
+  The base class of the headless widgets.
+  """
+  _real = tkinter.Widget
+
+  def __init__(self, master=None, cnf={}, **kw):
+    super().__init__()
+    if master is None:
+      master = _get_default_root()
+    options = dict(cnf, **kw)
+    name = options.pop("name", None)
+    for n in self._params:
+      options.pop(n, None)
+    options = self._normalize(options)
+    self._check_options(options)
+    self.options.update(options)
+    self.master = master
+    if name is None:
+      name = "!" + type(self).__name__.lower()
+      count = master._childcounts.get(name, 0) + 1
+      master._childcounts[name] = count
+      if count > 1:
+        name = f"{name}{count}"
+    self._name = name
+    self._w = ("." if master._w == "." else master._w + ".") + name
+    if name in master.children:
+      master.children[name].destroy()
+    master.children[name] = self
+
+  def pack_configure(self, cnf={}, **kw):
+    """
+    Record the pack geometry manager.
+    """
+    self._record("pack", (), dict(cnf, **kw))
+    self.manager = "pack"
+
+  def grid_configure(self, cnf={}, **kw):
+    """
+    Record the grid geometry manager.
+    """
+    self._record("grid", (), dict(cnf, **kw))
+    self.manager = "grid"
+
+  def place_configure(self, cnf={}, **kw):
+    """
+    Record the place geometry manager.
+    """
+    self._record("place", (), dict(cnf, **kw))
+    self.manager = "place"
+
+  def pack(self, cnf={}, **kw):
+    self.pack_configure(cnf, **kw)
+
+  def grid(self, cnf={}, **kw):
+    self.grid_configure(cnf, **kw)
+
+  def place(self, cnf={}, **kw):
+    self.place_configure(cnf, **kw)
+
+@_mimic(tkinter.Tk, options_from=tkinter.Toplevel)
+class Tk(Misc, Wm):
+  """
+  The headless root window.
+  """
+  def __init__(self, screenName=None, baseName=None, className="Tk", useTk=True, sync=False, use=None):
+    super().__init__()
+    self._timers = {}
+    self._idles = {}
+    self._taskcount = 0
+    self._bindall = {}
+    self._variables = {}
+    self._quit = False
+    global _default_root
+    if _default_root is None:
+      _default_root = self
+
+  def destroy(self):
+    global _default_root
+    super().destroy()
+    self._timers.clear()
+    self._idles.clear()
+    if _default_root is self:
+      _default_root = None
+
+@_mimic(tkinter.Toplevel)
+class Toplevel(Widget, Wm): pass
+
+@_mimic(tkinter.Button)
+class Button(Widget): pass
+
+@_mimic(tkinter.Canvas)
+class Canvas(Widget): pass
+
+@_mimic(tkinter.Checkbutton)
+class Checkbutton(Widget): pass
+
+@_mimic(tkinter.Entry)
+class Entry(Widget): pass
+
+@_mimic(tkinter.Frame)
+class Frame(Widget): pass
+
+@_mimic(tkinter.Label)
+class Label(Widget): pass
+
+@_mimic(tkinter.LabelFrame)
+class LabelFrame(Widget): pass
+
+@_mimic(tkinter.Listbox)
+class Listbox(Widget): pass
+
+@_mimic(tkinter.Menubutton)
+class Menubutton(Widget): pass
+
+@_mimic(tkinter.Message)
+class Message(Widget): pass
+
+@_mimic(tkinter.PanedWindow)
+class PanedWindow(Widget): pass
+
+@_mimic(tkinter.Radiobutton)
+class Radiobutton(Widget): pass
+
+@_mimic(tkinter.Scale)
+class Scale(Widget): pass
+
+@_mimic(tkinter.Scrollbar)
+class Scrollbar(Widget): pass
+
+@_mimic(tkinter.Spinbox)
+class Spinbox(Widget): pass
+
+@_mimic(tkinter.Text)
+class Text(Widget): pass
+
+@_mimic(tkinter.Menu)
+class Menu(Widget):
+  """
+  The headless menu.
+  The menu entries are stored in `entries` as dictionaries of the entry type and the options.
+  """
+  def __init__(self, master=None, cnf={}, **kw):
+    super().__init__(master, cnf, **kw)
+    self.entries = [{"type": "tearoff"}] if self.options.get("tearoff", 1) else []
+
+  def add(self, itemType, cnf={}, **kw):
+    """
+    Add a menu entry.
+    """
+    self.insert(None, itemType, cnf, **kw)
+
+  def add_cascade(self, cnf={}, **kw):
+    self.add("cascade", cnf, **kw)
+
+  def add_checkbutton(self, cnf={}, **kw):
+    self.add("checkbutton", cnf, **kw)
+
+  def add_command(self, cnf={}, **kw):
+    self.add("command", cnf, **kw)
+
+  def add_radiobutton(self, cnf={}, **kw):
+    self.add("radiobutton", cnf, **kw)
+
+  def add_separator(self, cnf={}, **kw):
+    self.add("separator", cnf, **kw)
+
+  def insert(self, index, itemType, cnf={}, **kw):
+    """
+    Insert a menu entry before the index. If the index is None, the entry is added to the end.
+    """
+    entry = self._normalize(dict(cnf, **kw))
+    self._record(f"add_{itemType}" if index is None else f"insert_{itemType}", () if index is None else (index,), entry)
+    entry["type"] = itemType
+    if index is None:
+      self.entries.append(entry)
+    else:
+      # A number can be the index after the last entry, as in Tk.
+      i = min(index, len(self.entries)) if type(index) is int else self.index(index)
+      self.entries.insert(len(self.entries) if i is None else i, entry)
+
+  def insert_cascade(self, index, cnf={}, **kw):
+    self.insert(index, "cascade", cnf, **kw)
+
+  def insert_checkbutton(self, index, cnf={}, **kw):
+    self.insert(index, "checkbutton", cnf, **kw)
+
+  def insert_command(self, index, cnf={}, **kw):
+    self.insert(index, "command", cnf, **kw)
+
+  def insert_radiobutton(self, index, cnf={}, **kw):
+    self.insert(index, "radiobutton", cnf, **kw)
+
+  def insert_separator(self, index, cnf={}, **kw):
+    self.insert(index, "separator", cnf, **kw)
+
+  def delete(self, index1, index2=None):
+    """
+    Delete the menu entries from index1 to index2.
+    """
+    self._record("delete", (index1,) if index2 is None else (index1, index2))
+    i1 = self.index(index1)
+    i2 = i1 if index2 is None else self.index(index2)
+    if i1 is None or i2 is None:
+      return
+    del self.entries[i1:i2 + 1]
+
+  def entrycget(self, index, option):
+    """
+    Get the option of the menu entry.
+    """
+    return self.entries[self._entry(index)].get(option, "")
+
+  def entryconfigure(self, index, cnf=None, **kw):
+    """
+    Set or get the options of the menu entry.
+    """
+    i = self._entry(index)
+    options = self._normalize(dict(cnf or {}, **kw))
+    if not options:
+      return {n: v for n, v in self.entries[i].items() if n != "type"}
+    self._record("entryconfigure", (index,), options)
+    self.entries[i].update(options)
+
+  entryconfig = entryconfigure
+
+  def index(self, index):
+    """
+    Get the numerical index of the menu entry.
+    The index is a number, "end", "last", "none" or a pattern of the label.
+    """
+    if type(index) is int:
+      return min(index, len(self.entries) - 1) if self.entries else None
+    if index in ("end", "last"):
+      return len(self.entries) - 1 if self.entries else None
+    if index in ("none", "active", ""):
+      return None
+    if str(index).isdigit():
+      return self.index(int(index))
+    for i, e in enumerate(self.entries):
+      if "label" in e and fnmatch.fnmatchcase(str(e["label"]), str(index)):
+        return i
+    raise TclError(f'bad menu entry index "{index}"')
+
+  def type(self, index):
+    """
+    Get the type of the menu entry.
+    """
+    return self.entries[self._entry(index)]["type"]
+
+  def invoke(self, index):
+    """
+    Invoke the menu entry as if it was selected.
+    """
+    self._record("invoke", (index,))
+    entry = self.entries[self._entry(index)]
+    if entry.get("state") == "disabled":
+      return ""
+    variable = entry.get("variable")
+    if entry["type"] == "checkbutton" and variable is not None:
+      on, off = entry.get("onvalue", 1), entry.get("offvalue", 0)
+      variable.set(off if _tclstr(variable.get()) == _tclstr(on) else on)
+    elif entry["type"] == "radiobutton" and variable is not None:
+      variable.set(entry.get("value", entry.get("label")))
+    command = entry.get("command")
+    return command() if callable(command) else ""
+
+  def post(self, x, y):
+    """
+    Display the menu at the coordinates. The postcommand is called first.
+    """
+    self._record("post", (x, y))
+    command = self.options.get("postcommand")
+    if callable(command):
+      command()
+
+  def _entry(self, index):
+    i = self.index(index)
+    if i is None:
+      raise TclError(f'bad menu entry index "{index}"')
+    return i
+
+#region variables
+
+class Variable(object):
+  """
+  The headless variable.
+  The value and the traces are kept in the root window for each variable name,
+  so the variables with the same name share them as the Tcl variables do.
+  """
+  _default = ""
+
+  def __init__(self, master=None, value=None, name=None):
+    """Construct a variable
+
+    MASTER can be given as master widget.
+    VALUE is an optional value (defaults to "")
+    NAME is an optional Tcl name (defaults to PY_VARnum).
+
+    If NAME matches an existing variable and VALUE is omitted
+    then the existing value is retained.
+    """
+    global _varnum
+    if master is None:
+      master = _get_default_root("create variable")
+    self._root = master._root()
+    if name is None:
+      name = f"PY_VAR{_varnum}"
+      _varnum += 1
+    self._name = name
+    if value is not None:
+      self.initialize(value)
+    elif not name in self._root._variables:
+      self.initialize(self._default)
+
+  def __str__(self):
+    return self._name
+
+  def __repr__(self):
+    return f"<{type(self).__module__}.{type(self).__qualname__} object {self._name}>"
+
+  def __eq__(self, other):
+    if not isinstance(other, Variable):
+      return NotImplemented
+    return self._name == other._name and type(self) is type(other) and self._root is other._root
+
+  def __hash__(self):
+    return hash(self._name)
+
+  def _slot(self):
+    return self._root._variables.setdefault(self._name, {"value": self._default, "traces": [], "active": False})
+
+  def set(self, value):
+    """
+    Set the variable to VALUE.
+    """
+    self._slot()["value"] = value
+    self._fire("write")
+
+  initialize = set
+
+  def get(self):
+    """
+    Return value of variable.
+    """
+    self._fire("read")
+    return self._slot()["value"]
+
+  def trace_add(self, mode, callback):
+    """
+    Define a trace callback for the variable.
+    MODE is "read", "write", "unset", or a list or tuple of such strings.
+    """
+    modes = (mode,) if type(mode) is str else tuple(mode)
+    return self._add_trace(modes, callback, False)
+
+  def trace_remove(self, mode, cbname):
+    """
+    Delete the trace callback for a variable.
+    """
+    self._remove_trace(cbname)
+
+  def trace_info(self):
+    """
+    Return all trace callback information.
+    """
+    return [(modes, cbname) for modes, cbname, unused, old in self._slot()["traces"] if not old]
+
+  def trace_variable(self, mode, callback):
+    """
+    Define a trace callback for the variable.
+    MODE is one of "r", "w", "u" for read, write, undefine.
+    """
+    modes = tuple({"r": "read", "w": "write", "u": "unset"}[m] for m in mode)
+    return self._add_trace(modes, callback, True)
+
+  trace = trace_variable
+
+  def trace_vdelete(self, mode, cbname):
+    """
+    Delete the trace callback for a variable.
+    """
+    self._remove_trace(cbname)
+
+  def trace_vinfo(self):
+    """
+    Return all trace callback information.
+    """
+    return [("".join(m[0] for m in modes), cbname) for modes, cbname, unused, old in self._slot()["traces"] if old]
+
+  def _add_trace(self, modes, callback, old):
+    cbname = f"{id(callback)}{getattr(callback, '__name__', '')}"
+    self._slot()["traces"].append((modes, cbname, callback, old))
+    return cbname
+
+  def _remove_trace(self, cbname):
+    slot = self._slot()
+    for i, t in enumerate(slot["traces"]):
+      if t[1] == cbname:
+        del slot["traces"][i]
+        break
+
+  def _fire(self, mode):
+    """
+    Call the traces. The traces are not called while the traces of the variable are running, as in Tcl.
+    """
+    slot = self._slot()
+    if slot["active"] or not slot["traces"]:
+      return
+    slot["active"] = True
+    try:
+      for modes, unused, callback, old in reversed(list(slot["traces"])):
+        if mode in modes:
+          callback(self._name, "", mode[0] if old else mode)
+    finally:
+      slot["active"] = False
+
+class StringVar(Variable):
+  """
+  Value holder for strings variables.
+  """
+  _default = ""
+
+  def get(self):
+    """
+    Return value of variable as string.
+    """
+    value = super().get()
+    return value if isinstance(value, str) else str(value)
+
+class IntVar(Variable):
+  """
+  Value holder for integer variables.
+  """
+  _default = 0
+
+  def get(self):
+    """
+    Return the value of the variable as an integer.
+    """
+    value = super().get()
+    try:
+      return int(value)
+    except (TypeError, ValueError):
+      pass
+    try:
+      return int(float(value))
+    except (TypeError, ValueError):
+      raise TclError(f'expected integer but got "{value}"')
+
+class DoubleVar(Variable):
+  """
+  Value holder for float variables.
+  """
+  _default = 0.0
+
+  def get(self):
+    """
+    Return the value of the variable as a float.
+    """
+    value = super().get()
+    try:
+      return float(value)
+    except (TypeError, ValueError):
+      raise TclError(f'expected floating-point number but got "{value}"')
+
+class BooleanVar(Variable):
+  """
+  Value holder for boolean variables.
+  """
+  _default = False
+
+  def set(self, value):
+    """
+    Set the variable to VALUE.
+    """
+    super().set(_getboolean(value))
+
+  initialize = set
+
+  def get(self):
+    """
+    Return the value of the variable as a bool.
+    """
+    return _getboolean(super().get())
+
+def _tclstr(value):
+  """
+  Convert the value to a string in the same way as Tcl.
+  """
+  return str(int(value)) if type(value) is bool else str(value)
+
+def _getboolean(value):
+  """
+  Convert the value to a bool in the same way as Tcl.
+  """
+  if type(value) is bool:
+    return value
+  if isinstance(value, (int, float)):
+    return value != 0
+  s = str(value).strip().lower()
+  if s in ("1", "true", "yes", "on", "t", "y"):
+    return True
+  if s in ("0", "false", "no", "off", "f", "n"):
+    return False
+  raise ValueError(f'expected boolean value but got "{value}"')
+
+#endregion
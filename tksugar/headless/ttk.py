@@ -0,0 +1,162 @@
+"""
+The headless classes that can be used in place of `tkinter.ttk`.
+See `tksugar.headless`.
+"""
+import tkinter.ttk
+
+from tksugar.headless import _mimic, TclError, Widget
+
+@_mimic(tkinter.ttk.Button)
+class Button(Widget): pass
+
+@_mimic(tkinter.ttk.Checkbutton)
+class Checkbutton(Widget): pass
+
+@_mimic(tkinter.ttk.Combobox)
+class Combobox(Widget): pass
+
+@_mimic(tkinter.ttk.Entry)
+class Entry(Widget): pass
+
+@_mimic(tkinter.ttk.Frame)
+class Frame(Widget): pass
+
+@_mimic(tkinter.ttk.Label)
+class Label(Widget): pass
+
+@_mimic(tkinter.ttk.Labelframe)
+class Labelframe(Widget): pass
+
+LabelFrame = Labelframe
+
+@_mimic(tkinter.ttk.Menubutton)
+class Menubutton(Widget): pass
+
+@_mimic(tkinter.ttk.Panedwindow)
+class Panedwindow(Widget): pass
+
+PanedWindow = Panedwindow
+
+@_mimic(tkinter.ttk.Progressbar)
+class Progressbar(Widget): pass
+
+@_mimic(tkinter.ttk.Radiobutton)
+class Radiobutton(Widget): pass
+
+@_mimic(tkinter.ttk.Scale)
+class Scale(Widget): pass
+
+@_mimic(tkinter.ttk.Scrollbar)
+class Scrollbar(Widget): pass
+
+@_mimic(tkinter.ttk.Separator)
+class Separator(Widget): pass
+
+@_mimic(tkinter.ttk.Sizegrip)
+class Sizegrip(Widget): pass
+
+@_mimic(tkinter.ttk.Spinbox)
+class Spinbox(Widget): pass
+
+@_mimic(tkinter.ttk.Treeview)
+class Treeview(Widget): pass
+
+@_mimic(tkinter.ttk.Notebook)
+class Notebook(Widget):
+  """
+  The headless notebook.
+  The tabs are stored in `tablist` as lists of the tab widget and the tab options.
+  As in Tk, the first tab added is selected, and the <<NotebookTabChanged>> event is
+  generated when the idle callbacks are executed.
+  """
+  def __init__(self, master=None, cnf={}, **kw):
+    super().__init__(master, cnf, **kw)
+    self.tablist = []
+    self._current = None
+
+  def add(self, child, **kw):
+    """
+    Add a tab. If the widget is already a tab, its options are updated.
+    """
+    self._record("add", (child,), kw)
+    for t in self.tablist:
+      if t[0] is child:
+        t[1].update(kw)
+        return
+    self.tablist.append([child, dict(kw)])
+    if self._current is None:
+      self.select(child)
+
+  def insert(self, pos, child, **kw):
+    """
+    Insert a tab at the position.
+    """
+    self._record("insert", (pos, child), kw)
+    self.tablist = [t for t in self.tablist if t[0] is not child]
+    i = len(self.tablist) if pos == "end" else self.index(pos)
+    self.tablist.insert(i, [child, dict(kw)])
+    if self._current is None:
+      self.select(child)
+
+  def forget(self, tab_id):
+    """
+    Remove the tab.
+    """
+    i = self.index(tab_id)
+    child = self.tablist.pop(i)[0]
+    if self._current is child:
+      self._current = None
+      if self.tablist:
+        self.select(min(i, len(self.tablist) - 1))
+
+  def hide(self, tab_id):
+    """
+    Hide the tab.
+    """
+    self.tab(tab_id, state="hidden")
+
+  def index(self, tab_id):
+    """
+    Get the position of the tab.
+    """
+    if type(tab_id) is int:
+      if 0 <= tab_id < len(self.tablist):
+        return tab_id
+    elif tab_id == "end":
+      return len(self.tablist)
+    elif tab_id == "current":
+      return self.index(self._current)
+    else:
+      for i, t in enumerate(self.tablist):
+        if t[0] is tab_id or str(t[0]) == str(tab_id):
+          return i
+    raise TclError(f'Slave index "{tab_id}" out of bounds')
+
+  def select(self, tab_id=None):
+    """
+    Select the tab. If the tab is omitted, the name of the selected tab is returned.
+    """
+    if tab_id is None:
+      return "" if self._current is None else str(self._current)
+    child = self.tablist[self.index(tab_id)][0]
+    if child is not self._current:
+      self._current = child
+      self.event_generate("<<NotebookTabChanged>>", when="tail")
+
+  def tab(self, tab_id, option=None, **kw):
+    """
+    Set or get the options of the tab.
+    """
+    options = self.tablist[self.index(tab_id)][1]
+    if option is not None:
+      return options.get(option, "")
+    if not kw:
+      return dict(options)
+    self._record("tab", (tab_id,), kw)
+    options.update(kw)
+
+  def tabs(self):
+    """
+    Get the names of the tabs.
+    """
+    return tuple(str(t[0]) for t in self.tablist)
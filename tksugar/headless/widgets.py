@@ -0,0 +1,44 @@
+"""
+The headless classes that can be used in place of `tksugar.widgets`.
+See `tksugar.headless`.
+"""
+from tksugar import headless
+from tksugar.headless import ttk
+from tksugar.widgets.generatorsupport import GeneratorSupport
+from tksugar.widgets.menu import MenuSupport
+from tksugar.widgets.notebook import NotebookSupport
+
+class Menu(headless.Menu, MenuSupport):
+  """
+  Headless `tksugar.widgets.Menu`.
+  """
+  def __init__(self, master=None, cnf={}, **kw):
+    """Construct menu widget with the parent MASTER.
+
+    Valid resource names: activebackground, activeborderwidth,
+    activeforeground, background, bd, bg, borderwidth, cursor,
+    disabledforeground, fg, font, foreground, postcommand, relief,
+    selectcolor, takefocus, tearoff, tearoffcommand, title, type."""
+    super().__init__(master=None, cnf=cnf, **kw)
+    self._setup(master, headless.Wm)
+
+class Notebook(ttk.Notebook, NotebookSupport):
+  """
+  Headless `tksugar.widgets.Notebook`.
+  """
+  def __init__(self, master=None, lazy=False, **kw):
+    """Construct a Ttk Notebook with parent master.
+
+    STANDARD OPTIONS
+
+        class, cursor, style, takefocus
+
+    WIDGET-SPECIFIC OPTIONS
+
+        height, padding, width
+
+    lazy: bool
+      If True, the child elements of all tabs are created when the tab is selected for the first time.
+    """
+    super().__init__(master, **kw)
+    self._setup(lazy)
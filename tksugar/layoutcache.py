@@ -0,0 +1,135 @@
+import hashlib
+import os
+import pickle
+from pathlib import Path
+
+class LayoutCache(object):
+  """
+  An on-disk cache of layout trees scanned by `tksugar.Generator`.
+
+  Each entry holds the scanned tree and the declared variables of a layout file.
+  An entry is keyed by the content of the layout file and the localization file,
+  and records the content hash of every file read through `!include`,
+  so that an entry is discarded as soon as any of those files changes.
+  """
+  VERSION = 1
+
+  def __init__(self, directory):
+    """
+    Constructor.
+
+    Parameters
+    ----
+    directory: str
+      The directory where the cache files are stored.
+      If the directory does not exist, it is created when the first entry is stored.
+    """
+    self.directory = Path(directory)
+    self.includes = []
+    """
+    Paths of the files read through `!include` by the layout of the entry read last.
+    """
+
+  @staticmethod
+  def hash_file(path):
+    """
+    Get the content hash of the file.
+
+    Parameters
+    ----
+    path: str
+      File path.
+
+    Returns
+    ----
+    hash: str|None
+      Hexadecimal SHA-256 digest. None if the file does not exist.
+    """
+    try:
+      with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+      return None
+
+  @staticmethod
+  def make_key(*parts):
+    """
+    Create a cache key from the given strings.
+
+    Parameters
+    ----
+    parts: list[str]
+      Strings that identify the layout. None is treated as an empty string.
+
+    Returns
+    ----
+    key: str
+      Cache key.
+    """
+    h = hashlib.sha256()
+    for p in parts:
+      h.update(("" if p is None else str(p)).encode("UTF-8"))
+      h.update(b"\0")
+    return h.hexdigest()
+
+  def load(self, key):
+    """
+    Read the entry for the key.
+
+    Parameters
+    ----
+    key: str
+      Cache key.
+
+    Returns
+    ----
+    entry: tuple(dict, dict)|None
+      The scanned tree and the variable declarations.
+      None if there is no entry, or if any included file has been changed since the entry was stored.
+    """
+    try:
+      with open(self._path(key), "rb") as f:
+        entry = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+      return None
+    if type(entry) is not dict or entry.get("version") != LayoutCache.VERSION:
+      return None
+    for path, digest in entry["includes"]:
+      if LayoutCache.hash_file(path) != digest:
+        return None
+    self.includes = [path for path, digest in entry["includes"]]
+    return entry["tree"], entry["vars"]
+
+  def store(self, key, tree, vars, includes):
+    """
+    Write the entry for the key.
+
+    Parameters
+    ----
+    key: str
+      Cache key.
+    tree: dict
+      The scanned tree.
+    vars: dict
+      The variable declarations.
+    includes: list[str]
+      Paths of the files read through `!include`.
+    """
+    entry = {
+      "version": LayoutCache.VERSION,
+      "includes": [(p, LayoutCache.hash_file(p)) for p in dict.fromkeys(includes)],
+      "tree": tree,
+      "vars": vars,
+    }
+    self.directory.mkdir(parents=True, exist_ok=True)
+    path = self._path(key)
+    temp = path.with_name(f"{key}.{os.getpid()}.tmp")
+    with open(temp, "wb") as f:
+      pickle.dump(entry, f, pickle.HIGHEST_PROTOCOL)
+    temp.replace(path)
+
+  def _path(self, key):
+    """
+    Get the path of the cache file for the key.
+    """
+    return self.directory / f"{key}.pickle"
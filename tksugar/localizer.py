@@ -1,7 +1,22 @@
-from pathlib import Path
+import marshal
+import os
 import re
 
-from yaml.loader import SafeLoader
+import yaml
+
+Loader = getattr(yaml, "CSafeLoader", None) or yaml.SafeLoader
+"""
+The YAML Loader class used to read the dictionary files.
+"""
+COMPILED_SUFFIX = ".marshal"
+"""
+The suffix of the compiled dictionary files.
+"""
+COMPILED_VERSION = 1
+MARKER = re.compile(r":::\S+")
+"""
+The string to be translated.
+"""
 
 class Localizer(object):
   """
@@ -12,7 +27,13 @@ class Localizer(object):
 
   Dictionary data can have a hierarchical structure.
   Data with a hierarchical structure is expanded into a character string delimited during translation processing.
+
+  The expanded dictionaries are kept for the life of the process and shared by all Localizer objects,
+  until the dictionary file is modified.
+  A dictionary can also be compiled into a file that is read faster than YAML, see `Localizer.compile()`.
   """
+  _tables = {}
+
   def __init__(self, file, encoding="UTF-8"):
     """
     Constructor.
@@ -20,21 +41,117 @@ class Localizer(object):
     Parameters
     ----
     file: str
-      The path to the YAML file that contains the translation string.
+      The path to the YAML file that contains the translation string,
+      or the path to a dictionary file compiled by `Localizer.compile()`.
     encoding: str
       File Encoding.
     """
-    self.string = ""
-    p = Path(file)
-    if file and p.exists():
-      with open(p, "r", encoding=encoding) as f:
-        self.string = f.read()
-    self._translatedict = None
+    self.file = file
+    self.encoding = encoding
+    self._translatedict = Localizer.load_table(file, encoding)
 
   def _prepare(self):
     """
     Read and prepare the data list.
     """
+    if self._translatedict is None:
+      self._translatedict = Localizer.load_table(self.file, self.encoding)
+
+  @staticmethod
+  def load_table(file, encoding="UTF-8"):
+    """
+    Get the expanded dictionary of the dictionary file.
+    The dictionary is read once and kept until the modification time, the size or the encoding of the file changes.
+    If there is a compiled dictionary of the file (the file name followed by `COMPILED_SUFFIX`)
+    that is up to date, it is read instead of the YAML.
+
+    Parameters
+    ----
+    file: str
+      The path to the dictionary file.
+    encoding: str
+      File Encoding.
+
+    Returns
+    ----
+    table: dict[str, Any]
+      A dictionary object that associates the keywords with the strings. Do not modify the returned dictionary.
+      If the file does not exist, an empty dictionary is returned.
+    """
+    if not file:
+      return {}
+    path = os.path.abspath(file)
+    try:
+      st = os.stat(path)
+    except OSError:
+      return {}
+    stamp = (st.st_mtime_ns, st.st_size, encoding)
+    entry = Localizer._tables.get(path)
+    if entry is not None and entry[0] == stamp:
+      return entry[1]
+    if path.endswith(COMPILED_SUFFIX):
+      table = _read_compiled(path)
+      if table is None:
+        raise ValueError(f'"{file}" is not a compiled dictionary of this version.')
+    else:
+      table = _read_compiled(path + COMPILED_SUFFIX, stamp)
+      if table is None:
+        table = Localizer._read_yaml(path, encoding)
+    Localizer._tables[path] = (stamp, table)
+    return table
+
+  @staticmethod
+  def clear_cache():
+    """
+    Discard all expanded dictionaries kept by `Localizer.load_table()`.
+    """
+    Localizer._tables.clear()
+
+  @staticmethod
+  def compile(file, encoding="UTF-8", output=None):
+    """
+    Compile the dictionary file into a file that is read faster than YAML.
+    If the compiled file is written next to the dictionary file with the default name,
+    it is used automatically while the dictionary file is not modified.
+
+    Parameters
+    ----
+    file: str
+      The path to the YAML file that contains the translation string.
+    encoding: str
+      File Encoding.
+    output: str
+      The path of the compiled file. If omitted, `COMPILED_SUFFIX` is appended to the path of the dictionary file.
+
+    Returns
+    ----
+    output: str
+      The path of the compiled file.
+
+    Raises
+    ----
+    ValueError
+      The dictionary contains values other than str, int, float, bool and None.
+    """
+    path = os.path.abspath(file)
+    st = os.stat(path)
+    data = {
+      "version": COMPILED_VERSION,
+      "stamp": (st.st_mtime_ns, st.st_size, encoding),
+      "table": Localizer._read_yaml(path, encoding),
+    }
+    output = output or path + COMPILED_SUFFIX
+    temp = f"{output}.{os.getpid()}.tmp"
+    with open(temp, "wb") as f:
+      marshal.dump(data, f)
+    os.replace(temp, output)
+    return output
+
+  @staticmethod
+  def _read_yaml(path, encoding):
+    """
+    Read the YAML dictionary file and expand it.
+    """
     def flatten_dict(basename, struct):
       result = {}
       if type(struct) is dict:
@@ -46,14 +163,14 @@ class Localizer(object):
           else:
             result[f"{basename}{k}"] = struct[k]
       return result
-    if self._translatedict is None:
-      # Read
-      loader = SafeLoader(self.string)
-      try:
-        data = loader.get_single_data()
-      finally:
-        loader.dispose()
-      self._translatedict = flatten_dict("", data)
+    with open(path, "r", encoding=encoding) as f:
+      string = f.read()
+    loader = Loader(string)
+    try:
+      data = loader.get_single_data()
+    finally:
+      loader.dispose()
+    return flatten_dict("", data)
 
   def localize(self, data):
     """
@@ -67,16 +184,58 @@ class Localizer(object):
     """
     def translate_core(data):
       for k in data.keys() if type(data) is dict else range(len(data)):
-        if type(data[k]) is dict:
-          translate_core(data[k])
-        elif type(data[k]) is list:
-          translate_core(data[k])
-        elif type(data[k]) is str:
-          data[k] = rexp.sub(lambda m: self._translate(m.group(0)[3:]), data[k])
-    rexp = re.compile(r":::\S+")
+        v = data[k]
+        if type(v) is str:
+          if ":::" in v:
+            data[k] = MARKER.sub(self._replace, v)
+        elif type(v) is dict or type(v) is list:
+          translate_core(v)
     self._prepare()
     translate_core(data)
 
+  def translate(self, value):
+    """
+    Translate the given value without modifying it.
+    Only the strings that contain the three colons are translated, other strings are returned as they are.
+
+    Parameters
+    ----
+    value: Any
+      A string, or a dict or list containing strings.
+
+    Returns
+    ----
+    value: Any
+      The translated value. Dicts and lists that contain translated strings are copied, others are returned as they are.
+    """
+    if type(value) is str:
+      return MARKER.sub(self._replace, value) if ":::" in value else value
+    elif type(value) is dict:
+      result = None
+      for k, v in value.items():
+        t = self.translate(v)
+        if t is not v:
+          if result is None:
+            result = dict(value)
+          result[k] = t
+      return value if result is None else result
+    elif type(value) is list:
+      result = None
+      for i, v in enumerate(value):
+        t = self.translate(v)
+        if t is not v:
+          if result is None:
+            result = list(value)
+          result[i] = t
+      return value if result is None else result
+    return value
+
+  def _replace(self, match):
+    """
+    Replacement function of `MARKER`.
+    """
+    return self._translate(match.group(0)[3:])
+
   def _translate(self, name):
     """
     Perform translation processing.
@@ -93,3 +252,39 @@ class Localizer(object):
       If the keywords were not present in the dictionary, the string is returned as is without replacement.
     """
     return self._translatedict[name] if name in self._translatedict else name
+
+def _read_compiled(path, stamp=None):
+  """
+  Read the compiled dictionary file.
+
+  Parameters
+  ----
+  path: str
+    The path of the compiled file.
+  stamp: tuple
+    If specified, the compiled file is only used if it was compiled from the dictionary file with this stamp.
+
+  Returns
+  ----
+  table: dict[str, Any]|None
+    The expanded dictionary. None if the file does not exist, is out of date or is of another version.
+  """
+  try:
+    with open(path, "rb") as f:
+      data = marshal.load(f)
+  except (OSError, EOFError, ValueError, TypeError):
+    return None
+  if type(data) is not dict or data.get("version") != COMPILED_VERSION:
+    return None
+  if stamp is not None and tuple(data.get("stamp", ())) != stamp:
+    return None
+  return data.get("table")
+
+if __name__ == "__main__":
+  import argparse
+  parser = argparse.ArgumentParser(prog="python -m tksugar.localizer", description="Compile a dictionary file for the Localizer.")
+  parser.add_argument("file", help="dictionary file")
+  parser.add_argument("output", nargs="?", help=f"compiled file (default: the dictionary file followed by {COMPILED_SUFFIX})")
+  parser.add_argument("-e", "--encoding", default="UTF-8", help="file encoding")
+  args = parser.parse_args()
+  print(Localizer.compile(args.file, args.encoding, args.output))
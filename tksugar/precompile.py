@@ -0,0 +1,241 @@
+"""
+Precompiles the layout files of a directory into files that the Generator reads without parsing YAML.
+
+Each layout is read, localized and scanned, its classes are resolved in the modules
+and the parameters of each widget are split into the constructor arguments and the others.
+The result is written next to the layout file with the suffix `.tkc`, or in the same structure under the output directory.
+The files are compiled in parallel by a process pool.
+
+```
+python -m tksugar.precompile samples/yml
+```
+
+The precompiled file is passed to the Generator instead of the layout file.
+
+```
+gen = Generator("samples/yml/calc.tkc")
+```
+
+If the layout file or the included files next to the precompiled file have been changed since it was compiled,
+or the Generator is created with other modules or another localization file than the ones used to compile it,
+the Generator reads the layout file instead.
+Files that cannot be compiled are reported, except the files that are only included by other layouts.
+"""
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import os
+from pathlib import Path
+import pickle
+import sys
+import time
+import traceback
+
+from tksugar.generator import Generator
+
+PRECOMPILED_SUFFIX = ".tkc"
+"""
+The suffix of the precompiled files.
+"""
+PRECOMPILED_VERSION = 2
+"""
+The version of the format of the precompiled files.
+"""
+
+def precompile_file(file, output=None, modules=["tksugar.widgets", "tkinter"], localization_file="", encoding="UTF-8"):
+  """
+  Precompile the layout file.
+
+  Parameters
+  ----
+  file: str
+    A file path describing the window's object and layout.
+  output: str
+    The path of the precompiled file. If omitted, the suffix of the layout file is replaced with `.tkc`.
+  modules: list[str]
+    An array indicating the name of the module to be used.
+  localization_file: str
+    Path indicating a YAML-formatted dictionary file used for UI localization.
+    The layout is localized when it is compiled.
+  encoding: str
+    File Encoding.
+
+  Returns
+  ----
+  output: str
+    The path of the precompiled file.
+  includes: list[str]
+    Paths of the files read through `!include`.
+
+  Raises
+  ----
+  TypeError
+    A class in the layout does not exist in the modules.
+  """
+  output = Path(output or Path(file).with_suffix(PRECOMPILED_SUFFIX))
+  gen = Generator(file, modules=list(modules), localization_file=localization_file, encoding=encoding)
+  tree, vars = gen._prepare()
+  loaded = gen._load_modules()
+  _resolve(tree, loaded)
+  base = output.parent.resolve()
+  artifact = {
+    "version": PRECOMPILED_VERSION,
+    "modules": list(modules),
+    "sources": [(_relpath(p, base), _hash(p)) for p in dict.fromkeys([os.path.abspath(file)] + gen.includes)],
+    "localization": (_relpath(localization_file, base), _hash(localization_file)) if localization_file else None,
+    "tree": tree,
+    "vars": vars,
+  }
+  output.parent.mkdir(parents=True, exist_ok=True)
+  temp = output.with_name(f"{output.name}.{os.getpid()}.tmp")
+  with open(temp, "wb") as f:
+    pickle.dump(artifact, f, pickle.HIGHEST_PROTOCOL)
+  temp.replace(output)
+  return str(output), list(gen.includes)
+
+def precompile_directory(directory, output_dir=None, modules=["tksugar.widgets", "tkinter"], localization_file="", encoding="UTF-8", jobs=None, patterns=["*.yml", "*.yaml"]):
+  """
+  Precompile all layout files in the directory and its subdirectories with a process pool.
+
+  Parameters
+  ----
+  directory: str
+    The directory.
+  output_dir: str
+    The directory where the precompiled files are written in the same structure as the directory.
+    If omitted, they are written next to the layout files.
+  modules: list[str]
+    An array indicating the name of the module to be used.
+  localization_file: str
+    Path indicating a YAML-formatted dictionary file used for UI localization. It is not compiled.
+  encoding: str
+    File Encoding.
+  jobs: int
+    The number of processes. If omitted, the number of CPUs is used.
+  patterns: list[str]
+    The patterns of the layout file names.
+
+  Returns
+  ----
+  results: list[dict]
+    The result of each file in the order of the paths, with the following keys.
+    file: the layout file, output: the precompiled file or None, seconds: the time spent,
+    error: the error message or None, included: True if the file is included by another layout.
+  """
+  root = Path(directory)
+  skip = os.path.abspath(localization_file) if localization_file else None
+  files = sorted({str(p) for pattern in patterns for p in root.rglob(pattern) if os.path.abspath(p) != skip})
+  tasks = []
+  for f in files:
+    output = None
+    if output_dir:
+      output = str((Path(output_dir) / Path(f).relative_to(root)).with_suffix(PRECOMPILED_SUFFIX))
+    tasks.append((f, output, list(modules), localization_file, encoding))
+  if jobs == 1 or len(tasks) <= 1:
+    results = [_worker(t) for t in tasks]
+  else:
+    with ProcessPoolExecutor(jobs) as executor:
+      results = list(executor.map(_worker, tasks))
+  included = {p for r in results for p in r.pop("includes")}
+  for r in results:
+    r["included"] = os.path.abspath(r["file"]) in included
+  return results
+
+def load_precompiled(file):
+  """
+  Read the precompiled file.
+
+  Parameters
+  ----
+  file: str
+    The path of the precompiled file.
+
+  Returns
+  ----
+  artifact: dict
+    The precompiled layout with the following keys.
+    tree: the scanned tree, vars: the variable declarations, includes: the included files,
+    source: the layout file, modules: the modules used to compile it,
+    localization_file: the localization file used to compile it or None,
+    fresh: False if the layout file, the included files or the localization file have been changed since it was compiled.
+
+  Raises
+  ----
+  ValueError
+    The file is not a precompiled file of this version.
+  """
+  with open(file, "rb") as f:
+    artifact = pickle.load(f)
+  if type(artifact) is not dict or artifact.get("version") != PRECOMPILED_VERSION:
+    raise ValueError(f'"{file}" is not a precompiled layout of this version.')
+  base = Path(file).parent
+  sources = [(str((base / p).resolve()), digest) for p, digest in artifact["sources"]]
+  localization = [(str((base / p).resolve()), digest) for p, digest in filter(None, [artifact["localization"]])]
+  return {
+    "tree": artifact["tree"],
+    "vars": artifact["vars"],
+    "source": sources[0][0],
+    "includes": [p for p, unused in sources[1:]],
+    "modules": artifact["modules"],
+    "localization_file": localization[0][0] if localization else None,
+    "fresh": all(not os.path.exists(p) or _hash(p) == digest for p, digest in sources + localization),
+  }
+
+def _resolve(node, modules):
+  """
+  Resolve the classes of the tree and split the parameters of each node.
+  The class is stored in the "class" element, and the names of the constructor arguments in the "init" element.
+  """
+  cls = Generator._load_class(modules, node["classname"])
+  argnames = Generator._get_argnames(cls.__init__)
+  node["class"] = cls
+  node["init"] = [n for n in node["params"] if n in argnames]
+  for c in node["children"]:
+    _resolve(c, modules)
+
+def _worker(task):
+  """
+  Precompile a file in a process of the pool.
+  """
+  file, output, modules, localization_file, encoding = task
+  start = time.perf_counter()
+  result = {"file": file, "output": None, "seconds": 0.0, "error": None, "includes": []}
+  try:
+    result["output"], result["includes"] = precompile_file(file, output, modules, localization_file, encoding)
+  except Exception as e:
+    result["error"] = "".join(traceback.format_exception_only(type(e), e)).strip()
+  result["seconds"] = time.perf_counter() - start
+  return result
+
+def _hash(path):
+  with open(path, "rb") as f:
+    return hashlib.sha256(f.read()).hexdigest()
+
+def _relpath(path, base):
+  return Path(os.path.relpath(path, base)).as_posix()
+
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser(prog="python -m tksugar.precompile", description="Precompile the layout files of a directory.")
+  parser.add_argument("directory", help="directory of the layout files")
+  parser.add_argument("-o", "--output", default=None, help="directory to write the precompiled files (default: next to the layout files)")
+  parser.add_argument("-m", "--module", action="append", dest="modules", help="module to be used (can be repeated)")
+  parser.add_argument("-l", "--localization", default="", help="localization file")
+  parser.add_argument("-e", "--encoding", default="UTF-8", help="file encoding")
+  parser.add_argument("-j", "--jobs", type=int, default=None, help="number of processes (default: number of CPUs)")
+  args = parser.parse_args()
+  start = time.perf_counter()
+  results = precompile_directory(args.directory, args.output, args.modules or ["tksugar.widgets", "tkinter"], args.localization, args.encoding, args.jobs)
+  errors = 0
+  for r in results:
+    if r["error"] is None:
+      status = "ok"
+    elif r["included"]:
+      status = "included"
+    else:
+      status = "error"
+      errors += 1
+    print(f"{r['seconds'] * 1000:9.2f}ms  {status:<8}  {r['file']}" + (f" -> {r['output']}" if r["output"] else ""))
+    if status == "error":
+      print(f"             {r['error']}")
+  print(f"{len(results)} files, {sum(r['error'] is None for r in results)} compiled, {errors} errors in {time.perf_counter() - start:.2f}s")
+  sys.exit(1 if errors else 0)
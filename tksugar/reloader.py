@@ -0,0 +1,327 @@
+from collections import deque
+import inspect
+import os
+import sys
+import tkinter
+import traceback
+
+from tksugar import argtable
+from tksugar.generator import GridColumnCommand, GridRowCommand
+from tksugar.widgets.generatorsupport import GeneratorSupport
+
+POSTCOMMANDS = {
+  "::gridcolumn": GridColumnCommand,
+  "::gridrow": GridRowCommand,
+}
+"""
+The commands that can be executed again when their values are changed.
+If the value of any other command is changed, the widget is created again.
+"""
+
+class LayoutWatcher(object):
+  """
+  An object that reloads the layout of a window generated by `tksugar.Generator`
+  and applies only the differences to the running window. It is created by `TkManager#watch()`.
+
+  The files are checked with a timer of the window, by their modification times and sizes.
+  """
+  def __init__(self, manager, callback=None):
+    """
+    Constructor
+
+    Parameters
+    ----
+    manager: TkManager
+      The manager of the window, created by `Generator#get_manager()`.
+      If the window was generated from a precompiled file, its layout file is watched instead.
+    callback: func
+      A function that is called with `(changes, error)` after each reload by the timer.
+      If omitted, the exceptions raised while reloading are printed.
+    """
+    self.manager = manager
+    self.generator = manager.generator
+    self.callback = callback
+    gen = self.generator
+    if gen._precompiled is not None:
+      # The layout file of the precompiled file is watched and read from now on.
+      source = gen._precompiled["source"]
+      if not os.path.exists(source):
+        raise ValueError(f'The layout cannot be watched because the layout file "{source}" of the precompiled file does not exist.')
+      gen.includes = list(gen._precompiled["includes"])
+      gen._read_file(source)
+      gen._precompiled = None
+    self._job = None
+    self._interval = 0
+    self._stamps = self._stat()
+
+  @property
+  def files(self):
+    """
+    Gets the paths of the files to watch: the layout file, the included files and the localization file.
+    """
+    gen = self.generator
+    files = [gen.file] + list(gen.includes) + [gen.localization_file]
+    return [os.path.abspath(f) for f in dict.fromkeys(files) if f]
+
+  def changed(self):
+    """
+    Get the files that have been changed since the layout was read last.
+
+    Returns
+    ----
+    files: list[str]
+      The paths of the changed files.
+    """
+    stamps = self._stat()
+    return [f for f in stamps.keys() | self._stamps.keys() if stamps.get(f) != self._stamps.get(f)]
+
+  def start(self, interval=500):
+    """
+    Start checking the files with a timer of the window.
+
+    Parameters
+    ----
+    interval: int
+      The interval to check the files, in milliseconds.
+    """
+    self.stop()
+    self._interval = interval
+    self._job = self.manager.window.after(interval, self._poll)
+
+  def stop(self):
+    """
+    Stop checking the files.
+    """
+    if self._job is not None:
+      self.manager.window.after_cancel(self._job)
+      self._job = None
+
+  def reload(self):
+    """
+    Read the layout again and apply the differences to the window.
+
+    The new tree is compared with the tree of the window, matching the child widgets by `::id`,
+    and the widgets without `::id` by their order among the siblings of the same class.
+
+    * If the options of a widget are changed, they are set with one `configure()` call.
+    * If the geometry manager parameters or the other methods (ex. `title`) are changed, they are called again.
+      If the children of a widget were added or removed, the children managed by pack are packed again in order.
+    * If the class, the `::id`, the `::tag` or the `::command` of a widget are changed,
+      or if a parameter is removed, the widget and its descendants are created again.
+    * The widgets in the new tree that do not match any widget are created,
+      and the widgets that do not match any node in the new tree are destroyed.
+
+    The other widgets, and the values of the variables, are kept.
+    The child elements of a lazy Notebook tab that have not been created yet are not changed.
+
+    Returns
+    ----
+    changes: dict[str, int]
+      The number of the widgets that were configured, created and destroyed.
+
+    Raises
+    ----
+    ValueError
+      The class of the root widget has been changed.
+    """
+    gen = self.generator
+    man = self.manager
+    if gen.file:
+      with open(gen.file, "r", encoding=gen.localization_file_encoding) as f:
+        gen.string = f.read()
+    tree, vars = gen._prepare(gen._data)
+    self._stamps = self._stat()
+    modules = gen._load_modules()
+    roottag = man.index.get(man.window)
+    if roottag is None or roottag.node is None:
+      raise ValueError("The window was not generated from a tree.")
+    if roottag.node["classname"] != tree["classname"]:
+      raise ValueError(f'The class of the root widget cannot be changed from "{roottag.node["classname"]}" to "{tree["classname"]}".')
+    # Variables
+    index = gen._get_class_index(modules)
+    newvars = {}
+    for n, v in vars.items():
+      if not n in man.vars:
+        newvars[n] = index.get(v["class"].__name__, v["class"])(master=man.window, name=n)
+        if not v["default"] is None:
+          newvars[n].set(v["default"])
+    gen.vars.update(newvars)
+    man.add_vars(newvars)
+    # Widgets
+    children = {}
+    for tagdata in man.index:
+      if tagdata.parent is not None:
+        children.setdefault(id(tagdata.parent), []).append(tagdata)
+    self._changes = {"configured": 0, "created": 0, "destroyed": 0}
+    self._created = []
+    self._patched = []
+    start = len(gen._widgets)
+    if not self._patch(roottag, roottag.node, tree, modules, children):
+      raise ValueError("The root widget cannot be changed without creating it again.")
+    man.add_widgets(gen._widgets[start:])
+    gen._widgets = [t for t in gen._widgets if t.widget in man.index]
+    man.relocalize(self._created + self._patched)
+    self._changes["created"] = len(self._created)
+    return self._changes
+
+  def _poll(self):
+    """
+    Timer handler that reloads the layout if the files have been changed.
+    """
+    self._job = None
+    try:
+      if self.changed():
+        changes, error = None, None
+        try:
+          changes = self.reload()
+        except Exception as e:
+          # Keep watching, the file may be saved in the middle of editing.
+          self._stamps = self._stat()
+          error = e
+        if self.callback is not None:
+          self.callback(changes, error)
+        elif error is not None:
+          traceback.print_exception(type(error), error, error.__traceback__, file=sys.stderr)
+    finally:
+      if self.manager.window.winfo_exists():
+        self._job = self.manager.window.after(self._interval, self._poll)
+
+  def _stat(self):
+    """
+    Get the modification times and sizes of the files.
+    """
+    stamps = {}
+    for f in self.files:
+      try:
+        st = os.stat(f)
+        stamps[f] = (st.st_mtime_ns, st.st_size)
+      except OSError:
+        stamps[f] = None
+    return stamps
+
+  def _patch(self, tagdata, old, new, modules, children):
+    """
+    Apply the differences between the nodes to the widget and its descendants.
+
+    Returns
+    ----
+    patched: bool
+      False if the widget must be created again. In that case, the widget has not been changed.
+    """
+    if old["classname"] != new["classname"]:
+      return False
+    widget = tagdata.widget
+    oldparams = old["params"]
+    newparams = new["params"]
+    changed = [n for n in dict.fromkeys(list(oldparams) + list(newparams))
+      if not n in oldparams or not n in newparams or oldparams[n] != newparams[n]]
+    for n in changed:
+      if n.startswith("::") and not n in POSTCOMMANDS:
+        return False
+      if not n in newparams and not n.startswith("/"):
+        return False
+    if changed:
+      gen = self.generator
+      argnames = argtable.get_argnames(type(widget).__init__)
+      options = {}
+      childparams = {}
+      calls = []
+      postactions = []
+      for n in changed:
+        if not n in newparams:
+          continue
+        v = gen._replace_variables(newparams[n])
+        if n.startswith("/"):
+          childparams[n[1:]] = v
+        elif n in POSTCOMMANDS:
+          POSTCOMMANDS[n](postactions)(widget, tagdata, v)
+        elif n in argnames:
+          options[n] = v
+        else:
+          calls.append((n, v))
+      if options:
+        try:
+          widget.configure(**options)
+        except tkinter.TclError:
+          # An option that can only be set when the widget is created.
+          return False
+      for n, v in calls:
+        attr = getattr(widget, n)
+        if inspect.isroutine(attr):
+          attr() if v is None else attr(v)
+        else:
+          setattr(widget, n, v)
+      gen._run_postactions(postactions)
+      if childparams and tagdata.parent is not None and isinstance(tagdata.parent.widget, GeneratorSupport):
+        tagdata.parent.widget.configure_child(widget, **childparams)
+      self._changes["configured"] += 1
+      self._patched.append(tagdata)
+    tagdata.node = new
+    tagdata.localized = new.get("localized")
+    tagdata.localizedfields = new.get("localizedfields")
+    # The children are paired by their nodes, because the order of creation differs from the order of the tree
+    # after the children have been created by a reload.
+    live = {id(t.node): t for t in children.get(id(tagdata), []) if t.node is not None}
+    pairs = [(o, live.get(id(o))) for o in old["children"]]
+    if any(t is None for o, t in pairs) or len(live) != len(pairs):
+      # The children have not been created yet, or were not created from the tree.
+      return True
+    self._patch_children(tagdata, pairs, new["children"], modules, children)
+    return True
+
+  def _patch_children(self, tagdata, oldchildren, newchildren, modules, children):
+    """
+    Match the child widgets with the new nodes, and apply the differences.
+    """
+    gen = self.generator
+    owner = tagdata.widget
+    byid = {}
+    byclass = {}
+    for o, t in oldchildren:
+      id = o["params"].get("::id")
+      if id is not None:
+        byid.setdefault(id, deque()).append((o, t))
+      else:
+        byclass.setdefault(o["classname"], deque()).append((o, t))
+    result = []
+    removed = []
+    for n in newchildren:
+      id = n["params"].get("::id")
+      candidates = byid.get(id) if id is not None else byclass.get(n["classname"])
+      match = candidates.popleft() if candidates else None
+      if match is not None and self._patch(match[1], match[0], n, modules, children):
+        result.append((n, match[1]))
+      else:
+        if match is not None:
+          removed.append(match[1])
+        result.append((n, None))
+    for candidates in list(byid.values()) + list(byclass.values()):
+      removed.extend(t for o, t in candidates)
+    if not removed and all(t is not None for n, t in result):
+      return
+    for t in removed:
+      self._remove(owner, t)
+    widgets = []
+    for n, t in result:
+      if t is None:
+        created = []
+        gen._generate_children([n], owner, tagdata, modules, created)
+        self._created.extend(created)
+        t = created[0]
+      widgets.append((n, t))
+    # Keep the packing order of the children.
+    for n, t in widgets:
+      if "pack" in n["params"]:
+        t.widget.pack_forget()
+        v = gen._replace_variables(n["params"]["pack"])
+        t.widget.pack() if v is None else t.widget.pack(v)
+
+  def _remove(self, owner, tagdata):
+    """
+    Remove the widget and its descendants.
+    """
+    if isinstance(owner, GeneratorSupport):
+      owner.remove_child(tagdata.widget)
+    else:
+      tagdata.widget.destroy()
+    self._changes["destroyed"] += 1
@@ -0,0 +1,178 @@
+import time
+
+class WidgetStat(object):
+  """
+  The cost of creating a widget.
+  """
+  def __init__(self, classname, id, file, line, seconds):
+    """
+    Constructor
+
+    Parameters
+    ----
+    classname: str
+      The class name written in the layout, without the leading "_".
+    id: str|None
+      The `::id` of the widget.
+    file: str|None
+      The layout file in which the widget is written. None if the source is unknown.
+    line: int|None
+      The line number of the widget in the layout file. None if the source is unknown.
+    seconds: float
+      The time spent creating the widget, including setting its properties and the post actions,
+      but not including its child widgets.
+    """
+    self.classname = classname
+    self.id = id
+    self.file = file
+    self.line = line
+    self.seconds = seconds
+
+  def __repr__(self):
+    source = f"{self.file}:{self.line}" if self.file else "?"
+    return f"<WidgetStat {self.classname} id={self.id} {source} {self.seconds * 1000:.3f}ms>"
+
+class GeneratorStats(object):
+  """
+  An object that collects the time spent in each phase of `Generator#generate()` and `Generator#get_manager()`.
+  Pass it as the `stats` argument. The collected results are also available from `TkManager#stats`.
+
+  Phases
+  ----
+  cache: Looking up the layout cache.
+  load: Reading the YAML, including the `!include` files.
+  localize: Reading the localization file.
+  scan: Scanning the layout into a tree, including translating the strings.
+  store: Storing the layout in the cache.
+  modules: Importing the modules.
+  variables: Creating the variables.
+  resolve: Looking up the widget classes.
+  instantiate: Creating the widgets, including the post actions.
+  postactions: Running the post actions, such as `::gridcolumn`.
+  manager: Creating the `TkManager`.
+  total: The whole call.
+  """
+  clock = staticmethod(time.perf_counter)
+
+  def __init__(self, callback=None, sources=True):
+    """
+    Constructor
+
+    Parameters
+    ----
+    callback: func
+      A function that is called with `(phase, seconds, widget)` each time a time is recorded.
+      `widget` is a `WidgetStat` for the "instantiate" phase, otherwise None.
+    sources: bool
+      If True, the file and line of each widget are recorded.
+      This makes reading the YAML slightly slower. The sources are not available for layouts read from the cache.
+    """
+    self.phases = {}
+    self.widgets = []
+    self.callback = callback
+    self.sources = sources
+
+  def lap(self, phase, start):
+    """
+    Add the time elapsed since `start` to the phase.
+
+    Parameters
+    ----
+    phase: str
+      Phase name.
+    start: float
+      The value of `GeneratorStats.clock()` when the phase started.
+
+    Returns
+    ----
+    now: float
+      The current value of `GeneratorStats.clock()`, which can be used as the start of the next phase.
+    """
+    now = self.clock()
+    self.add_phase(phase, now - start)
+    return now
+
+  def add_phase(self, phase, seconds):
+    """
+    Add the time to the phase.
+
+    Parameters
+    ----
+    phase: str
+      Phase name.
+    seconds: float
+      Time in seconds.
+    """
+    self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+    if self.callback is not None:
+      self.callback(phase, seconds, None)
+
+  def add_widget(self, widget):
+    """
+    Add the cost of creating a widget. The time is also added to the "instantiate" phase.
+
+    Parameters
+    ----
+    widget: WidgetStat
+      The cost of the widget.
+    """
+    self.widgets.append(widget)
+    self.phases["instantiate"] = self.phases.get("instantiate", 0.0) + widget.seconds
+    if self.callback is not None:
+      self.callback("instantiate", widget.seconds, widget)
+
+  def slowest(self, count=10):
+    """
+    Get the widgets that took the longest time to create.
+
+    Parameters
+    ----
+    count: int
+      The number of widgets.
+
+    Returns
+    ----
+    widgets: list[WidgetStat]
+      The widgets in descending order of time.
+    """
+    return sorted(self.widgets, key=lambda w: w.seconds, reverse=True)[:count]
+
+  def by_class(self):
+    """
+    Get the number of widgets and the total time for each class.
+
+    Returns
+    ----
+    classes: dict[str, tuple[int, float]]
+      A dictionary object that associates class names with the number of widgets and the total time.
+    """
+    result = {}
+    for w in self.widgets:
+      count, seconds = result.get(w.classname, (0, 0.0))
+      result[w.classname] = (count + 1, seconds + w.seconds)
+    return result
+
+  def report(self, count=10):
+    """
+    Format the results as text.
+
+    Parameters
+    ----
+    count: int
+      The number of the slowest widgets to list.
+
+    Returns
+    ----
+    text: str
+      The report.
+    """
+    lines = ["phase           ms"]
+    for phase, seconds in self.phases.items():
+      lines.append(f"{phase:<12}{seconds * 1000:>9.2f}")
+    if self.widgets:
+      lines.append("")
+      lines.append(f"{len(self.widgets)} widgets, slowest:")
+      for w in self.slowest(count):
+        source = f"{w.file}:{w.line}" if w.file else "?"
+        lines.append(f"{w.seconds * 1000:>9.3f}ms  {w.classname:<16}{w.id or '':<16}{source}")
+    return "\n".join(lines)
@@ -0,0 +1,60 @@
+from tksugar.generator import Generator
+from tksugar.tkmanager import TkManager
+
+class LayoutTemplate(object):
+  """
+  A layout that is read once and instantiated any number of times.
+
+  The layout file is read, localized and scanned when the object is created.
+  Each call to `LayoutTemplate#instantiate()` creates an independent window
+  with its own variables and `TkManager`, without reading YAML again.
+  """
+  def __init__(self, file="", modules=["tksugar.widgets", "tkinter"], localization_file="", encoding="UTF-8", cache_dir="", data=None):
+    """
+    Constructor.
+    The parameters are the same as `Generator`.
+
+    Parameters
+    ----
+    file: str
+      A file path describing the window's object and layout.
+    modules: list[str]
+      An array indicating the name of the module to be used.
+    localization_file: str
+      Path indicating a YAML-formatted dictionary file used for UI localization.
+    encoding: str
+      File Encoding.
+    cache_dir: str
+      The directory where the scanned layouts are cached.
+    data: dict[str, list]
+      The lists referenced by name from the `::foreach` nodes.
+    """
+    self._modules = list(modules)
+    self._tree, self._vars = Generator(file, self._modules, localization_file, encoding, cache_dir)._prepare(data)
+
+  def instantiate(self, master=None, command=None):
+    """
+    Create a window from the layout.
+
+    Parameters
+    ----
+    master: object
+      The master of the root object, such as the owner window of a `Toplevel`.
+      If omitted, no master is specified.
+    command: func
+      An event handler for processing commands for widgets with the ::command element set.
+      It is registered with `TkManager#handlers` as "*", the same as `Generator#get_manager()`.
+
+    Returns
+    ----
+    manager: TkManager
+      A TkManager object that contains a window object.
+      The Tcl names of the variables are generated automatically,
+      but the variables are stored in `TkManager#vars` with their declared names.
+    """
+    gen = Generator(modules=list(self._modules))
+    window = gen._build(self._tree, self._vars, gen._dispatch, master=master, unique_vars=True)
+    manager = gen._attach(TkManager(window, gen._widgets, gen.vars, gen.index))
+    if command is not None:
+      manager.handlers["*"] = command
+    return manager
@@ -1,10 +1,79 @@
-from tksugar.eventreciever import EventReciever
+from concurrent.futures import Future
+import inspect
+import tkinter
+
+from tksugar import argtable
+from tksugar.widgetindex import WidgetIndex
+
+_GETVARS = "names {lmap n $names {set ::$n}}"
+"""
+The Tcl lambda that reads the global variables of the names into a list.
+"""
+_SETVARS = "pairs {foreach {n v} $pairs {set ::$n $v}}"
+"""
+The Tcl lambda that writes the pairs of the names and the values to the global variables.
+"""
+
+class TagData(object):
+  """
+  An object that represents additional data for the widget.
+  In TkManager, it is used to link the TkManager ID and the widget.
+  """
+  def __init__(self, widget):
+    """
+    Constructor
+
+    Parameters
+    ----
+    widget: object
+      Tk widget.
+    """
+    self.widget = widget
+    self.id = None
+    self.tag= None
+    self.callback = None
+    self.parent = None
+    self.localized = None
+    self.localizedfields = None
+    self.node = None
+
+  def hasdata(self):
+    """
+    True if there is data.
+
+    Returns
+    ----
+    hasdata: bool
+      True if there is data
+    """
+    return self.id or self.tag
+
+  def performclick(self):
+    """
+    If the button has a command, execute it.
+    """
+    if self.callback is not None:
+      self.callback(self.widget, self)
+
 class TkManager(object):
   """
   Manager object for managing widgets generated by the `tksugar.Generator` object.
   Manages IDs and event handlers, and manages variables.
+  If the window was generated with a `GeneratorStats`, it is available as `TkManager#stats`.
+  If the manager was created by `Generator#get_manager()`, the Generator is available as `TkManager#generator`,
+  and the layout can be reloaded while the window is running, see `TkManager#watch()`.
+  `TkManager#ready` is a future that is completed with the manager when all widgets have been created,
+  see `Generator#get_manager_incremental()`.
+
+  When a variable is written, `TkManager#trace_handler` and the functions registered by `TkManager#on_change()`
+  are called with `(variable, name)`. If `TkManager#coalesce` is True, the writes made before the main loop becomes idle
+  are dispatched once per variable in an idle callback, and `TkManager#batch_handler` is called with
+  a dictionary of the changed names and their final values.
+
+  The commands of the widgets with the ::command element are routed to the functions registered by `TkManager#handler()`,
+  see `TkManager#dispatch()`.
   """
-  def __init__(self, window, widgets, vars):
+  def __init__(self, window, widgets, vars, index=None):
     """
     Constructor
 
@@ -16,24 +85,480 @@ class TkManager(object):
       An array of TagData objects containing widgets with ids.
     vars: dict[str, Variable]
       A dictionary containing widget variables declared by tags.
+    index: WidgetIndex
+      The indexes of all widgets of the window built by the Generator.
+      If omitted, the indexes are built from `widgets`.
     """
     self._window = window
-    self.widgets = {}
+    self.index = index if index is not None else WidgetIndex()
     self.vars = vars
     self.trace_handler = None
+    self.handlers = {}
+    self._classkeys = {}
+    self.batch_handler = None
+    self.coalesce = False
+    self._subscribers = {}
+    self._pending = {}
+    self._dispatch = None
+    self._batching = False
+    self.stats = None
+    self.generator = None
+    self._localizer = None
+    self._watcher = None
+    self.ready = Future()
+    self.ready.set_result(self)
+    self.add_widgets(widgets)
+    self.index.watch(window)
+    self.add_vars(vars)
+
+  def add_widgets(self, widgets):
+    """
+    Register the widgets created after the manager was created,
+    such as the contents of a lazy `tksugar.widgets.Notebook` tab.
+
+    Parameters
+    ----
+    widgets: list[TagData]
+      An array of TagData objects containing widgets with ids.
+    """
     for tagdata in widgets:
+      self.index.add(tagdata)
       tagdata.tag = {
         "tag": tagdata.tag
       }
-      if not tagdata.id in self.widgets:
-        self.widgets[tagdata.id] = tagdata
 
+  def add_vars(self, vars):
+    """
+    Register the variables created after the manager was created, and add them to `TkManager#vars`.
+    The trace handler is called when they are written.
+
+    Parameters
+    ----
+    vars: dict[str, Variable]
+      A dictionary containing variables.
+    """
     for n, v in vars.items():
-      v.trace("w", EventReciever(v, n, self._tracevars))
+      self.vars[n] = v
+      # The declared name is bound, because the Tcl name differs from it if the name was generated, see `LayoutTemplate`.
+      v.trace("w", lambda *args, v=v, n=n: self._tracevars(v, n))
+
+  def handler(self, key, fn=None):
+    """
+    Register a function that is called when the command of the widget is executed.
+    It can also be used as a decorator, and the functions can also be set to `TkManager#handlers` directly.
+
+    ```
+    @manager.handler("save")
+    def save(widget, tag):
+      ...
+    manager.handlers["open"] = open
+    ```
+
+    Parameters
+    ----
+    key: str|class
+      The ID of the widget, the name of a menu item, a widget class, or "*" for all other widgets.
+    fn: func
+      A function that is called with `(widget, tag)`, as the command handler passed to `Generator#get_manager()`.
+
+    Returns
+    ----
+    fn: func
+      The function, or a decorator that registers the function if it is omitted.
+    """
+    if fn is None:
+      return lambda fn: self.handler(key, fn)
+    self.handlers[key] = fn
+    return fn
+
+  def dispatch(self, widget, tagdata):
+    """
+    Call the function registered for the widget by `TkManager#handler()`.
+    The functions are looked up in the following order, and only the first function found is called.
+
+    1. The name of the menu item, if the command is a menu item of `tksugar.widgets.Menu`.
+    2. The ID of the widget.
+    3. The class of the widget and its base classes. The headless classes also match the tkinter classes they mimic.
+    4. "*". The command handler passed to `Generator#get_manager()` is registered with this key.
+
+    Parameters
+    ----
+    widget: object
+      The widget.
+    tagdata: TagData
+      TagData of the widget.
+
+    Returns
+    ----
+    result: object
+      The value returned by the function. None if no function is found.
+    """
+    handlers = self.handlers
+    fn = None
+    tag = tagdata.tag
+    if type(tag) is dict and "item" in tag:
+      fn = handlers.get(tag["item"])
+    if fn is None and tagdata.id is not None:
+      fn = handlers.get(tagdata.id)
+    if fn is None:
+      cls = type(widget)
+      keys = self._classkeys.get(cls)
+      if keys is None:
+        keys = self._classkeys[cls] = tuple(dict.fromkeys(k for c in cls.__mro__ for k in (c, c.__dict__.get("_real")) if k is not None))
+      for k in keys:
+        fn = handlers.get(k)
+        if fn is not None:
+          break
+    if fn is None:
+      fn = handlers.get("*")
+    return None if fn is None else fn(widget, tagdata)
+
+  def on_change(self, name, fn=None):
+    """
+    Register a function that is called when the variable is written.
+    Unlike `TkManager#trace_handler`, the function is called only for the variable.
+    It can also be used as a decorator.
+
+    ```
+    @manager.on_change("label")
+    def changed(var, name):
+      print(var.get())
+    ```
+
+    Parameters
+    ----
+    name: str
+      The name of the variable. The variables added later, such as by `TkManager#reload()`, can also be specified.
+    fn: func
+      A function that is called with `(variable, name)`.
+
+    Returns
+    ----
+    fn: func
+      The function, or a decorator that registers the function if it is omitted.
+    """
+    if fn is None:
+      return lambda fn: self.on_change(name, fn)
+    self._subscribers.setdefault(name, []).append(fn)
+    return fn
+
+  def off_change(self, name, fn):
+    """
+    Unregister a function registered by `TkManager#on_change()`.
+
+    Parameters
+    ----
+    name: str
+      The name of the variable.
+    fn: func
+      The function.
+
+    Raises
+    ----
+    ValueError
+      The function is not registered for the variable.
+    """
+    self._subscribers.get(name, []).remove(fn)
+
+  def get_vars(self, names=None):
+    """
+    Read the values of many variables at once.
+    The values of the variables of a Tcl interpreter are read with one call,
+    and converted as the `get()` method of each variable class does.
+
+    Parameters
+    ----
+    names: list[str]
+      The names of the variables. If omitted, all variables are read.
+
+    Returns
+    ----
+    values: dict[str, object]
+      A dictionary that associates the names with the values.
+
+    Raises
+    ----
+    KeyError
+      The variable does not exist.
+    """
+    names = list(self.vars) if names is None else list(names)
+    vars = [self.vars[n] for n in names]
+    values = [None] * len(vars)
+    for tk, indexes in self._group_vars(vars):
+      if tk is None:
+        for i in indexes:
+          values[i] = vars[i].get()
+      else:
+        raw = tk.splitlist(tk.call("apply", _GETVARS, tuple(vars[i]._name for i in indexes)))
+        for i, r in zip(indexes, raw):
+          values[i] = _convert(tk, vars[i], r)
+    return dict(zip(names, values))
+
+  def set_vars(self, mapping):
+    """
+    Write the values of many variables at once.
+    The values of the variables of a Tcl interpreter are written with one call.
+    The trace handler and the functions registered by `TkManager#on_change()` are not called while the values are written,
+    they are called once for each variable after all values have been written,
+    and then `TkManager#batch_handler` is called with the values.
+    If `TkManager#coalesce` is True, they are called in the idle callback instead.
+
+    Parameters
+    ----
+    mapping: dict[str, object]
+      A dictionary that associates the names with the values.
+
+    Raises
+    ----
+    KeyError
+      The variable does not exist.
+    """
+    names = list(mapping)
+    vars = [self.vars[n] for n in names]
+    values = [mapping[n] for n in names]
+    groups = self._group_vars(vars)
+    self._batching = True
+    try:
+      for tk, indexes in groups:
+        if tk is None:
+          for i in indexes:
+            vars[i].set(values[i])
+        else:
+          pairs = []
+          for i in indexes:
+            v = vars[i]
+            pairs += [v._name, tk.getboolean(values[i]) if isinstance(v, tkinter.BooleanVar) else values[i]]
+          tk.call("apply", _SETVARS, tuple(pairs))
+    finally:
+      self._batching = False
+    if self.coalesce:
+      if self._pending and self._dispatch is None:
+        self._dispatch = self._window.after_idle(self._dispatch_changes)
+    else:
+      self.flush_changes()
+
+  def flush_changes(self):
+    """
+    Dispatch the changes waiting for the idle callback immediately, when `TkManager#coalesce` is True.
+    """
+    if self._dispatch is not None:
+      self._window.after_cancel(self._dispatch)
+    self._dispatch_changes()
+
+  def watch(self, interval=500, callback=None):
+    """
+    Reload the layout whenever the layout file, the included files or the localization file are changed.
+    The files are checked every `interval` milliseconds while the main loop is running,
+    and only the differences are applied to the window, see `LayoutWatcher#reload()`.
+
+    Parameters
+    ----
+    interval: int
+      The interval to check the files, in milliseconds.
+    callback: func
+      A function that is called with `(changes, error)` after each reload.
+      `changes` is the result of `LayoutWatcher#reload()`, and `error` is the exception raised while reloading, or None.
+      If omitted, the exceptions are printed.
+
+    Returns
+    ----
+    watcher: LayoutWatcher
+      The watcher.
+
+    Raises
+    ----
+    ValueError
+      The manager was not created by `Generator#get_manager()`,
+      or the window was generated from a precompiled file whose layout file does not exist.
+    """
+    from tksugar.reloader import LayoutWatcher
+    if self.generator is None:
+      raise ValueError("The layout cannot be watched because the manager was not created by a Generator.")
+    self.unwatch()
+    self._watcher = LayoutWatcher(self, callback)
+    self._watcher.start(interval)
+    return self._watcher
+
+  def unwatch(self):
+    """
+    Stop watching the layout files.
+    """
+    if self._watcher is not None:
+      self._watcher.stop()
+      self._watcher = None
+
+  def reload(self):
+    """
+    Reload the layout now and apply the differences to the window. See `LayoutWatcher#reload()`.
+
+    Returns
+    ----
+    changes: dict[str, int]
+      The number of the widgets that were configured, created and destroyed.
+    """
+    from tksugar.reloader import LayoutWatcher
+    if self.generator is None:
+      raise ValueError("The layout cannot be reloaded because the manager was not created by a Generator.")
+    return (self._watcher or LayoutWatcher(self)).reload()
+
+  def findbyid(self, id):
+    """
+    Search for widgets by ID.
+    If multiple items with the same ID are defined, the first item is returned.
+
+    Parameters
+    ----
+    id: str
+      ID
+
+    Returns
+    ----
+    widget: TagData|None
+      If an item is found, TagData containing that widget.
+      None if the item is not found.
+    """
+    return self.index.findbyid(id)
+
+  def findallbyid(self, id):
+    """
+    Get all widgets with the ID. See `WidgetIndex#findallbyid()`.
+    """
+    return self.index.findallbyid(id)
+
+  def findbyclass(self, name):
+    """
+    Get all widgets of the class. See `WidgetIndex#findbyclass()`.
+    """
+    return self.index.findbyclass(name)
+
+  def findbytag(self, key):
+    """
+    Get all widgets whose `::tag` has the key. See `WidgetIndex#findbytag()`.
+    """
+    return self.index.findbytag(key)
+
+  def select(self, selector):
+    """
+    Get the widgets that match the selector, such as "#toolbar Button". See `WidgetIndex#select()`.
+    """
+    return self.index.select(selector)
+
+  def set_language(self, file, encoding="UTF-8"):
+    """
+    Translate the window into another language without creating it again.
+    Only the parameters that were written with the markers (ex. `:::text`) in the layout are translated again,
+    so the values of the variables, the focus and the scroll positions are kept.
+
+    The options of each widget are set with one `configure()` call.
+    The labels of `Menu#items()` and the parameters for the parent (ex. `/text` of a Notebook tab) are also translated,
+    and the other methods (ex. `title`) are called again with the translated value.
+    The widgets created later, such as the contents of a lazy Notebook tab, are also translated with this file.
+
+    Parameters
+    ----
+    file: str
+      The path to the YAML file that contains the translation string.
+    encoding: str
+      File Encoding.
+    """
+    # Imported here, so that the modules generated by `tksugar.compile` can be run without importing PyYAML.
+    from tksugar.localizer import Localizer
+    self._localizer = Localizer(file, encoding)
+    self.relocalize(self.index)
+
+  def relocalize(self, widgets):
+    """
+    Translate the widgets into the language set by `TkManager#set_language()`.
+    If the language has not been set, nothing is done.
+
+    Parameters
+    ----
+    widgets: Iterable[TagData]
+      The widgets.
+    """
+    if self._localizer is None:
+      return
+    for tagdata in list(widgets):
+      if tagdata.localized:
+        self._relocalize(tagdata)
+
+  def _relocalize(self, tagdata):
+    """
+    Translate the parameters of the widget with the markers and set them to the widget.
+    """
+    from tksugar.generator import substitute
+    widget = tagdata.widget
+    argnames = argtable.get_argnames(type(widget).__init__)
+    fields = None
+    if tagdata.localizedfields is not None:
+      fields = {k: self._localizer.translate(v) for k, v in tagdata.localizedfields.items()}
+    options = {}
+    childparams = {}
+    for n, v in tagdata.localized.items():
+      v = self._localizer.translate(v)
+      if fields is not None:
+        v = substitute(v, fields)
+      if n.startswith("::"):
+        continue
+      elif n.startswith("/"):
+        childparams[n[1:]] = v
+      elif n in argnames:
+        options[n] = v
+      elif n == "items" and hasattr(widget, "relabel"):
+        widget.relabel(v)
+      elif inspect.isroutine(getattr(widget, n, None)):
+        getattr(widget, n)(v)
+      else:
+        setattr(widget, n, v)
+    if options:
+      widget.configure(**options)
+    if childparams and tagdata.parent is not None and hasattr(tagdata.parent.widget, "configure_child"):
+      tagdata.parent.widget.configure_child(widget, **childparams)
 
   def _tracevars(self, obj, name):
+    if self._batching:
+      self._pending.setdefault(name, obj)
+      return
+    if self.coalesce:
+      self._pending.setdefault(name, obj)
+      if self._dispatch is None:
+        self._dispatch = self._window.after_idle(self._dispatch_changes)
+      return
+    self._notify(obj, name)
+
+  @staticmethod
+  def _group_vars(vars):
+    """
+    Group the indexes of the variables by their Tcl interpreters.
+    The variables without an interpreter, such as the headless variables, are grouped under None.
+    """
+    groups = {}
+    for i, v in enumerate(vars):
+      groups.setdefault(getattr(v, "_tk", None), []).append(i)
+    return list(groups.items())
+
+  def _notify(self, obj, name):
     if self.trace_handler:
       self.trace_handler(obj, name)
+    for fn in self._subscribers.get(name, ()):
+      fn(obj, name)
+
+  def _dispatch_changes(self):
+    """
+    Idle callback that dispatches the changes coalesced by `TkManager#_tracevars()`.
+    """
+    pending = self._pending
+    self._pending = {}
+    self._dispatch = None
+    if not pending:
+      return
+    batch_handler = self.batch_handler
+    if batch_handler:
+      values = self.get_vars(n for n in pending if n in self.vars)
+    for n, v in pending.items():
+      self._notify(v, n)
+    if batch_handler:
+      batch_handler(values)
 
   def mainloop(self):
     """
@@ -41,9 +566,45 @@ class TkManager(object):
     """
     self._window.mainloop()
 
+  @property
+  def widgets(self):
+    """
+    Gets a dictionary that associates IDs with widgets.
+    If multiple items with the same ID are defined, the first item is used.
+    Destroyed widgets are removed.
+    The widgets set to the dictionary are registered with `TkManager#index` by the IDs, see `WidgetIndex#assign()`.
+    """
+    return self.index.ids
+
   @property
   def window(self):
     """
     Get a window object.
     """
-    return self._window
\ No newline at end of file
+    return self._window
+
+
+def _convert(tk, var, value):
+  """
+  Convert the value read from the Tcl interpreter as the `get()` method of the variable class does.
+  """
+  cls = type(var)
+  if cls is tkinter.StringVar and type(value) is str:
+    return value
+  elif cls is tkinter.IntVar and type(value) is int:
+    return value
+  elif isinstance(var, tkinter.BooleanVar):
+    try:
+      return tk.getboolean(value)
+    except tkinter.TclError:
+      raise ValueError("invalid literal for getboolean()")
+  elif isinstance(var, tkinter.IntVar):
+    try:
+      return tk.getint(value)
+    except (TypeError, tkinter.TclError):
+      return int(tk.getdouble(value))
+  elif isinstance(var, tkinter.DoubleVar):
+    return tk.getdouble(value)
+  elif isinstance(var, tkinter.StringVar):
+    return value if isinstance(value, str) else str(value)
+  return value
@@ -0,0 +1,417 @@
+from collections.abc import MutableMapping
+import re
+import tkinter
+
+SELECTOR = re.compile(r"(\*|\w+)?((?:[#.][\w-]+)*)")
+"""
+A simple selector of `WidgetIndex#select()`.
+"""
+
+class WidgetIndex(object):
+  """
+  Indexes of the widgets created by the Generator, by `::id`, by class name and by `::tag` key.
+
+  The Generator adds every widget when it is created, and the widgets are removed from the indexes
+  when they are destroyed, so all lookups take constant time and never return destroyed widgets.
+  """
+  def __init__(self, widgets=[]):
+    """
+    Constructor
+
+    Parameters
+    ----
+    widgets: list[TagData]
+      The widgets to add first.
+    """
+    self._entries = {}
+    self._ids = {}
+    self._classes = {}
+    self._tags = {}
+    self._watching = {}
+    for tagdata in widgets:
+      self.add(tagdata)
+
+  def add(self, tagdata):
+    """
+    Add the widget to the indexes. A widget that has already been added is ignored.
+
+    Parameters
+    ----
+    tagdata: TagData
+      The widget.
+    """
+    key = self._key(tagdata.widget)
+    if key in self._entries:
+      return
+    tags = self._tagkeys(tagdata.tag)
+    self._entries[key] = (tagdata, tags)
+    if tagdata.id is not None:
+      self._ids.setdefault(tagdata.id, []).append(tagdata)
+    self._classes.setdefault(type(tagdata.widget).__name__, []).append(tagdata)
+    for t in tags:
+      self._tags.setdefault(t, []).append(tagdata)
+
+  def remove(self, widget):
+    """
+    Remove the widget from the indexes.
+
+    Parameters
+    ----
+    widget: object|str
+      The widget or its Tcl path name.
+    """
+    entry = self._entries.pop(self._key(widget), None)
+    if entry is None:
+      return
+    tagdata, tags = entry
+    if tagdata.id is not None:
+      self._discard(self._ids, tagdata.id, tagdata)
+    self._discard(self._classes, type(tagdata.widget).__name__, tagdata)
+    for t in tags:
+      self._discard(self._tags, t, tagdata)
+
+  def watch(self, window):
+    """
+    Remove the widgets of the window from the indexes when they are destroyed.
+    The event handler is bound to all widgets, so that the widgets in other toplevel windows such as the menus are also removed,
+    and it is unbound when the window is destroyed.
+
+    Parameters
+    ----
+    window: tkinter.Misc
+      The window. Objects without the `bind_all()` method are not watched.
+    """
+    bind_all = getattr(window, "bind_all", None)
+    key = self._key(window)
+    if bind_all is None or key in self._watching:
+      return
+    tk = getattr(window, "tk", None)
+    before = str(tk.call("bind", "all", "<Destroy>")) if tk is not None else ""
+    funcid = bind_all("<Destroy>", self._destroyed, add="+")
+    # The script appended by tkinter is kept, so that exactly the same script is removed from the bindings.
+    script = str(tk.call("bind", "all", "<Destroy>"))[len(before):] if tk is not None else None
+    self._watching[key] = (window, funcid, script)
+
+  def get(self, widget):
+    """
+    Get TagData of the widget.
+
+    Parameters
+    ----
+    widget: object|str
+      The widget or its Tcl path name.
+
+    Returns
+    ----
+    widget: TagData|None
+      TagData containing the widget. None if the widget is not in the indexes.
+    """
+    entry = self._entries.get(self._key(widget))
+    return None if entry is None else entry[0]
+
+  def findbyid(self, id):
+    """
+    Search for widgets by ID.
+    If multiple items with the same ID are defined, the first item is returned.
+
+    Parameters
+    ----
+    id: str
+      ID
+
+    Returns
+    ----
+    widget: TagData|None
+      If an item is found, TagData containing that widget.
+      None if the item is not found.
+    """
+    l = self._ids.get(id)
+    return l[0] if l else None
+
+  def findallbyid(self, id):
+    """
+    Get all widgets with the ID, in the order they were created.
+
+    Parameters
+    ----
+    id: str
+      ID
+
+    Returns
+    ----
+    widgets: list[TagData]
+      The widgets.
+    """
+    return list(self._ids.get(id, []))
+
+  def findbyclass(self, name):
+    """
+    Get all widgets of the class, in the order they were created.
+
+    Parameters
+    ----
+    name: str
+      The class name, such as "Button". Subclasses with other names are not included.
+
+    Returns
+    ----
+    widgets: list[TagData]
+      The widgets.
+    """
+    return list(self._classes.get(name, []))
+
+  def findbytag(self, key):
+    """
+    Get all widgets whose `::tag` has the key, in the order they were created.
+    If the `::tag` is not a dict, the widgets whose `::tag` is the key are returned.
+
+    Parameters
+    ----
+    key: str
+      The key.
+
+    Returns
+    ----
+    widgets: list[TagData]
+      The widgets.
+    """
+    return list(self._tags.get(key, []))
+
+  def select(self, selector):
+    """
+    Get the widgets that match the selector, in the order they were created.
+
+    The selector is a list of simple selectors separated by spaces (a descendant) or ">" (a child).
+    A simple selector is a class name or "*", followed by any number of "#id" and ".tagkey".
+
+    ```
+    man.select("#toolbar Button")      # Buttons under the widget whose ::id is toolbar
+    man.select("Frame > .editable")    # widgets tagged editable directly under a Frame
+    ```
+
+    The parent of a widget is the widget that contained it in the layout.
+
+    Parameters
+    ----
+    selector: str
+      The selector.
+
+    Returns
+    ----
+    widgets: list[TagData]
+      The widgets.
+
+    Raises
+    ----
+    ValueError
+      The selector is invalid.
+    """
+    tokens = selector.replace(">", " > ").split()
+    if not tokens or tokens[0] == ">" or tokens[-1] == ">":
+      raise ValueError(f'Invalid selector "{selector}"')
+    steps = []
+    combinator = " "
+    for t in tokens:
+      if t == ">":
+        if combinator == ">":
+          raise ValueError(f'Invalid selector "{selector}"')
+        combinator = ">"
+        continue
+      steps.append((combinator, self._parse(t, selector)))
+      combinator = " "
+    last = steps[-1][1]
+    if last[1] is not None:
+      candidates = self._ids.get(last[1], [])
+    elif last[0] is not None:
+      candidates = self._classes.get(last[0], [])
+    elif last[2]:
+      candidates = self._tags.get(last[2][0], [])
+    else:
+      candidates = [e[0] for e in self._entries.values()]
+    return [t for t in candidates if self._match(t, steps)]
+
+  def __len__(self):
+    return len(self._entries)
+
+  def __iter__(self):
+    return (e[0] for e in list(self._entries.values()))
+
+  def __contains__(self, widget):
+    return self._key(widget) in self._entries
+
+  @property
+  def ids(self):
+    """
+    Gets a dictionary that associates IDs with the first widget with the ID, see `IdView`.
+    """
+    return IdView(self)
+
+  def assign(self, id, tagdata):
+    """
+    Associate the ID with the widget, as the first widget with the ID.
+    The widget is added to the indexes if it has not been added, and its `id` is changed to the ID.
+
+    Parameters
+    ----
+    id: str
+      ID
+    tagdata: TagData
+      The widget.
+    """
+    if self._key(tagdata.widget) in self._entries:
+      if tagdata.id is not None:
+        self._discard(self._ids, tagdata.id, tagdata)
+    else:
+      tagdata.id = None
+      self.add(tagdata)
+    tagdata.id = id
+    self._ids.setdefault(id, []).insert(0, tagdata)
+
+  def _destroyed(self, event):
+    """
+    Event handler for the <Destroy> event.
+    """
+    self.remove(event.widget)
+    key = self._key(event.widget)
+    watching = self._watching.pop(key, None)
+    if watching is not None:
+      # The descendants may not have received their events yet.
+      prefix = "." if key == "." else key + "."
+      for k in [k for k in self._entries if k.startswith(prefix)]:
+        self.remove(k)
+      self._unwatch(*watching)
+
+  @staticmethod
+  def _unwatch(window, funcid, script):
+    """
+    Unbind the event handler bound by `WidgetIndex#watch()`, leaving the other handlers bound to all widgets.
+    """
+    tk = getattr(window, "tk", None)
+    if tk is None:
+      # The headless widgets can unbind a handler.
+      window.unbind_all("<Destroy>", funcid)
+      return
+    try:
+      bindings = str(tk.call("bind", "all", "<Destroy>"))
+      tk.call("bind", "all", "<Destroy>", bindings.replace(script, "", 1))
+      window.deletecommand(funcid)
+    except tkinter.TclError:
+      # The interpreter is being deleted with the root window.
+      pass
+
+  def _match(self, tagdata, steps):
+    """
+    True if the widget and its parents match the steps of the selector.
+    """
+    if not self._matchsimple(tagdata, steps[-1][1]):
+      return False
+    if len(steps) == 1:
+      return True
+    combinator = steps[-1][0]
+    parent = self._parent(tagdata)
+    while parent is not None:
+      if self._match(parent, steps[:-1]):
+        return True
+      if combinator == ">":
+        return False
+      parent = self._parent(parent)
+    return False
+
+  def _matchsimple(self, tagdata, simple):
+    classname, id, tags = simple
+    if classname is not None and type(tagdata.widget).__name__ != classname:
+      return False
+    if id is not None and tagdata.id != id:
+      return False
+    if tags:
+      entry = self._entries.get(self._key(tagdata.widget))
+      if entry is None or not all(t in entry[1] for t in tags):
+        return False
+    return True
+
+  def _parent(self, tagdata):
+    """
+    Get the parent of the widget.
+    If the parent is not recorded, the nearest master in the indexes is used.
+    """
+    if tagdata.parent is not None:
+      return tagdata.parent
+    master = getattr(tagdata.widget, "master", None)
+    while master is not None:
+      entry = self._entries.get(self._key(master))
+      if entry is not None:
+        return entry[0]
+      master = getattr(master, "master", None)
+    return None
+
+  @staticmethod
+  def _parse(token, selector):
+    """
+    Parse a simple selector into the class name, the ID and the tag keys.
+    """
+    m = SELECTOR.fullmatch(token)
+    if m is None or not token:
+      raise ValueError(f'Invalid selector "{selector}"')
+    classname = None if m.group(1) in (None, "*") else m.group(1)
+    id = None
+    tags = []
+    for part in re.findall(r"[#.][\w-]+", m.group(2)):
+      if part[0] == "#":
+        id = part[1:]
+      else:
+        tags.append(part[1:])
+    return classname, id, tags
+
+  @staticmethod
+  def _tagkeys(tag):
+    """
+    Get the keys of the tag.
+    """
+    if type(tag) is dict:
+      return [k for k in tag.keys() if type(k) is str]
+    elif type(tag) is str:
+      return [tag]
+    return []
+
+  @staticmethod
+  def _key(widget):
+    return widget if type(widget) is str else str(widget)
+
+  @staticmethod
+  def _discard(index, key, tagdata):
+    l = index.get(key)
+    if l is None:
+      return
+    for i, t in enumerate(l):
+      if t is tagdata:
+        del l[i]
+        break
+    if not l:
+      del index[key]
+
+class IdView(MutableMapping):
+  """
+  A dictionary that associates IDs with the first widget with the ID.
+  Setting an item associates the ID with the widget by `WidgetIndex#assign()`,
+  and deleting an item removes the association of the ID. The widgets are kept in the other indexes.
+  """
+  def __init__(self, index):
+    self._index = index
+
+  def __getitem__(self, id):
+    return self._index._ids[id][0]
+
+  def __setitem__(self, id, tagdata):
+    self._index.assign(id, tagdata)
+
+  def __delitem__(self, id):
+    del self._index._ids[id]
+
+  def __iter__(self):
+    return iter(self._index._ids)
+
+  def __len__(self):
+    return len(self._index._ids)
+
+  def __contains__(self, id):
+    return id in self._index._ids
@@ -18,4 +18,53 @@ class GeneratorSupport(object):
     params: dict
       Parameters.
     """
-    raise NotImplementedError
\ No newline at end of file
+    raise NotImplementedError
+
+  def configure_child(self, child, **params):
+    """
+    Called when the parameters passed to `GeneratorSupport#append_child()` are changed,
+    such as when the language is changed by `TkManager#set_language()`.
+    By default, the parameters are ignored.
+
+    Parameters
+    ----
+    child: tkinter.Widget
+      The child object passed to `GeneratorSupport#append_child()`.
+    params: dict
+      The changed parameters.
+    """
+    pass
+
+  def remove_child(self, child):
+    """
+    Called when a child object is removed, such as when the layout is reloaded by `TkManager#reload()`.
+    By default, the child object is destroyed.
+
+    Parameters
+    ----
+    child: tkinter.Widget
+      The child object passed to `GeneratorSupport#append_child()`.
+    """
+    child.destroy()
+
+  def defer_children(self, child, builder):
+    """
+    Called after `GeneratorSupport#append_child()` when the child object has child elements.
+    If this method returns True, the child elements of the child object are not created by the Generator.
+    Instead, they are created when the object calls `builder()`,
+    and their IDs are registered with the `TkManager` at that time.
+
+    Parameters
+    ----
+    child: tkinter.Widget
+      The child object passed to `GeneratorSupport#append_child()`.
+    builder: func
+      A function without arguments that creates the child elements of the child object.
+
+    Returns
+    ----
+    deferred: bool
+      True if the creation of the child elements is deferred.
+      By default, it returns False.
+    """
+    return False
@@ -3,21 +3,32 @@ import tkinter
 from tksugar.widgets.generatorsupport import GeneratorSupport
 from tksugar.eventreciever import EventReciever
 
-class Menu(tkinter.Menu, GeneratorSupport):
+class MenuSupport(GeneratorSupport):
   """
-  `tkinter.Menu` with added methods to support Generator.
+  The methods to support Generator that are added to a menu class.
+  The class is combined with `tkinter.Menu` or a class compatible with it.
   """
-  def __init__(self, master=None, cnf={}, **kw):
-    """Construct menu widget with the parent MASTER.
+  def _setup(self, master, wm):
+    """
+    Initialize the fields and attach the menu to the window.
 
-    Valid resource names: activebackground, activeborderwidth,
-    activeforeground, background, bd, bg, borderwidth, cursor,
-    disabledforeground, fg, font, foreground, postcommand, relief,
-    selectcolor, takefocus, tearoff, tearoffcommand, title, type."""
-    super().__init__(master=None, cnf=cnf, **kw)
+    Parameters
+    ----
+    master: object
+      The master passed to the constructor.
+    wm: class
+      The window class. If the master is a window, the menu is set as its menu bar.
+    """
     self._command = None
     self._parent = None
-    if issubclass(type(master), tkinter.Wm):
+    self._itementries = []
+    self._itemnames = {}
+    self._origins = 0
+    self._lazyitems = None
+    self._lazycache = True
+    self._populated = False
+    self._postcommand = None
+    if issubclass(type(master), wm):
       master.config(menu=self)
 
   def append_child(self, child, **params):
@@ -25,6 +36,28 @@ class Menu(tkinter.Menu, GeneratorSupport):
     child._parent = self
     self.add_cascade(params)
 
+  def configure_child(self, child, **params):
+    i = self._childindex(child)
+    if i is not None:
+      self.entryconfigure(i, **params)
+
+  def remove_child(self, child):
+    i = self._childindex(child)
+    if i is not None:
+      self.delete(i)
+      self._shift(i, -1)
+    child.destroy()
+
+  def _childindex(self, child):
+    """
+    Get the index of the cascade entry of the child menu.
+    """
+    end = self.index("end")
+    for i in range(0 if end is None else end + 1):
+      if self.type(i) == "cascade" and str(self.entrycget(i, "menu")) == str(child):
+        return i
+    return None
+
   def items(self, items):
     """
     Define a menu item.
@@ -33,21 +66,158 @@ class Menu(tkinter.Menu, GeneratorSupport):
     ----
     items: list(str or dict)
       An array of menu items. Information defining a string or menu item.
+      The `name` element of an item, or its label, is the name used by `MenuSupport#update_items()`,
+      `MenuSupport#insert_after()` and `MenuSupport#remove()`, and by the commands of the items.
+
+      The items of a cascade are added when the cascade is posted first if its `lazy` element is True,
+      or if its `items` element is a function, which is called to get the items (such as a generator function).
+      If its `cache` element is False, the items are added again each time the cascade is posted,
+      see `MenuSupport#lazy()`.
     """
+    self._additems(items, origin=True)
+
+  def update_items(self, items):
+    """
+    Change the options of the menu items by their names.
+    Only the entries of the named items are changed, and the commands and the variables are kept unless they are specified.
+
+    ```
+    menu.update_items({"save": {"state": "disabled"}, "Open": {"label": "Open...", "accelerator": "Ctrl+O"}})
+    ```
+
+    Parameters
+    ----
+    items: dict[str, dict]
+      A dictionary that associates the names of the items with the options of the entries.
+      For a radio group, the options are set to all its entries, and the `items` element changes the labels of its entries.
+      For a cascade, the `items` element replaces the items of the cascade.
+
+    Raises
+    ----
+    KeyError
+      The item is not found.
+    ValueError
+      The number of the labels of a radio group is different.
+    """
+    for name, options in items.items():
+      t, index, submenu = self._finditem(name)[:3]
+      options = dict(options)
+      children = options.pop("items", None)
+      if t == "radio":
+        if children is not None:
+          if len(children) != len(index):
+            raise ValueError(f'The radio group "{name}" has {len(index)} items.')
+          for i, n in zip(children, index):
+            self.entryconfigure(n, **(i if type(i) is dict else {"label": i}))
+        if options:
+          for n in index:
+            self.entryconfigure(n, **options)
+      else:
+        if options:
+          self.entryconfigure(index, **options)
+        if t == "cascade" and children is not None:
+          submenu._clear()
+          submenu._additems(children)
+
+  def insert_after(self, name, items):
+    """
+    Insert the menu items after the named item.
+
+    Parameters
+    ----
+    name: str
+      The name of the item.
+    items: list(str or dict)
+      An array of menu items, as `MenuSupport#items()`.
+
+    Raises
+    ----
+    KeyError
+      The item is not found.
+    """
+    record = self._finditem(name)
+    index = record[1]
+    self._additems(items, (index[-1] if type(index) is list else index) + 1, self._itementries.index(record) + 1)
+
+  def remove(self, name):
+    """
+    Remove the named menu item. The submenu of a cascade is destroyed.
+
+    Parameters
+    ----
+    name: str
+      The name of the item.
+
+    Raises
+    ----
+    KeyError
+      The item is not found.
+    """
+    record = self._finditem(name)
+    t, index, submenu, key = record[:4]
+    first, last = (index[0], index[-1]) if type(index) is list else (index, index)
+    self.delete(first, last)
+    self._itementries.remove(record)
+    self._shift(first, first - last - 1)
+    if submenu is not None:
+      submenu.destroy()
+    if key is not None and self._itemnames.get(key) is record:
+      del self._itemnames[key]
+      # Another item with the same name becomes the named item.
+      for r in self._itementries:
+        if r[3] == key:
+          self._itemnames[key] = r
+          break
+
+  def _additems(self, items, at=None, position=None, origin=False):
+    """
+    Add the menu items at the index, or at the end if the index is None.
+    Their records are inserted into `_itementries` at the position.
+    If origin is True, the records have the positions of the items among the items passed to `MenuSupport#items()`,
+    which are used by `MenuSupport#relabel()`.
+    """
+    def put(kind, cnf):
+      nonlocal at
+      if at is None:
+        self.add(kind, cnf)
+        return self.index("end")
+      self.insert(at, kind, cnf)
+      at += 1
+      return at - 1
     def radio(a):
+      indexes = []
       for n, i in enumerate(a["items"]):
-        self.add_radiobutton(
+        indexes.append(put("radiobutton", dict(
           label= i["label"] if type(i) is dict else i,
           variable=a.get("variable", None),
           value= i.get("value", n) if type(i) is dict else n,
-          command= a.get("command", None))
+          command= a.get("command", None))))
+      return indexes
     def cascade(a):
       items = a.pop("items")
       tearoff = a.pop("tearoff", False)
-      m = Menu(master=self, tearoff=tearoff)
-      m.items(items)
-      self.append_child(m, **a)
+      lazy = a.pop("lazy", False) or callable(items)
+      cache = a.pop("cache", True)
+      m = type(self)(master=self, tearoff=tearoff)
+      if lazy:
+        m.lazy(items, cache)
+      else:
+        m.items(items)
+      if at is None:
+        self.append_child(m, **a)
+        return self.index("end"), m
+      m._parent = self
+      a["menu"] = m
+      return put("cascade", a), m
+    if at is not None:
+      # The entries are shifted by the inserted entries after they are added.
+      start = at
+      shifted = list(self._itementries)
+    records = []
     for item in items:
+      if type(item) is dict:
+        # The items may be added again by a lazy cascade, so they are not modified.
+        item = dict(item)
       if type(item) is str:
         if item == "---":
           item = {
@@ -59,13 +229,14 @@ class Menu(tkinter.Menu, GeneratorSupport):
             "label": item
           }
       item.setdefault("type", "command")
+      key = item.get("name", item.get("label"))
       if "name" in item and not "command" in item: item["command"] = EventReciever(self, item["name"], self._callback)
       if "label" in item and not "command" in item: item["command"] = EventReciever(self, item["label"], self._callback)
       if "name" in item: item.pop("name")
       switch = {
-        "separator": lambda a: self.add_separator(),
-        "command": lambda a: self.add_command(a),
-        "check": lambda a: self.add_checkbutton(a),
+        "separator": lambda a: put("separator", {}),
+        "command": lambda a: put("command", a),
+        "check": lambda a: put("checkbutton", a),
         "radio": lambda a: radio(a),
         "cascade": lambda a: cascade(a)
       }
@@ -73,13 +244,165 @@ class Menu(tkinter.Menu, GeneratorSupport):
       v = switch.get(t, ValueError)(item)
       if issubclass(type(v), Exception):
         raise v
+      record = [t, v[0], v[1], key] if t == "cascade" else [t, v, None, key]
+      record.append(self._origins if origin else None)
+      if origin:
+        self._origins += 1
+      records.append(record)
+      if key is not None:
+        self._itemnames.setdefault(key, record)
+    if at is not None:
+      for r in shifted:
+        self._shiftrecord(r, start, at - start)
+    if position is None:
+      self._itementries.extend(records)
+    else:
+      self._itementries[position:position] = records
+      if at is not None:
+        # The first item with the name in the menu order becomes the named item.
+        for r in records:
+          if r[3] is not None and self._itemnames[r[3]] is not r:
+            del self._itemnames[r[3]]
+            for o in self._itementries:
+              if o[3] == r[3]:
+                self._itemnames[r[3]] = o
+                break
+
+  def _finditem(self, name):
+    """
+    Get the record of the named item. The items of a lazy menu are added if they have not been added yet.
+    """
+    if not name in self._itemnames and not self._populated:
+      self.populate()
+    return self._itemnames[name]
+
+  def _shift(self, index, count):
+    """
+    Shift the indexes of the entries at and after the index.
+    """
+    for r in self._itementries:
+      self._shiftrecord(r, index, count)
+
+  @staticmethod
+  def _shiftrecord(record, index, count):
+    i = record[1]
+    if type(i) is list:
+      record[1] = [n + count if n >= index else n for n in i]
+    elif i >= index:
+      record[1] = i + count
+
+  def _clear(self):
+    """
+    Remove the menu items added by `MenuSupport#items()`, and destroy the submenus of the cascades.
+    """
+    for t, index, submenu, key, origin in reversed(self._itementries):
+      if type(index) is list:
+        self.delete(index[0], index[-1])
+      else:
+        self.delete(index)
+      if submenu is not None:
+        submenu.destroy()
+    self._itementries = []
+    self._itemnames = {}
+    self._origins = 0
+
+  def lazy(self, items, cache=True):
+    """
+    Add the menu items when the menu is posted, by the `postcommand` option of the menu.
+
+    ```
+    def recent():
+      for f in history:
+        yield {"label": f, "name": "recent"}
+    menu.lazy(recent, cache=False)
+    ```
+
+    Parameters
+    ----
+    items: list(str or dict)|func
+      An array of menu items passed to `MenuSupport#items()`, or a function that returns or yields them.
+    cache: bool
+      If True, the items are added only when the menu is posted first.
+      If False, the items added before are removed and the items are added again each time the menu is posted.
+      The `postcommand` set to the menu before is kept, and it is called after the items are added.
+    """
+    if self._lazyitems is None:
+      self._postcommand = self.cget("postcommand") or None
+    self._lazyitems = items
+    self._lazycache = cache
+    self._populated = False
+    self.configure(postcommand=self._post)
+
+  def _post(self):
+    """
+    The `postcommand` of the lazy menu. The items are added, and the `postcommand` set before is called.
+    """
+    self.populate()
+    if callable(self._postcommand):
+      self._postcommand()
+    elif self._postcommand is not None:
+      # The postcommand of tkinter is read as the name of the Tcl command.
+      self.tk.eval(str(self._postcommand))
+
+  def populate(self):
+    """
+    Add the items of the lazy menu now, see `MenuSupport#lazy()`.
+    It is called when the menu is posted.
+    """
+    if self._lazyitems is None or (self._populated and self._lazycache):
+      return
+    if self._populated:
+      self._clear()
+    items = self._lazyitems
+    self.items(list(items() if callable(items) else items))
+    self._populated = True
+
+  def relabel(self, items):
+    """
+    Change the labels of the menu items added by `MenuSupport#items()`, such as when the language is changed.
+    The other options of the menu items, such as the commands and the variables, are not changed.
+    The entries are matched with the items by their positions among the items passed to `MenuSupport#items()`,
+    or by the names of the items, so the entries changed by `MenuSupport#insert_after()` and `MenuSupport#remove()`
+    are not confused. The items without entries are ignored.
+
+    Parameters
+    ----
+    items: list(str or dict)
+      The array of menu items passed to `MenuSupport#items()`, with the new labels.
+    """
+    if callable(items):
+      return
+    if self._lazyitems is not None and not callable(self._lazyitems):
+      # The items that have not been added yet are added with the new labels.
+      self._lazyitems = items
+    byorigin = {r[4]: r for r in self._itementries if r[4] is not None}
+    for k, item in enumerate(items):
+      record = byorigin.get(k)
+      if record is None and type(item) is dict and "name" in item:
+        record = self._itemnames.get(item["name"])
+      if record is None:
+        continue
+      t, index, submenu = record[:3]
+      if t == "radio":
+        for i, n in zip(item["items"], index):
+          self.entryconfigure(n, label=i["label"] if type(i) is dict else i)
+      elif t != "separator":
+        label = item if type(item) is str else item.get("label")
+        if label is not None:
+          self.entryconfigure(index, label=label)
+        if t == "cascade":
+          submenu.relabel(item["items"])
 
   def _callback(self, o, n):
     """
     Callbacks for various menus.
     """
     if not self.command is None:
-      self.command.tag.tag["item"] = n
+      tagdata = self.command.tag
+      if tagdata.tag is None:
+        # A menu without ::id or ::tag is not wrapped by `TkManager#add_widgets()`.
+        tagdata.tag = {"tag": None}
+      tagdata.tag["item"] = n
       self.command()
     elif not self.parent is None:
       self.parent._callback(o, n)
@@ -104,3 +427,17 @@ class Menu(tkinter.Menu, GeneratorSupport):
     Gets or sets an event handler that will be executed when the button is pressed.
     """
     self._command = value
+
+class Menu(tkinter.Menu, MenuSupport):
+  """
+  `tkinter.Menu` with added methods to support Generator.
+  """
+  def __init__(self, master=None, cnf={}, **kw):
+    """Construct menu widget with the parent MASTER.
+
+    Valid resource names: activebackground, activeborderwidth,
+    activeforeground, background, bd, bg, borderwidth, cursor,
+    disabledforeground, fg, font, foreground, postcommand, relief,
+    selectcolor, takefocus, tearoff, tearoffcommand, title, type."""
+    super().__init__(master=None, cnf=cnf, **kw)
+    self._setup(master, tkinter.Wm)
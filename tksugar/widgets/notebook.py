@@ -3,9 +3,98 @@ import tkinter.ttk
 
 from tksugar.widgets.generatorsupport import GeneratorSupport
 
-class Notebook(tkinter.ttk.Notebook, GeneratorSupport):
+class NotebookSupport(GeneratorSupport):
   """
-  `tkinter.ttk.Notebook` with added methods to support Generator.
+  The methods to support Generator that are added to a notebook class.
+  The class is combined with `tkinter.ttk.Notebook` or a class compatible with it.
+
+  In lazy mode, only the tab widget is created when the window is generated,
+  and the child elements of the tab are created when the tab is selected for the first time.
+  The lazy mode is enabled for all tabs with the `lazy` parameter of the Notebook,
+  or for each tab with the `/lazy` parameter of the tab.
   """
+  def _setup(self, lazy):
+    """
+    Initialize the fields and bind the event handlers.
+
+    Parameters
+    ----
+    lazy: bool
+      If True, the child elements of all tabs are created when the tab is selected for the first time.
+    """
+    self._lazy = lazy
+    self._lazytabs = {}
+    self._builders = {}
+    self.bind("<<NotebookTabChanged>>", self._tabchanged, add="+")
+
   def append_child(self, child, **params):
-    self.add(child, **params)
\ No newline at end of file
+    self._lazytabs[str(child)] = params.pop("lazy", self._lazy)
+    self.add(child, **params)
+
+  def configure_child(self, child, **params):
+    params.pop("lazy", None)
+    if params:
+      self.tab(child, **params)
+
+  def remove_child(self, child):
+    self._builders.pop(str(child), None)
+    self.forget(child)
+    child.destroy()
+
+  def defer_children(self, child, builder):
+    if not self._lazytabs.pop(str(child), False):
+      return False
+    self._builders[str(child)] = builder
+    return True
+
+  def materialize(self, tab=None):
+    """
+    Create the child elements of the tab whose creation has been deferred.
+
+    Parameters
+    ----
+    tab: tkinter.Widget|str
+      The tab widget or its name.
+      If omitted, the child elements of all tabs are created.
+    """
+    tabs = list(self._builders.keys()) if tab is None else [str(tab)]
+    for t in tabs:
+      builder = self._builders.pop(t, None)
+      if builder is not None:
+        builder()
+
+  @property
+  def pending(self):
+    """
+    Gets the names of the tabs whose child elements have not been created yet.
+    """
+    return list(self._builders.keys())
+
+  def _tabchanged(self, event):
+    """
+    Event handler for the <<NotebookTabChanged>> event.
+    """
+    if self._builders:
+      self.materialize(self.select())
+
+class Notebook(tkinter.ttk.Notebook, NotebookSupport):
+  """
+  `tkinter.ttk.Notebook` with added methods to support Generator.
+  See `NotebookSupport` for the lazy mode.
+  """
+  def __init__(self, master=None, lazy=False, **kw):
+    """Construct a Ttk Notebook with parent master.
+
+    STANDARD OPTIONS
+
+        class, cursor, style, takefocus
+
+    WIDGET-SPECIFIC OPTIONS
+
+        height, padding, width
+
+    lazy: bool
+      If True, the child elements of all tabs are created when the tab is selected for the first time.
+    """
+    super().__init__(master, **kw)
+    self._setup(lazy)